@@ -1 +1,27 @@
 # Gaia v0.8 — Cython-optimized modules.
+#
+# Kernels are compiled ahead of time by `python setup.py build_ext --inplace`
+# (every gaia/cy/*.pyx), so there is no compile step at import or first call.
+# Each consumer imports its kernel inside try/except and falls back to pure
+# Python when the extension is not built.
+
+import importlib
+
+# Extension modules shipped in this package, in build order
+KERNEL_MODULES: tuple = ("simulation_cy", "propagation_cy")
+
+
+def compiled_kernels() -> list:
+    """Return the names of the kernel modules that are built and importable.
+
+    Lets deployments check up front that no code path will fall back to
+    pure Python (e.g. assert compiled_kernels() == list(KERNEL_MODULES)).
+    """
+    available: list = []
+    for name in KERNEL_MODULES:
+        try:
+            importlib.import_module("gaia.cy." + name)
+        except ImportError:
+            continue
+        available.append(name)
+    return available
@@ -0,0 +1,41 @@
+# cython: language_level=3
+"""
+Gaia v0.8 — Shared C-level kernel declarations.
+
+Inline C functions for the curve and amplification math shared by the
+compiled modules. Any Cython module can use them without a Python call:
+
+    from gaia.cy.kernels cimport curve_kernel, amplify_capped
+
+Curves are described by the (kind, p1, p2, p3, p4) kernel_params tuples
+published by the gaia.damage and gaia.recovery factories. Caps and floors
+use fmin/fmax, which compile to branchless min/max instructions.
+"""
+
+from libc.math cimport exp, fmin, pow
+
+
+cdef inline double curve_kernel(
+    int kind, double p1, double p2, double p3, double p4, double x
+) nogil:
+    """Evaluate a damage/recovery curve from its kernel_params at x."""
+    cdef double raw
+    if kind == 0:
+        # Logistic: (inflection, raw_0, span, steepness), normalized
+        raw = 1.0 / (1.0 + exp(-p4 * (x - p1)))
+        return (raw - p2) / p3
+    elif kind == 1:
+        # Exponential: (scale, raw_1, base) -> (base^(x*scale) - 1) / raw_1
+        return (pow(p3, x * p1) - 1.0) / p2
+    elif kind == 3:
+        # Linear recovery: (slope) -> min(slope * x, 1.0)
+        return fmin(p1 * x, 1.0)
+    # Piecewise: (threshold, pre_slope, post_slope, pre_slope_ratio)
+    if x <= p1:
+        return p2 * x
+    return p4 + p3 * (x - p1)
+
+
+cdef inline double amplify_capped(double value, double factor) nogil:
+    """Trophic amplification: value * factor, capped at 1.0 (branchless)."""
+    return fmin(value * factor, 1.0)
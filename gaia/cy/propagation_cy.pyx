@@ -0,0 +1,110 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True
+# cython: language_level=3
+"""
+Gaia v0.8 — Cython-optimized interaction propagation.
+
+Drop-in replacement for propagation.propagate_interactions_indexed().
+Used by every pure-Python simulation path (pricing, marine substrates,
+restoration) — the extraction fast path in simulation_cy inlines its own
+propagation.
+
+Same semantics, arithmetic order and return value as the Python version,
+so results are bit-identical; only interpreter dispatch is removed.
+
+Usage from propagation.py:
+    try:
+        from gaia.cy.propagation_cy import propagate_indexed_cy
+        _HAS_CYTHON = True
+    except ImportError:
+        _HAS_CYTHON = False
+"""
+
+from libc.math cimport fmax, fmin
+
+
+def propagate_indexed_cy(
+    list agent_names,
+    list direct_damages,
+    list edge_src_idx,
+    list edge_tgt_idx,
+    list edge_strengths,
+    list keystone_edges,
+    list agent_keystone_thresholds,
+    bint recovery_mode=False,
+    double recovery_cascade_factor=0.5,
+    *,
+    list out_effective=None,
+    list out_cascade=None,
+    list out_keystones=None,
+):
+    """
+    Cython-optimized single-pass interaction propagation.
+
+    Returns:
+        Tuple of (effective_damages, cascade_damages, keystone_triggered),
+        as propagation.propagate_interactions_indexed().
+    """
+    cdef Py_ssize_t n_agents = len(direct_damages)
+    cdef Py_ssize_t n_edges = len(edge_src_idx)
+    cdef Py_ssize_t e, i, tgt_idx
+    cdef double value, strength
+    cdef list out_edges
+
+    cdef list effective, cascade, keystone_triggered
+    cdef list effective_strengths = edge_strengths
+
+    # Initialize effective damages as a copy of direct damages, reusing
+    # caller-provided buffers when given
+    if out_effective is None:
+        effective = list(direct_damages)
+    else:
+        out_effective[:] = direct_damages
+        effective = out_effective
+    if out_cascade is None:
+        cascade = [0.0] * n_agents
+    else:
+        # Slice assignment resizes a caller buffer of any length, as in the
+        # Python version; indexed writes would run past a short one
+        out_cascade[:] = [0.0] * n_agents
+        cascade = out_cascade
+    if out_keystones is None:
+        keystone_triggered = []
+    else:
+        del out_keystones[:]
+        keystone_triggered = out_keystones
+
+    # No edges: short-circuit
+    if n_edges == 0:
+        return (effective, cascade, keystone_triggered)
+
+    # Keystone pass: only keystone agents' outgoing edges are visited;
+    # strengths are copied only when a keystone triggers (copy-on-write)
+
+    for i, out_edges in keystone_edges:
+        if 1.0 - <double>direct_damages[i] < <double>agent_keystone_thresholds[i]:
+            keystone_triggered.append(agent_names[i])
+            if effective_strengths is edge_strengths:
+                effective_strengths = list(edge_strengths)
+            for e in out_edges:
+                effective_strengths[e] = fmin(<double>edge_strengths[e] * 2.0, 1.0)
+
+    # Recovery mode: scale all strengths once, outside the propagation loop
+    if recovery_mode:
+        effective_strengths = [
+            <double>s * recovery_cascade_factor for s in effective_strengths
+        ]
+
+    # Single fused pass: propagation and cascade tracking
+    for e in range(n_edges):
+        tgt_idx = <Py_ssize_t>edge_tgt_idx[e]
+        strength = <double>effective_strengths[e]
+        # Branchless cap at 1.0 and cascade floor at 0.0
+        value = fmin(
+            <double>effective[tgt_idx]
+            + <double>direct_damages[<Py_ssize_t>edge_src_idx[e]] * strength,
+            1.0,
+        )
+        effective[tgt_idx] = value
+        cascade[tgt_idx] = fmax(value - <double>direct_damages[tgt_idx], 0.0)
+
+    return (effective, cascade, keystone_triggered)
@@ -19,19 +19,37 @@ Performance profile of the pure-Python version (Amazon, 80K steps):
 This module eliminates the function call overhead by:
     1. Pre-computing all indices (int arrays, not string dicts)
     2. Inlining trophic amplification (no function call per agent)
-    3. Inlining interaction propagation (no per-step dict rebuild)
-    4. Using C-level math (libc.math.exp instead of Python math.exp)
+    3. Inlining interaction propagation over typed memoryviews, with an
+       outgoing-edge CSR for the keystone pass (O(E) rather than O(K·E))
+    4. Using C-level math (libc.math.exp instead of Python math.exp), with
+       damage curves evaluated by kernels.curve_kernel from kernel_params
     5. Using typed memoryviews / C arrays for hot-path data
+    6. Writing rows straight into SimulationTrace columns (no per-step
+       tuple or SimulationStep allocation); scalar columns are written as
+       C doubles through memoryviews
+
+restoration_loop_cy() is the matching loop for simulation.run_restoration()
+when every recovery function publishes kernel_params.
+
+step_costs_cy() is the Phase 3 kernel (per-agent costs / service values,
+their total and the weighted health sum) for the loops that stay in Python:
+pricing, marine-substrate extraction and restoration with custom or
+tabulated recovery curves.
 
 Usage from simulation.py:
     try:
-        from gaia.cy.simulation_cy import extraction_loop_cy
+        from gaia.cy.simulation_cy import (
+            extraction_loop_cy, restoration_loop_cy, step_costs_cy,
+        )
         _HAS_CYTHON = True
     except ImportError:
         _HAS_CYTHON = False
 """
 
-from libc.math cimport exp, pow
+from cpython cimport array
+from libc.math cimport exp, fmax, fmin, pow
+
+from gaia.cy.kernels cimport amplify_capped, curve_kernel
 
 
 def extraction_loop_cy(
@@ -52,9 +70,14 @@ def extraction_loop_cy(
     list edge_src_idx,        # int index of source agent
     list edge_tgt_idx,        # int index of target agent
     list edge_strengths,      # float strength [0, 1]
+    # Outgoing-edge CSR (see propagation.build_edge_csr):
+    list edge_out_indptr,     # row offsets per agent (length n_agents + 1)
+    list edge_out_idx,        # edge indices grouped by source agent
     # Feature flags:
     bint has_trophic,
     bint has_interactions,
+    bint has_keystones,
+    bint persist_breakdown,   # False: direct/cascade kept for the final step only
     bint has_resilience,
     bint has_substrate,
     # Resilience config (only used if has_resilience):
@@ -73,38 +96,36 @@ def extraction_loop_cy(
     double substrate_residual_fraction,
     str substrate_capacity_function,
     double substrate_t_ha_to_mm_factor,
+    # Output (preallocated SimulationTrace, length units_to_extract):
+    object trace,
+    list agent_names,         # agent name per index, for keystone_triggered
 ):
     """
     Cython-optimized extraction simulation inner loop.
 
     Computes all N steps of the extraction simulation with C-typed
-    variables, returning a list of tuples containing the per-step data.
-    The caller (simulation.py) converts these tuples into SimulationStep
-    dataclasses.
+    variables, writing each step's values into row ``step - 1`` of the
+    preallocated SimulationTrace columns. No per-step Python objects are
+    created beyond the per-agent lists the step itself owns.
 
     Returns:
-        List of tuples, one per step:
-        (step, units_extracted, depletion_ratio,
-         effective_damages, agent_costs, marginal_cost, cumulative_cost,
-         private_revenue, ecosystem_health,
-         direct_damages, cascade_damages, keystone_triggered,
-         zone, confidence, irreversibility_warning,
-         substrate_erosion, effective_k, k_fraction)
+        None. Results are written into ``trace`` in place.
     """
     # C-level declarations for the hot loop
     cdef int step, i, e, src_idx, tgt_idx
     cdef int units_extracted
-    cdef double depletion_ratio, raw_damage, amplified
+    cdef double depletion_ratio, raw_damage
     cdef double amplification_factor
-    cdef double step_total_cost, health_sum, marginal_cost, ecosystem_health
-    cdef double private_revenue, cost, rate
+    cdef double step_total_cost = 0.0, health_sum = 0.0
+    cdef double marginal_cost, ecosystem_health
+    cdef double private_revenue, cost
     cdef double previous_total_cost = 0.0
-    cdef double agent_health, doubled, additional, source_damage
+    cdef double agent_health, additional, source_damage
     cdef double bare_fraction, exposure, effective_erosion, erosion_amount
     cdef double erosion_mm, erosion_cm
     cdef double remaining_frac, threshold_lower, threshold_upper
     cdef double zone_position, conf
-    cdef double weight
+    cdef double weighted
 
     # Resilience zone variables (must be at function scope for Cython)
     cdef str zone
@@ -121,41 +142,43 @@ def extraction_loop_cy(
 
     # Capacity variables
     cdef double current_depth, pristine_depth, critical, residual, frac
+    cdef double inflection, raw_0, raw_1, span, steepness
 
     if has_substrate and units_to_extract > 0:
         time_per_step = 1.0 / <double>units_to_extract
 
     # Pre-extract damage function parameters into C arrays
-    # Each damage function is represented as (kind, p1, p2, p3):
-    #   logistic:    (0, inflection, raw_0, span, steepness)  -> we use 5 params
+    # Each damage function is represented as (kind, p1, p2, p3, p4):
+    #   logistic:    (0, inflection, raw_0, span, steepness)
     #   exponential: (1, scale, raw_1, base, 0)
     #   piecewise:   (2, threshold, pre_slope, post_slope, pre_slope_ratio)
-    cdef int n_dmg = n_agents
-    cdef list dmg_kind = [0] * n_dmg
-    cdef list dmg_p1 = [0.0] * n_dmg
-    cdef list dmg_p2 = [0.0] * n_dmg
-    cdef list dmg_p3 = [0.0] * n_dmg
-    cdef list dmg_p4 = [0.0] * n_dmg
-
-    for i in range(n_dmg):
-        params = damage_params[i]
-        dmg_kind[i] = <int>params[0]
-        dmg_p1[i] = <double>params[1]
-        dmg_p2[i] = <double>params[2]
-        dmg_p3[i] = <double>params[3]
-        dmg_p4[i] = <double>params[4]
+    cdef int[:] dmg_kind = array.array('i', [<int>p[0] for p in damage_params])
+    cdef double[:] dmg_p1 = array.array('d', [<double>p[1] for p in damage_params])
+    cdef double[:] dmg_p2 = array.array('d', [<double>p[2] for p in damage_params])
+    cdef double[:] dmg_p3 = array.array('d', [<double>p[3] for p in damage_params])
+    cdef double[:] dmg_p4 = array.array('d', [<double>p[4] for p in damage_params])
 
     # Pre-extract per-agent arrays to C-level
-    cdef list c_dep_weights = [<double>dep_weights[i] for i in range(n_agents)]
-    cdef list c_mon_rates = [<double>monetary_rates[i] for i in range(n_agents)]
+    cdef double[:] c_dep_weights = array.array('d', dep_weights)
+    cdef double[:] c_mon_rates = array.array('d', monetary_rates)
     cdef list c_trophic = [<int>trophic_levels[i] for i in range(n_agents)]
-    cdef list c_is_keystone = [<bint>is_keystone[i] for i in range(n_agents)]
-    cdef list c_ks_thresholds = [<double>keystone_thresholds[i] for i in range(n_agents)]
-
-    # Pre-extract per-edge arrays
-    cdef list c_edge_src = [<int>edge_src_idx[i] for i in range(n_edges)]
-    cdef list c_edge_tgt = [<int>edge_tgt_idx[i] for i in range(n_edges)]
-    cdef list c_edge_str = [<double>edge_strengths[i] for i in range(n_edges)]
+    cdef int[:] c_is_keystone = array.array('i', [1 if flag else 0 for flag in is_keystone])
+    cdef double[:] c_ks_thresholds = array.array('d', keystone_thresholds)
+
+    # Pre-extract per-edge arrays into typed memoryviews, plus the
+    # outgoing-edge CSR so the keystone pass is O(out-degree) per keystone
+    cdef int[:] c_edge_src = array.array('i', edge_src_idx)
+    cdef int[:] c_edge_tgt = array.array('i', edge_tgt_idx)
+    cdef double[:] c_edge_str = array.array('d', edge_strengths)
+    cdef int[:] c_out_indptr = array.array('i', edge_out_indptr)
+    cdef int[:] c_out_idx = array.array('i', edge_out_idx)
+
+    # Per-step propagation scratch buffers (allocated once)
+    cdef double[:] c_direct = array.array('d', [0.0] * n_agents)
+    cdef double[:] c_effective = array.array('d', [0.0] * n_agents)
+    cdef double[:] c_strength = array.array('d', edge_strengths)
+    cdef double[:] c_use_str
+    cdef int k
 
     # Transfer efficiency constant for trophic amplification
     cdef double transfer_eff = 0.15
@@ -166,8 +189,25 @@ def extraction_loop_cy(
         if c_trophic[i] >= 1:
             trophic_amp[i] = pow(1.0 / transfer_eff, <double>c_trophic[i] * 0.25)
 
-    # Output accumulator
-    cdef list result_steps = []
+    # Output accumulator: scalar columns are typed buffers (array('d') /
+    # array('q')) written through memoryviews; per-agent rows stay lists
+    cdef int row
+    cdef double[:] col_depletion = trace.depletion_ratio
+    cdef list col_damages = trace.agent_damages
+    cdef list col_costs = trace.agent_costs
+    cdef double[:] col_marginal = trace.marginal_cost
+    cdef double[:] col_cumulative = trace.cumulative_cost
+    cdef double[:] col_revenue = trace.private_revenue
+    cdef double[:] col_health = trace.ecosystem_health
+    cdef list col_direct = trace.agent_direct_damages
+    cdef list col_cascade = trace.agent_cascade_damages
+    cdef list col_keystone = trace.keystone_triggered
+    cdef list col_zone = trace.resilience_zone
+    cdef double[:] col_confidence = trace.model_confidence
+    cdef list col_irreversibility = trace.irreversibility_warning
+    cdef double[:] col_erosion = trace.substrate_erosion
+    cdef long long[:] col_effective_k = trace.effective_k
+    cdef double[:] col_k_fraction = trace.k_fraction
 
     # Reusable per-step arrays (allocated once, reused each iteration)
     cdef list direct_damages
@@ -175,114 +215,93 @@ def extraction_loop_cy(
     cdef list cascade_damages
     cdef list agent_costs
     cdef list keystone_triggered
-    cdef list eff_strengths
-
-    # Damage function variables
-    cdef double inflection, raw_0, span, steepness
-    cdef double scale, raw_1, base_val
-    cdef double threshold_pw, pre_slope, post_slope, pre_slope_ratio
 
     for step in range(1, units_to_extract + 1):
         units_extracted = step
         depletion_ratio = <double>units_extracted / <double>total_units
 
         # ── Phase 1: Direct damage with trophic amplification ──────────
+        # Without interactions, direct damage is final, so cost and health
+        # are accumulated in the same pass (damage → cost → health fused).
         direct_damages = [0.0] * n_agents
+        if not has_interactions:
+            agent_costs = [0.0] * n_agents
+            step_total_cost = 0.0
+            health_sum = 0.0
         for i in range(n_agents):
-            # Inline damage function evaluation
-            if dmg_kind[i] == 0:
-                # Logistic: 1/(1+exp(-steepness*(x-inflection))), normalized
-                inflection = dmg_p1[i]
-                raw_0 = dmg_p2[i]
-                span = dmg_p3[i]
-                steepness = dmg_p4[i]
-                raw_damage = 1.0 / (1.0 + exp(-steepness * (depletion_ratio - inflection)))
-                raw_damage = (raw_damage - raw_0) / span
-            elif dmg_kind[i] == 1:
-                # Exponential: (base^(x*scale) - 1) / (base^scale - 1)
-                scale = dmg_p1[i]
-                raw_1 = dmg_p2[i]
-                base_val = dmg_p3[i]
-                raw_damage = (pow(base_val, depletion_ratio * scale) - 1.0) / raw_1
-            else:
-                # Piecewise: two linear segments
-                threshold_pw = dmg_p1[i]
-                pre_slope = dmg_p2[i]
-                post_slope = dmg_p3[i]
-                pre_slope_ratio = dmg_p4[i]
-                if depletion_ratio <= threshold_pw:
-                    raw_damage = pre_slope * depletion_ratio
-                else:
-                    raw_damage = pre_slope_ratio + post_slope * (depletion_ratio - threshold_pw)
+            # C-level damage evaluation (no Python call)
+            raw_damage = curve_kernel(
+                dmg_kind[i], dmg_p1[i], dmg_p2[i], dmg_p3[i], dmg_p4[i],
+                depletion_ratio,
+            )
 
             # Inline trophic amplification
             if has_trophic and c_trophic[i] >= 1:
-                amplified = raw_damage * trophic_amp[i]
-                if amplified > 1.0:
-                    amplified = 1.0
-                direct_damages[i] = amplified
-            else:
-                direct_damages[i] = raw_damage
+                raw_damage = amplify_capped(raw_damage, trophic_amp[i])
+            direct_damages[i] = raw_damage
+            c_direct[i] = raw_damage
+
+            if not has_interactions:
+                weighted = raw_damage * c_dep_weights[i]
+                cost = weighted * c_mon_rates[i]
+                agent_costs[i] = cost
+                step_total_cost = step_total_cost + cost
+                health_sum = health_sum + weighted
 
         # ── Phase 2: Interaction propagation (inlined) ─────────────────
         if has_interactions:
-            effective_damages = list(direct_damages)
-            cascade_damages = [0.0] * n_agents
             keystone_triggered = []
-
-            # Compute effective edge strengths with keystone doubling
-            eff_strengths = list(c_edge_str)
             for i in range(n_agents):
-                if c_is_keystone[i]:
-                    agent_health = 1.0 - direct_damages[i]
-                    if agent_health < c_ks_thresholds[i]:
-                        keystone_triggered.append(i)
-                        for e in range(n_edges):
-                            if c_edge_src[e] == i:
-                                doubled = c_edge_str[e] * 2.0
-                                if doubled > 1.0:
-                                    doubled = 1.0
-                                eff_strengths[e] = doubled
-
-            # Single-pass propagation
+                c_effective[i] = c_direct[i]
+
+            # Compute effective edge strengths with keystone doubling;
+            # without keystone agents the base strengths are used as-is
+            if has_keystones:
+                c_strength[:] = c_edge_str
+                for i in range(n_agents):
+                    if c_is_keystone[i]:
+                        agent_health = 1.0 - c_direct[i]
+                        if agent_health < c_ks_thresholds[i]:
+                            keystone_triggered.append(agent_names[i])
+                            for k in range(c_out_indptr[i], c_out_indptr[i + 1]):
+                                e = c_out_idx[k]
+                                c_strength[e] = fmin(c_edge_str[e] * 2.0, 1.0)
+                c_use_str = c_strength
+            else:
+                c_use_str = c_edge_str
+
+            # Single-pass propagation over C buffers
             for e in range(n_edges):
-                src_idx = c_edge_src[e]
                 tgt_idx = c_edge_tgt[e]
-                source_damage = direct_damages[src_idx]
-                additional = source_damage * <double>eff_strengths[e]
-                effective_damages[tgt_idx] = effective_damages[tgt_idx] + additional
-                if effective_damages[tgt_idx] > 1.0:
-                    effective_damages[tgt_idx] = 1.0
+                additional = c_direct[c_edge_src[e]] * c_use_str[e]
+                c_effective[tgt_idx] = fmin(c_effective[tgt_idx] + additional, 1.0)
 
-            # Recompute cascade
+            # Materialize effective and cascade (branchless floor at 0.0)
+            effective_damages = [0.0] * n_agents
+            cascade_damages = [0.0] * n_agents
             for i in range(n_agents):
-                cascade_damages[i] = effective_damages[i] - direct_damages[i]
-                if cascade_damages[i] < 0.0:
-                    cascade_damages[i] = 0.0
+                effective_damages[i] = c_effective[i]
+                cascade_damages[i] = fmax(c_effective[i] - c_direct[i], 0.0)
         else:
             effective_damages = list(direct_damages)
             cascade_damages = [0.0] * n_agents
             keystone_triggered = []
 
-        # ── Phase 3: Cost computation ──────────────────────────────────
-        agent_costs = [0.0] * n_agents
-        step_total_cost = 0.0
-        health_sum = 0.0
+        # ── Phase 3: Cost computation (fused into Phase 1 if no edges) ──
+        if has_interactions:
+            agent_costs = [0.0] * n_agents
+            step_total_cost = 0.0
+            health_sum = 0.0
 
-        for i in range(n_agents):
-            rate = c_mon_rates[i]
-            weight = c_dep_weights[i]
-            cost = effective_damages[i] * weight * rate
-            agent_costs[i] = cost
-            step_total_cost = step_total_cost + cost
-            health_sum = health_sum + weight * effective_damages[i]
+            for i in range(n_agents):
+                weighted = c_effective[i] * c_dep_weights[i]
+                cost = weighted * c_mon_rates[i]
+                agent_costs[i] = cost
+                step_total_cost = step_total_cost + cost
+                health_sum = health_sum + weighted
 
         marginal_cost = step_total_cost - previous_total_cost
-        ecosystem_health = 1.0 - health_sum
-        if ecosystem_health < 0.0:
-            ecosystem_health = 0.0
-        elif ecosystem_health > 1.0:
-            ecosystem_health = 1.0
+        ecosystem_health = fmin(fmax(1.0 - health_sum, 0.0), 1.0)
 
         private_revenue = <double>units_extracted * unit_value
 
@@ -292,15 +311,12 @@ def extraction_loop_cy(
         step_k_fraction = 1.0
 
         if has_substrate:
-            vegetation_cover = (<double>total_units - <double>units_extracted) / <double>total_units
-            if vegetation_cover < 0.0:
-                vegetation_cover = 0.0
-            elif vegetation_cover > 1.0:
-                vegetation_cover = 1.0
-
-            bare_fraction = 1.0 - vegetation_cover
-            if bare_fraction < 0.0:
-                bare_fraction = 0.0
+            # Branchless clamps (fmin/fmax) throughout the substrate block
+            vegetation_cover = fmin(fmax(
+                (<double>total_units - <double>units_extracted) / <double>total_units,
+                0.0), 1.0)
+
+            bare_fraction = fmax(1.0 - vegetation_cover, 0.0)
             exposure = pow(bare_fraction, substrate_erosion_alpha)
             effective_erosion = (
                 substrate_erosion_protected
@@ -309,9 +325,7 @@ def extraction_loop_cy(
             erosion_amount = effective_erosion * time_per_step
             erosion_mm = erosion_amount * substrate_t_ha_to_mm_factor
             erosion_cm = erosion_mm / 10.0
-            current_soil_depth = current_soil_depth - erosion_cm
-            if current_soil_depth < 0.0:
-                current_soil_depth = 0.0
+            current_soil_depth = fmax(current_soil_depth - erosion_cm, 0.0)
             step_substrate_erosion = erosion_cm
 
             # Inline capacity fraction computation
@@ -358,10 +372,7 @@ def extraction_loop_cy(
                 else:
                     step_k_fraction = current_soil_depth / pristine_soil_depth
 
-            if step_k_fraction < 0.0:
-                step_k_fraction = 0.0
-            elif step_k_fraction > 1.0:
-                step_k_fraction = 1.0
+            step_k_fraction = fmin(fmax(step_k_fraction, 0.0), 1.0)
 
             step_effective_k = <int>(<double>total_units * step_k_fraction)
 
@@ -392,9 +403,9 @@ def extraction_loop_cy(
                 zone = "red"
                 # Linearly interpolate from yellow to red based on how far past threshold
                 if threshold_lower > 0.0:
-                    zone_position = (threshold_lower - remaining_frac) / threshold_lower
-                    if zone_position > 1.0:
-                        zone_position = 1.0
+                    zone_position = fmin(
+                        (threshold_lower - remaining_frac) / threshold_lower, 1.0
+                    )
                     confidence = resilience_conf_yellow - zone_position * (resilience_conf_yellow - resilience_conf_red)
                 else:
                     confidence = resilience_conf_red
@@ -403,28 +414,196 @@ def extraction_loop_cy(
             irreversibility = depletion_ratio > resilience_irreversibility_ratio
 
         # ── Record step ────────────────────────────────────────────────
-        # Convert keystone_triggered from indices back to be handled by caller
-        result_steps.append((
-            step,
-            units_extracted,
-            depletion_ratio,
-            effective_damages,
-            agent_costs,
-            marginal_cost,
-            step_total_cost,
-            private_revenue,
-            ecosystem_health,
-            direct_damages,
-            cascade_damages,
-            keystone_triggered,  # list of int indices
-            zone,
-            confidence,
-            irreversibility,
-            step_substrate_erosion,
-            step_effective_k,
-            step_k_fraction,
-        ))
+        row = step - 1
+        col_depletion[row] = depletion_ratio
+        col_damages[row] = effective_damages
+        col_costs[row] = agent_costs
+        col_marginal[row] = marginal_cost
+        col_cumulative[row] = step_total_cost
+        col_revenue[row] = private_revenue
+        col_health[row] = ecosystem_health
+        if persist_breakdown or step == units_to_extract:
+            col_direct[row] = direct_damages
+            col_cascade[row] = cascade_damages
+        col_keystone[row] = keystone_triggered
+        col_zone[row] = zone
+        col_confidence[row] = confidence
+        col_irreversibility[row] = irreversibility
+        col_erosion[row] = step_substrate_erosion
+        col_effective_k[row] = step_effective_k
+        col_k_fraction[row] = step_k_fraction
 
         previous_total_cost = step_total_cost
 
-    return result_steps
+
+def step_costs_cy(list values, list weights, list rates):
+    """
+    Cython-optimized Phase 3 kernel for the pure-Python simulation loops.
+
+    Drop-in replacement for simulation._step_costs(): same products (the
+    weighted value feeds both the agent value and the health sum) and
+    left-to-right sums, so results are bit-identical.
+
+    Returns:
+        Tuple of (agent_values, total, weighted_sum).
+    """
+    cdef Py_ssize_t i
+    cdef Py_ssize_t n = len(values)
+    cdef double weighted, agent_value
+    cdef double total = 0.0
+    cdef double weighted_sum = 0.0
+    cdef list agent_values = [0.0] * n
+
+    for i in range(n):
+        weighted = <double>values[i] * <double>weights[i]
+        agent_value = weighted * <double>rates[i]
+        agent_values[i] = agent_value
+        total += agent_value
+        weighted_sum += weighted
+
+    return (agent_values, total, weighted_sum)
+
+
+def restoration_loop_cy(
+    int n_agents,
+    int n_edges,
+    int units_to_restore,
+    # Per-agent flat arrays (length n_agents):
+    list recovery_params,     # kernel_params (kind, p1, p2, p3, p4) per agent
+    list trophic_amps,        # amplification factor per agent, or None
+    list dep_weights,         # dependency_weight per agent
+    list monetary_rates,      # monetary_rate per agent
+    list keystone_thresholds, # float per agent
+    list is_keystone,         # bool per agent
+    # Per-edge flat arrays (length n_edges):
+    list edge_src_idx,
+    list edge_tgt_idx,
+    list edge_strengths,
+    # Outgoing-edge CSR (see propagation.build_edge_csr):
+    list edge_out_indptr,
+    list edge_out_idx,
+    bint has_keystones,
+    double recovery_cascade_factor,
+    # Output (preallocated RestorationTrace, length units_to_restore):
+    object trace,
+):
+    """
+    Cython-optimized restoration simulation inner loop.
+
+    Computes Phases 1-3 of every restoration step (direct recovery with
+    trophic amplification, recovery-mode propagation, service values and
+    health) and writes row ``step - 1`` of the per-agent and cumulative
+    columns of the preallocated RestorationTrace. The index-only columns
+    (recovery ratio, cost so far) and the marginal column are filled by
+    the caller. Same arithmetic order as simulation.run_restoration(), so
+    results are bit-identical.
+
+    Returns:
+        None. Results are written into ``trace`` in place.
+    """
+    cdef int step, i, e, k, row, tgt_idx
+    cdef double recovery_ratio, value, weighted, service_value
+    cdef double step_total_service, health_sum
+    cdef bint has_interactions = n_edges > 0
+
+    # Recovery curves as C arrays
+    cdef int[:] rec_kind = array.array('i', [<int>p[0] for p in recovery_params])
+    cdef double[:] rec_p1 = array.array('d', [<double>p[1] for p in recovery_params])
+    cdef double[:] rec_p2 = array.array('d', [<double>p[2] for p in recovery_params])
+    cdef double[:] rec_p3 = array.array('d', [<double>p[3] for p in recovery_params])
+    cdef double[:] rec_p4 = array.array('d', [<double>p[4] for p in recovery_params])
+
+    # Trophic amplification: factor per agent, with a flag for agents
+    # that are not amplified
+    cdef int[:] c_amplified = array.array(
+        'i', [0 if amp is None else 1 for amp in trophic_amps]
+    )
+    cdef double[:] c_amp = array.array(
+        'd', [1.0 if amp is None else amp for amp in trophic_amps]
+    )
+
+    cdef double[:] c_dep_weights = array.array('d', dep_weights)
+    cdef double[:] c_mon_rates = array.array('d', monetary_rates)
+    cdef int[:] c_is_keystone = array.array('i', [1 if flag else 0 for flag in is_keystone])
+    cdef double[:] c_ks_thresholds = array.array('d', keystone_thresholds)
+
+    # Edge arrays; recovery-mode strengths are scaled once, up front, and
+    # only keystone-doubled edges are rescaled per step
+    cdef int[:] c_edge_src = array.array('i', edge_src_idx)
+    cdef int[:] c_edge_tgt = array.array('i', edge_tgt_idx)
+    cdef double[:] c_edge_str = array.array('d', edge_strengths)
+    cdef double[:] c_scaled_str = array.array(
+        'd', [<double>s * recovery_cascade_factor for s in edge_strengths]
+    )
+    cdef double[:] c_strength = array.array(
+        'd', [<double>s * recovery_cascade_factor for s in edge_strengths]
+    )
+    cdef double[:] c_use_str = c_scaled_str
+    cdef int[:] c_out_indptr = array.array('i', edge_out_indptr)
+    cdef int[:] c_out_idx = array.array('i', edge_out_idx)
+
+    # Per-step scratch buffers (allocated once)
+    cdef double[:] c_direct = array.array('d', [0.0] * n_agents)
+    cdef double[:] c_effective = array.array('d', [0.0] * n_agents)
+
+    cdef list col_recoveries = trace.agent_recoveries
+    cdef list col_service_values = trace.agent_service_values
+    cdef double[:] col_cumulative = trace.cumulative_service_value
+    cdef double[:] col_health = trace.ecosystem_health
+
+    cdef list effective_recoveries
+    cdef list agent_service_values
+
+    for step in range(1, units_to_restore + 1):
+        recovery_ratio = <double>step / <double>units_to_restore
+
+        # ── Phase 1: Direct recovery with trophic amplification ────────
+        for i in range(n_agents):
+            value = curve_kernel(
+                rec_kind[i], rec_p1[i], rec_p2[i], rec_p3[i], rec_p4[i],
+                recovery_ratio,
+            )
+            if c_amplified[i]:
+                value = amplify_capped(value, c_amp[i])
+            c_direct[i] = value
+            c_effective[i] = value
+
+        # ── Phase 2: Recovery-mode propagation (inlined) ───────────────
+        if has_interactions:
+            if has_keystones:
+                c_strength[:] = c_scaled_str
+                for i in range(n_agents):
+                    if c_is_keystone[i] and 1.0 - c_direct[i] < c_ks_thresholds[i]:
+                        for k in range(c_out_indptr[i], c_out_indptr[i + 1]):
+                            e = c_out_idx[k]
+                            c_strength[e] = (
+                                fmin(c_edge_str[e] * 2.0, 1.0) * recovery_cascade_factor
+                            )
+                c_use_str = c_strength
+
+            for e in range(n_edges):
+                tgt_idx = c_edge_tgt[e]
+                c_effective[tgt_idx] = fmin(
+                    c_effective[tgt_idx] + c_direct[c_edge_src[e]] * c_use_str[e],
+                    1.0,
+                )
+
+        # ── Phase 3: Service values and health ─────────────────────────
+        effective_recoveries = [0.0] * n_agents
+        agent_service_values = [0.0] * n_agents
+        step_total_service = 0.0
+        health_sum = 0.0
+        for i in range(n_agents):
+            effective_recoveries[i] = c_effective[i]
+            weighted = c_effective[i] * c_dep_weights[i]
+            service_value = weighted * c_mon_rates[i]
+            agent_service_values[i] = service_value
+            step_total_service = step_total_service + service_value
+            health_sum = health_sum + weighted
+
+        # ── Record step ────────────────────────────────────────────────
+        row = step - 1
+        col_recoveries[row] = effective_recoveries
+        col_service_values[row] = agent_service_values
+        col_cumulative[row] = step_total_service
+        col_health[row] = fmin(fmax(health_sum, 0.0), 1.0)
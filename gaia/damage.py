@@ -12,6 +12,14 @@ Scientific invariants that every damage function must satisfy:
     5. Convexity past threshold: second finite difference is positive post-threshold
 
 All functions are float -> float in the hot path — Cython-compatible.
+
+v0.8: Each factory also attaches its pre-computed constants to the returned
+function as ``kernel_params = (kind, p1, p2, p3, p4)``. The compiled
+extraction kernel reads these and evaluates the curve in C, so the damage
+function is never called through Python on the fast path:
+    0 = logistic:    (inflection, raw_0, span, steepness)
+    1 = exponential: (scale, raw_1, base, 0.0)
+    2 = piecewise:   (threshold, pre_slope, post_slope, pre_slope_ratio)
 """
 
 import math
@@ -69,6 +77,7 @@ def logistic_damage(threshold: float, steepness: float = 12.0) -> DamageFunc:
         raw: float = 1.0 / (1.0 + math.exp(-steepness * (depletion_ratio - inflection)))
         return (raw - raw_0) / span
 
+    _logistic.kernel_params = (0, inflection, raw_0, span, steepness)
     return _logistic
 
 
@@ -108,6 +117,7 @@ def exponential_damage(threshold: float, base: float = 2.0) -> DamageFunc:
         raw: float = (base ** (depletion_ratio * scale)) - 1.0
         return raw / raw_1
 
+    _exponential.kernel_params = (1, scale, raw_1, base, 0.0)
     return _exponential
 
 
@@ -163,4 +173,5 @@ def piecewise_damage(threshold: float, pre_slope_ratio: float = None) -> DamageF
         else:
             return pre_slope_ratio + post_slope * (depletion_ratio - threshold)
 
+    _piecewise.kernel_params = (2, threshold, pre_slope, post_slope, pre_slope_ratio)
     return _piecewise
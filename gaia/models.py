@@ -18,14 +18,40 @@ v0.6 additions: DiscountConfig, ExtractionNPV, RestorationNPV, CarbonBreakeven,
                 SimulationStep + discount fields; RestorationResult + NPV
 v0.7 additions: ScarcityFunction, AnchorPoint, PricingConfig, PriceResult;
                 Ecosystem + pricing; SimulationStep + price fields
+v0.8 additions: SimulationTrace, RestorationTrace (columnar step storage with lazy
+                step views);
+                InteractionType codes + interned InteractionEdge.interaction_type;
+                __slots__ on step records, configs, Agent and InteractionEdge;
+                Ecosystem.name_to_idx / edge_index / edge_csr / edge_strengths /
+                has_keystones / agent_columns (AgentColumns), built on first access
+                and dropped when agents or interactions change (clear_derived()
+                after in-place edits);
+                Ecosystem.trace_precision (reduced-precision per-agent trace rows);
+                Ecosystem.persist_cascade_breakdown (final-step-only breakdown);
+                Ecosystem.damage_memo (Phase 1 damage columns reused across runs)
 """
 
+import sys
+from array import array
 from dataclasses import dataclass, field
+from enum import IntEnum
 from typing import Callable, List, Optional, Tuple, Union
 
 # Type alias for damage functions: depletion_ratio -> damage_ratio
 DamageFunc = Callable[[float], float]
 
+# v0.8: Slotted dataclasses (no per-instance __dict__) for high-volume records.
+# dataclass(slots=True) needs Python 3.10+; on 3.9 the classes keep a __dict__.
+_SLOTS: dict = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+def _filled(typecode: str, value, n: int) -> array:
+    """A preallocated typed trace column of n copies of value (v0.8)."""
+    return array(typecode, (value,)) * n
+
+
+# v0.8: Ecosystem.trace_precision → array typecode for packed per-agent trace rows
+_TRACE_TYPECODES: dict = {"float64": "d", "float32": "f"}
+
 
 # ── v0.5: Physical Substrate models ───────────────────────────────────────────
 
@@ -364,7 +390,7 @@ class PriceResult:
 # ── v0.4: Succession, Carbon & Resilience models ──────────────────────────────
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SuccessionCurve:
     """Three-phase succession maturation curve.
 
@@ -389,7 +415,7 @@ class SuccessionCurve:
     maturation_delay: float
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CarbonProfile:
     """Carbon accounting parameters for a resource unit.
 
@@ -408,7 +434,7 @@ class CarbonProfile:
     carbon_price_per_tonne: float
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ResilienceConfig:
     """Resilience zone configuration for uncertainty flagging.
 
@@ -432,7 +458,7 @@ class ResilienceConfig:
     irreversibility_flag_ratio: float = 0.50
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MaturationStep:
     """One year of the maturation timeline.
 
@@ -457,7 +483,7 @@ class MaturationStep:
     cumulative_carbon_absorbed: float
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class RestorationConfig:
     """Configuration for time-aware restoration simulation.
 
@@ -518,7 +544,7 @@ class Resource:
         return int(self.total_units * self.safe_threshold_ratio)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Agent:
     """
     An entity that depends on the resource and suffers when it is depleted.
@@ -550,7 +576,20 @@ class Agent:
     succession_curve: Optional[SuccessionCurve] = None
 
 
-@dataclass
+class InteractionType(IntEnum):
+    """Integer codes for InteractionEdge.interaction_type (v0.8)."""
+
+    DEPENDENCY = 0
+    TROPHIC = 1
+    KEYSTONE = 2
+    COMPETITION = 3
+
+
+# interaction_type string → InteractionType code
+_INTERACTION_TYPE_CODES: dict = {t.name.lower(): t for t in InteractionType}
+
+
+@dataclass(**_SLOTS)
 class InteractionEdge:
     """
     A directed dependency between two agents.
@@ -563,7 +602,11 @@ class InteractionEdge:
         strength: How much of source's damage transfers to target (0.0 to 1.0).
         interaction_type: Category of interaction — one of:
             "dependency", "trophic", "keystone", "competition".
+            Interned at construction so equal types share one string object.
         description: Human-readable explanation of the interaction.
+
+    Derived:
+        type_code: InteractionType for interaction_type (None if unrecognised).
     """
 
     source: str
@@ -572,6 +615,44 @@ class InteractionEdge:
     interaction_type: str
     description: str
 
+    def __post_init__(self) -> None:
+        if type(self.interaction_type) is str:
+            self.interaction_type = sys.intern(self.interaction_type)
+
+    @property
+    def type_code(self) -> Optional[InteractionType]:
+        """Integer code of interaction_type, for numeric dispatch."""
+        return _INTERACTION_TYPE_CODES.get(self.interaction_type)
+
+
+@dataclass(**_SLOTS)
+class AgentColumns:
+    """
+    Structure-of-arrays projection of Ecosystem.agents (v0.8).
+
+    One list per Agent field read by the simulation loops, index-aligned with
+    Ecosystem.agents, so the loops read plain list slots instead of chasing
+    agent attributes per step. The lists are shared by every run on the
+    ecosystem and must be treated as read-only.
+
+    Attributes:
+        names: Agent name per agent.
+        dependency_weights: dependency_weight per agent.
+        monetary_rates: monetary_rate per agent.
+        damage_functions: damage_function per agent.
+        trophic_levels: trophic_level per agent.
+        is_keystone: is_keystone per agent.
+        keystone_thresholds: keystone_threshold per agent.
+    """
+
+    names: list
+    dependency_weights: list
+    monetary_rates: list
+    damage_functions: list
+    trophic_levels: list
+    is_keystone: list
+    keystone_thresholds: list
+
 
 @dataclass
 class Ecosystem:
@@ -583,6 +664,40 @@ class Ecosystem:
         resource: The shared natural asset.
         agents: List of Agent instances dependent on the resource.
                 Typed as list (not List[Agent]) for Cython compatibility.
+
+    Derived (v0.8, computed on first access and reused until the ecosystem
+    changes):
+        name_to_idx: Agent name → position in agents.
+        agent_columns: AgentColumns (per-field lists) projected from agents.
+        has_keystones: Whether any agent is a keystone.
+        edge_index: (edge_src_idx, edge_tgt_idx, keystone_edges) as returned by
+            propagation.build_edge_index. Only valid for a validated ecosystem.
+        edge_csr: (indptr, out_edges) as returned by propagation.build_edge_csr.
+        edge_strengths: Interaction strengths, in interactions order.
+    The views, together with damage_memo, are dropped automatically when
+    agents or interactions is reassigned or changes length. Edits in place
+    (an agent or edge replaced at the same position, or a field of one
+    changed) are not detected: call clear_derived() after making them.
+
+    trace_precision (v0.8): None keeps per-agent trace rows (damages, costs,
+    recoveries, ...) as lists of Python floats. "float64" packs them into
+    array('d') after the run — identical values, no boxed float per entry
+    (8 bytes instead of ~32). "float32" packs into array('f'), halving that
+    again, for ensemble sweeps that hold many results. The simulation itself
+    always runs in double precision and scalar totals (e.g.
+    total_externality_cost) are unaffected; with "float32" only the stored
+    per-agent values are rounded to ~7 significant digits.
+
+    persist_cascade_breakdown (v0.8): False stores agent_direct_damages and
+    agent_cascade_damages for the final extraction step only (see
+    SimulationResult).
+
+    damage_memo (v0.8): Per-agent direct damage columns computed by the
+    pure-Python run_extraction, keyed by (total_units, packed) and reused
+    (and extended) by later runs on the same ecosystem. Holds one float per
+    distinct curve per step extracted so far, packed into array('d') when
+    trace_precision is set. Cleared with the derived views; at most two
+    column sets (see simulation._DAMAGE_MEMO_MAX_ENTRIES) are kept.
     """
 
     name: str
@@ -595,8 +710,128 @@ class Ecosystem:
     # v0.7: Endogenous pricing (None → use static monetary_rate, backward compatible)
     pricing: Optional[PricingConfig] = None
 
+    # v0.8: Storage precision of per-agent trace rows (None = lists of floats)
+    trace_precision: Optional[str] = None
 
-@dataclass
+    # v0.8: Keep the per-step direct/cascade breakdown (False = final step only)
+    persist_cascade_breakdown: bool = True
+
+    # v0.8: Phase 1 damage columns memoized across runs (see damage_memo below)
+    damage_memo: dict = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    # v0.8: Derived views by name, and the agents/interactions they were built from
+    _views: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _views_source: tuple = field(default=(), init=False, repr=False, compare=False)
+
+    def clear_derived(self) -> None:
+        """
+        Drop the derived views and damage_memo so they are rebuilt from the
+        current agents and interactions.
+
+        Replacing or resizing agents or interactions does this automatically;
+        call it after editing an agent or edge in place.
+        """
+        self._views.clear()
+        self.damage_memo.clear()
+
+    def _current_views(self) -> dict:
+        """The derived-view cache, emptied first if agents or interactions changed."""
+        agents: list = self.agents
+        interactions: list = self.interactions
+        source: tuple = self._views_source
+        if not (
+            source
+            and source[0] is agents
+            and source[1] is interactions
+            and source[2] == len(agents)
+            and source[3] == len(interactions)
+        ):
+            self.clear_derived()
+            self._views_source = (agents, interactions, len(agents), len(interactions))
+        return self._views
+
+    @property
+    def name_to_idx(self) -> dict:
+        """Agent name → index in agents."""
+        views: dict = self._current_views()
+        value = views.get("name_to_idx")
+        if value is None:
+            value = views["name_to_idx"] = {
+                agent.name: i for i, agent in enumerate(self.agents)
+            }
+        return value
+
+    @property
+    def agent_columns(self) -> AgentColumns:
+        """Per-field agent lists for the simulation loops."""
+        views: dict = self._current_views()
+        value = views.get("agent_columns")
+        if value is None:
+            agents: list = self.agents
+            value = views["agent_columns"] = AgentColumns(
+                names=[a.name for a in agents],
+                dependency_weights=[a.dependency_weight for a in agents],
+                monetary_rates=[a.monetary_rate for a in agents],
+                damage_functions=[a.damage_function for a in agents],
+                trophic_levels=[a.trophic_level for a in agents],
+                is_keystone=[a.is_keystone for a in agents],
+                keystone_thresholds=[a.keystone_threshold for a in agents],
+            )
+        return value
+
+    @property
+    def edge_csr(self) -> tuple:
+        """Outgoing edges grouped by source agent."""
+        views: dict = self._current_views()
+        value = views.get("edge_csr")
+        if value is None:
+            from gaia.propagation import build_edge_csr
+
+            value = views["edge_csr"] = build_edge_csr(
+                len(self.agents), self.edge_index[0]
+            )
+        return value
+
+    @property
+    def edge_strengths(self) -> list:
+        """Interaction strengths in edge order."""
+        views: dict = self._current_views()
+        value = views.get("edge_strengths")
+        if value is None:
+            value = views["edge_strengths"] = [e.strength for e in self.interactions]
+        return value
+
+    @property
+    def has_keystones(self) -> bool:
+        """Whether any agent is a keystone."""
+        views: dict = self._current_views()
+        value = views.get("has_keystones")
+        if value is None:
+            value = views["has_keystones"] = any(
+                agent.is_keystone for agent in self.agents
+            )
+        return value
+
+    @property
+    def edge_index(self) -> tuple:
+        """Interaction edges resolved to agent indices."""
+        views: dict = self._current_views()
+        value = views.get("edge_index")
+        if value is None:
+            from gaia.propagation import build_edge_index
+
+            value = views["edge_index"] = build_edge_index(
+                [a.name for a in self.agents],
+                [e.source for e in self.interactions],
+                [e.target for e in self.interactions],
+                [a.is_keystone for a in self.agents],
+            )
+        return value
+
+
+@dataclass(**_SLOTS)
 class SimulationStep:
     """
     The state of the simulation at one point in time (after extracting N units total).
@@ -607,6 +842,8 @@ class SimulationStep:
         depletion_ratio: units_extracted / total_units.
         agent_damages: Damage ratio per agent at this depletion level (0.0 to 1.0).
         agent_costs: Total € cost per agent at this depletion level.
+            Per-agent sequences are lists, or array.array when the ecosystem
+            sets trace_precision (v0.8); both support len, indexing and sum.
         marginal_cost: Externality cost of THIS unit only (total cost minus previous total).
         cumulative_cost: Total externality cost at this depletion level.
         private_revenue: Cumulative revenue from extraction so far.
@@ -648,6 +885,176 @@ class SimulationStep:
     price_result: Optional[PriceResult] = None        # Full price decomposition
 
 
+@dataclass
+class SimulationTrace:
+    """
+    Columnar (structure-of-arrays) storage for an extraction trajectory.
+
+    The simulation loop writes each step's values into preallocated column
+    lists instead of constructing one SimulationStep per step. The trace is
+    a read-only sequence: indexing or iterating it builds SimulationStep
+    views on demand from row i of the columns, so callers that only read
+    a few steps (typically steps[-1]) never pay for the others.
+
+    Row i holds step i + 1; `step` and `units_extracted` are derived from
+    the row index rather than stored.
+
+    v0.8: Scalar numeric columns are preallocated typed buffers, array('d')
+    (effective_k: array('q')), holding unboxed C values instead of one float
+    object per step; indexing them still returns plain floats/ints.
+    Per-agent rows, strings, flags and objects stay in lists.
+
+    Attributes:
+        depletion_ratio: Depletion ratio per step.
+        agent_damages: Effective damage list per step.
+        agent_costs: Per-agent cost list per step.
+        marginal_cost: Marginal cost per step.
+        cumulative_cost: Total externality cost per step.
+        private_revenue: Cumulative private revenue per step.
+        ecosystem_health: Ecosystem health per step.
+        agent_direct_damages: Pre-propagation damage list per step (None = not
+            persisted, see Ecosystem.persist_cascade_breakdown).
+        agent_cascade_damages: Cascade damage list per step (None = not persisted).
+        keystone_triggered: Triggered keystone names per step.
+        resilience_zone: Resilience zone per step.
+        model_confidence: Model confidence per step.
+        irreversibility_warning: Irreversibility flag per step.
+        substrate_erosion: Substrate erosion per step.
+        effective_k: Effective carrying capacity per step.
+        k_fraction: Carrying capacity fraction per step.
+        agent_prices: Per-agent dynamic price list per step (None = no pricing).
+        price_result: PriceResult (or None) per step.
+    """
+
+    depletion_ratio: list
+    agent_damages: list
+    agent_costs: list
+    marginal_cost: list
+    cumulative_cost: list
+    private_revenue: list
+    ecosystem_health: list
+    agent_direct_damages: list
+    agent_cascade_damages: list
+    keystone_triggered: list
+    resilience_zone: list
+    model_confidence: list
+    irreversibility_warning: list
+    substrate_erosion: list
+    effective_k: list
+    k_fraction: list
+    agent_prices: list
+    price_result: list
+
+    @classmethod
+    def preallocate(cls, n_steps: int) -> "SimulationTrace":
+        """Create a trace with every column preallocated to n_steps rows."""
+        return cls(
+            depletion_ratio=_filled("d", 0.0, n_steps),
+            agent_damages=[None] * n_steps,
+            agent_costs=[None] * n_steps,
+            marginal_cost=_filled("d", 0.0, n_steps),
+            cumulative_cost=_filled("d", 0.0, n_steps),
+            private_revenue=_filled("d", 0.0, n_steps),
+            ecosystem_health=_filled("d", 0.0, n_steps),
+            agent_direct_damages=[None] * n_steps,
+            agent_cascade_damages=[None] * n_steps,
+            keystone_triggered=[None] * n_steps,
+            resilience_zone=["green"] * n_steps,
+            model_confidence=_filled("d", 1.0, n_steps),
+            irreversibility_warning=[False] * n_steps,
+            substrate_erosion=_filled("d", 0.0, n_steps),
+            effective_k=_filled("q", 0, n_steps),
+            k_fraction=_filled("d", 1.0, n_steps),
+            agent_prices=[None] * n_steps,
+            price_result=[None] * n_steps,
+        )
+
+    def __len__(self) -> int:
+        return len(self.depletion_ratio)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(len(self)))]
+        n: int = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("SimulationTrace index out of range")
+        return self._row(index)
+
+    def __iter__(self):
+        # v0.8: Walk all columns in lockstep and build each view positionally
+        # (SimulationStep field order) instead of indexing every column per row
+        for step, (
+            depletion_ratio, agent_damages, agent_costs, marginal_cost,
+            cumulative_cost, private_revenue, ecosystem_health, direct, cascade,
+            keystone_triggered, resilience_zone, model_confidence,
+            irreversibility_warning, substrate_erosion, effective_k, k_fraction,
+            prices, price_result,
+        ) in enumerate(zip(
+            self.depletion_ratio, self.agent_damages, self.agent_costs,
+            self.marginal_cost, self.cumulative_cost, self.private_revenue,
+            self.ecosystem_health, self.agent_direct_damages,
+            self.agent_cascade_damages, self.keystone_triggered,
+            self.resilience_zone, self.model_confidence,
+            self.irreversibility_warning, self.substrate_erosion,
+            self.effective_k, self.k_fraction, self.agent_prices,
+            self.price_result,
+        ), 1):
+            yield SimulationStep(
+                step, step, depletion_ratio, agent_damages, agent_costs,
+                marginal_cost, cumulative_cost, private_revenue, ecosystem_health,
+                direct if direct is not None else [],
+                cascade if cascade is not None else [],
+                keystone_triggered, resilience_zone, model_confidence,
+                irreversibility_warning, substrate_erosion, effective_k, k_fraction,
+                agent_prices=prices if prices is not None else [],
+                price_result=price_result,
+            )
+
+    def pack(self, precision: str) -> None:
+        """Convert the per-agent row lists to array(typecode) in place."""
+        typecode: str = _TRACE_TYPECODES[precision]
+        for column in (
+            self.agent_damages,
+            self.agent_costs,
+            self.agent_direct_damages,
+            self.agent_cascade_damages,
+            self.agent_prices,
+        ):
+            for i, row in enumerate(column):
+                if row is not None:
+                    column[i] = array(typecode, row)
+
+    def _row(self, i: int) -> SimulationStep:
+        """Build the SimulationStep view for row i."""
+        prices = self.agent_prices[i]
+        direct = self.agent_direct_damages[i]
+        cascade = self.agent_cascade_damages[i]
+        return SimulationStep(
+            step=i + 1,
+            units_extracted=i + 1,
+            depletion_ratio=self.depletion_ratio[i],
+            agent_damages=self.agent_damages[i],
+            agent_costs=self.agent_costs[i],
+            marginal_cost=self.marginal_cost[i],
+            cumulative_cost=self.cumulative_cost[i],
+            private_revenue=self.private_revenue[i],
+            ecosystem_health=self.ecosystem_health[i],
+            agent_direct_damages=direct if direct is not None else [],
+            agent_cascade_damages=cascade if cascade is not None else [],
+            keystone_triggered=self.keystone_triggered[i],
+            resilience_zone=self.resilience_zone[i],
+            model_confidence=self.model_confidence[i],
+            irreversibility_warning=self.irreversibility_warning[i],
+            substrate_erosion=self.substrate_erosion[i],
+            effective_k=self.effective_k[i],
+            k_fraction=self.k_fraction[i],
+            agent_prices=prices if prices is not None else [],
+            price_result=self.price_result[i],
+        )
+
+
 @dataclass
 class SimulationResult:
     """
@@ -655,17 +1062,24 @@ class SimulationResult:
 
     Attributes:
         ecosystem: The ecosystem that was simulated.
-        steps: All SimulationStep records produced during the run.
+        steps: All SimulationStep records produced during the run. run_extraction()
+            returns a SimulationTrace, which builds each SimulationStep on access.
         total_units_extracted: How many units were extracted.
         total_private_revenue: Sum of all unit revenues.
         total_externality_cost: Total externality cost at the final depletion level.
         net_social_cost: total_private_revenue - total_externality_cost.
                          Positive = society gained; negative = society lost.
         final_ecosystem_health: Ecosystem health at the end of the simulation.
+
+    v0.8: When ecosystem.persist_cascade_breakdown is False, only the final step
+    keeps agent_direct_damages / agent_cascade_damages (earlier steps report
+    empty lists). That roughly halves per-agent trace memory on long runs;
+    the final-step breakdown used by the report is always kept, as are
+    keystone_triggered, agent_damages and agent_costs for every step.
     """
 
     ecosystem: Ecosystem
-    steps: list               # List[SimulationStep]
+    steps: list               # Sequence[SimulationStep] — SimulationTrace from run_extraction
     total_units_extracted: int
     total_private_revenue: float
     total_externality_cost: float
@@ -718,7 +1132,7 @@ class RestorationCost:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class RestorationStep:
     """
     The state of the restoration simulation at one point in time
@@ -750,6 +1164,93 @@ class RestorationStep:
     ecosystem_health: float
 
 
+@dataclass
+class RestorationTrace:
+    """
+    Columnar (structure-of-arrays) storage for a restoration trajectory.
+
+    Restoration counterpart of SimulationTrace: run_restoration() writes
+    into preallocated columns, and indexing or iterating the trace
+    builds RestorationStep views on demand. Row i holds step i + 1;
+    `step` and `units_restored` are derived from the row index.
+    Scalar columns are array('d') buffers; per-agent rows are lists (v0.8).
+
+    Attributes:
+        recovery_ratio: Recovery ratio per step.
+        agent_recoveries: Effective recovery list per step.
+        agent_service_values: Per-agent service value list per step.
+        marginal_service_value: Marginal service value per step.
+        cumulative_service_value: Total recovered service value per step.
+        restoration_cost_so_far: Restoration cost incurred per step.
+        ecosystem_health: Ecosystem health per step.
+    """
+
+    recovery_ratio: list
+    agent_recoveries: list
+    agent_service_values: list
+    marginal_service_value: list
+    cumulative_service_value: list
+    restoration_cost_so_far: list
+    ecosystem_health: list
+
+    @classmethod
+    def preallocate(cls, n_steps: int) -> "RestorationTrace":
+        """Create a trace with every column preallocated to n_steps rows."""
+        return cls(
+            recovery_ratio=_filled("d", 0.0, n_steps),
+            agent_recoveries=[None] * n_steps,
+            agent_service_values=[None] * n_steps,
+            marginal_service_value=_filled("d", 0.0, n_steps),
+            cumulative_service_value=_filled("d", 0.0, n_steps),
+            restoration_cost_so_far=_filled("d", 0.0, n_steps),
+            ecosystem_health=_filled("d", 0.0, n_steps),
+        )
+
+    def __len__(self) -> int:
+        return len(self.recovery_ratio)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(len(self)))]
+        n: int = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("RestorationTrace index out of range")
+        return self._row(index)
+
+    def __iter__(self):
+        # v0.8: Lockstep walk over the columns, views built positionally
+        for step, row in enumerate(zip(
+            self.recovery_ratio, self.agent_recoveries, self.agent_service_values,
+            self.marginal_service_value, self.cumulative_service_value,
+            self.restoration_cost_so_far, self.ecosystem_health,
+        ), 1):
+            yield RestorationStep(step, step, *row)
+
+    def pack(self, precision: str) -> None:
+        """Convert the per-agent row lists to array(typecode) in place."""
+        typecode: str = _TRACE_TYPECODES[precision]
+        for column in (self.agent_recoveries, self.agent_service_values):
+            for i, row in enumerate(column):
+                if row is not None:
+                    column[i] = array(typecode, row)
+
+    def _row(self, i: int) -> RestorationStep:
+        """Build the RestorationStep view for row i."""
+        return RestorationStep(
+            step=i + 1,
+            units_restored=i + 1,
+            recovery_ratio=self.recovery_ratio[i],
+            agent_recoveries=self.agent_recoveries[i],
+            agent_service_values=self.agent_service_values[i],
+            marginal_service_value=self.marginal_service_value[i],
+            cumulative_service_value=self.cumulative_service_value[i],
+            restoration_cost_so_far=self.restoration_cost_so_far[i],
+            ecosystem_health=self.ecosystem_health[i],
+        )
+
+
 @dataclass
 class RestorationResult:
     """
@@ -758,7 +1259,8 @@ class RestorationResult:
     Attributes:
         ecosystem: The ecosystem being restored.
         restoration_cost: The RestorationCost parameters used.
-        steps: All RestorationStep records.
+        steps: All RestorationStep records. run_restoration() returns a
+            RestorationTrace, which builds each RestorationStep on access.
         total_units_restored: How many units were replanted.
         total_restoration_cost: Total direct cost of restoration (€).
         total_recovered_value: Total ecosystem service value recovered (€).
@@ -780,7 +1282,7 @@ class RestorationResult:
 
     ecosystem: Ecosystem
     restoration_cost: RestorationCost
-    steps: list                  # List[RestorationStep]
+    steps: list                  # Sequence[RestorationStep] — RestorationTrace from run_restoration
     total_units_restored: int
     total_restoration_cost: float
     total_recovered_value: float
@@ -13,13 +13,59 @@ All functions use primitive types (float, int, list, dict) for Cython compatibil
 No third-party dependencies.
 
 Scientific foundations used: F3 (Trophic Pyramids), F6 (Keystone Species), F10 (Coevolution).
+
+v0.8: Trophic amplification factors come from a per-level table, so the
+simulation loops multiply by a precomputed per-agent factor instead of
+calling pow() per agent per step. Edges are resolved once into parallel
+index lists (build_edge_index) and propagated by
+propagate_interactions_indexed, which does no name lookups.
+propagate_interactions keeps the name-based signature as a thin wrapper.
+When the optional gaia.cy.propagation_cy extension is built, the indexed
+propagation runs in compiled code with identical results.
 """
 
+from itertools import repeat
+
+# v0.8: Try importing Cython-optimized propagation kernel
+try:
+    from gaia.cy.propagation_cy import propagate_indexed_cy
+    _HAS_CYTHON = True
+except ImportError:
+    _HAS_CYTHON = False
+
+
+# Default energy transfer efficiency between trophic levels [PLACEHOLDER]
+_DEFAULT_TRANSFER_EFFICIENCY: float = 0.15
+
+# v0.8: Amplification factor per trophic level at the default efficiency,
+# indexed by trophic_level + 1 (levels -1..3). Levels <= 0 are not amplified.
+_AMPLIFICATION_LUT: tuple = tuple(
+    1.0 if level <= 0 else (1.0 / _DEFAULT_TRANSFER_EFFICIENCY) ** (level * 0.25)
+    for level in (-1, 0, 1, 2, 3)
+)
+
+
+def trophic_amplification_factor(
+    trophic_level: int,
+    transfer_efficiency: float = _DEFAULT_TRANSFER_EFFICIENCY,
+) -> float:
+    """
+    Amplification factor (1 / transfer_efficiency) ^ (trophic_level * 0.25).
+
+    Returns 1.0 for producers and abiotic services (trophic_level <= 0).
+    Looked up from a table for the default efficiency and levels 1-3.
+    """
+    if trophic_level <= 0:
+        return 1.0
+    if trophic_level <= 3 and transfer_efficiency == _DEFAULT_TRANSFER_EFFICIENCY:
+        return _AMPLIFICATION_LUT[trophic_level + 1]
+    return (1.0 / transfer_efficiency) ** (trophic_level * 0.25)
+
 
 def compute_trophic_amplification(
     direct_damage: float,
     trophic_level: int,
-    transfer_efficiency: float = 0.15,
+    transfer_efficiency: float = _DEFAULT_TRANSFER_EFFICIENCY,
 ) -> float:
     """
     Apply trophic energy pyramid amplification to direct damage.
@@ -45,7 +91,7 @@ def compute_trophic_amplification(
     if trophic_level <= 0:
         # Producers and abiotic services: no amplification
         return direct_damage
-    amplification: float = (1.0 / transfer_efficiency) ** (trophic_level * 0.25)
+    amplification: float = trophic_amplification_factor(trophic_level, transfer_efficiency)
     result: float = direct_damage * amplification
     if result > 1.0:
         return 1.0
@@ -118,59 +164,201 @@ def propagate_interactions(
         - cascade_damages: list of float — additional damage from interactions per agent
         - keystone_triggered: list of str — names of agents whose keystone threshold crossed
     """
-    n_agents: int = len(agent_names)
-    n_edges: int = len(edge_sources)
+    edge_src_idx, edge_tgt_idx, keystone_edges = build_edge_index(
+        agent_names, edge_sources, edge_targets, agent_is_keystone
+    )
+    return propagate_interactions_indexed(
+        agent_names=agent_names,
+        direct_damages=direct_damages,
+        edge_src_idx=edge_src_idx,
+        edge_tgt_idx=edge_tgt_idx,
+        edge_strengths=edge_strengths,
+        keystone_edges=keystone_edges,
+        agent_keystone_thresholds=agent_keystone_thresholds,
+        recovery_mode=recovery_mode,
+        recovery_cascade_factor=recovery_cascade_factor,
+    )
+
+
+# ── v0.8: Index-based propagation ─────────────────────────────────────────────
+
+
+def build_edge_index(
+    agent_names: list,
+    edge_sources: list,
+    edge_targets: list,
+    agent_is_keystone: list,
+) -> tuple:
+    """
+    Resolve edge endpoint names to agent indices, once per ecosystem.
+
+    Args:
+        agent_names: List of agent name strings, in ecosystem order.
+        edge_sources: Source agent name per edge.
+        edge_targets: Target agent name per edge.
+        agent_is_keystone: Boolean per agent — is this a keystone species?
+
+    Returns:
+        Tuple of (edge_src_idx, edge_tgt_idx, keystone_edges):
+        - edge_src_idx: list of int — source agent index per edge
+        - edge_tgt_idx: list of int — target agent index per edge
+        - keystone_edges: list of (agent_idx, out_edge_indices) for each keystone
+          agent, in agent order; out_edge_indices lists its outgoing edges
+    """
+    name_to_idx: dict = {name: i for i, name in enumerate(agent_names)}
+
+    edge_src_idx: list = [name_to_idx[name] for name in edge_sources]
+    edge_tgt_idx: list = [name_to_idx[name] for name in edge_targets]
+
+    # Outgoing edges per keystone, sliced from the CSR adjacency (O(E) total)
+    indptr, out_edges = build_edge_csr(len(agent_names), edge_src_idx)
+    keystone_edges: list = [
+        (i, out_edges[indptr[i]:indptr[i + 1]])
+        for i in range(len(agent_names))
+        if agent_is_keystone[i]
+    ]
+
+    return (edge_src_idx, edge_tgt_idx, keystone_edges)
+
 
-    # Build name-to-index lookup
-    name_to_idx: dict = {}
+def build_edge_csr(n_agents: int, edge_src_idx: list) -> tuple:
+    """
+    Group edge indices by source agent (compressed sparse row layout).
+
+    The outgoing edges of agent i are out_edges[indptr[i]:indptr[i + 1]],
+    in ascending edge order, so per-agent edge scans cost O(out-degree)
+    instead of O(E).
+
+    Args:
+        n_agents: Number of agents.
+        edge_src_idx: Source agent index per edge (see build_edge_index).
+
+    Returns:
+        Tuple of (indptr, out_edges):
+        - indptr: list of n_agents + 1 ints — row offsets into out_edges
+        - out_edges: list of int — edge indices grouped by source agent
+    """
+    indptr: list = [0] * (n_agents + 1)
+    for src in edge_src_idx:
+        indptr[src + 1] += 1
     for i in range(n_agents):
-        name_to_idx[agent_names[i]] = i
+        indptr[i + 1] += indptr[i]
+
+    out_edges: list = [0] * len(edge_src_idx)
+    fill: list = indptr[:n_agents]
+    for e, src in enumerate(edge_src_idx):
+        out_edges[fill[src]] = e
+        fill[src] += 1
+
+    return (indptr, out_edges)
+
+
+def propagate_interactions_indexed(
+    agent_names: list,
+    direct_damages: list,
+    edge_src_idx: list,
+    edge_tgt_idx: list,
+    edge_strengths: list,
+    keystone_edges: list,
+    agent_keystone_thresholds: list,
+    recovery_mode: bool = False,
+    recovery_cascade_factor: float = 0.5,
+    *,
+    out_effective: list = None,
+    out_cascade: list = None,
+    out_keystones: list = None,
+) -> tuple:
+    """
+    Index-based core of propagate_interactions.
+
+    Same semantics and return value as propagate_interactions, but edges are
+    given as pre-resolved agent indices (see build_edge_index), so the loop
+    does no string hashing. The keystone pass visits only keystone agents'
+    outgoing edges, recovery scaling is hoisted out of the propagation loop,
+    and cascade tracking is fused into the single propagation pass.
+
+    The optional out_* buffers let a caller allocate scratch lists once
+    outside its step loop: when given, their contents are overwritten and
+    the same list objects are returned. Callers that keep the results
+    across steps must not pass buffers they will reuse.
+
+    Args:
+        out_effective: Optional list of length n_agents to receive the
+            effective damages.
+        out_cascade: Optional list of length n_agents to receive the
+            cascade damages.
+        out_keystones: Optional list to receive the triggered keystone names.
+    """
+    if _HAS_CYTHON:
+        return propagate_indexed_cy(
+            agent_names, direct_damages, edge_src_idx, edge_tgt_idx,
+            edge_strengths, keystone_edges, agent_keystone_thresholds,
+            recovery_mode, recovery_cascade_factor,
+            out_effective=out_effective,
+            out_cascade=out_cascade,
+            out_keystones=out_keystones,
+        )
+
+    n_agents: int = len(direct_damages)
+    n_edges: int = len(edge_src_idx)
 
     # Initialize effective damages as a copy of direct damages
-    effective: list = list(direct_damages)
-    cascade: list = [0.0] * n_agents
+    if out_effective is None:
+        effective: list = list(direct_damages)
+    else:
+        out_effective[:] = direct_damages
+        effective = out_effective
+    if out_cascade is None:
+        cascade: list = [0.0] * n_agents
+    else:
+        out_cascade[:] = repeat(0.0, n_agents)
+        cascade = out_cascade
+    if out_keystones is None:
+        keystone_triggered: list = []
+    else:
+        out_keystones.clear()
+        keystone_triggered = out_keystones
 
     # No edges: short-circuit
     if n_edges == 0:
-        return (effective, cascade, [])
+        return (effective, cascade, keystone_triggered)
 
-    # Determine keystone-triggered agents and compute effective edge strengths
-    keystone_triggered: list = []
-    effective_strengths: list = list(edge_strengths)
+    # Determine keystone-triggered agents. Edge strengths are copied only
+    # when a keystone actually triggers (copy-on-write); ecosystems without
+    # keystones have an empty keystone_edges and skip the pass entirely.
+    effective_strengths: list = edge_strengths
 
-    for i in range(n_agents):
-        if agent_is_keystone[i]:
-            agent_health: float = 1.0 - direct_damages[i]
-            if agent_health < agent_keystone_thresholds[i]:
-                keystone_triggered.append(agent_names[i])
-                # Double outgoing edge strengths for this keystone agent
-                for e in range(n_edges):
-                    if edge_sources[e] == agent_names[i]:
-                        doubled: float = edge_strengths[e] * 2.0
-                        if doubled > 1.0:
-                            doubled = 1.0
-                        effective_strengths[e] = doubled
-
-    # Apply recovery mode scaling
+    for i, out_edges in keystone_edges:
+        agent_health: float = 1.0 - direct_damages[i]
+        if agent_health < agent_keystone_thresholds[i]:
+            keystone_triggered.append(agent_names[i])
+            if effective_strengths is edge_strengths:
+                effective_strengths = list(edge_strengths)
+            # Double outgoing edge strengths for this keystone agent
+            for e in out_edges:
+                doubled: float = edge_strengths[e] * 2.0
+                if doubled > 1.0:
+                    doubled = 1.0
+                effective_strengths[e] = doubled
+
+    # Recovery mode: scale all strengths once, so the propagation loop below
+    # is the same specialized body in both modes (no per-edge mode branch)
     if recovery_mode:
-        for e in range(n_edges):
-            effective_strengths[e] = effective_strengths[e] * recovery_cascade_factor
+        factor: float = recovery_cascade_factor
+        effective_strengths = [s * factor for s in effective_strengths]
 
-    # Single-pass propagation: read from direct_damages (frozen), write to effective
+    # Single propagation pass: read from direct_damages (frozen), write to
+    # effective. Cascade = effective - direct (floored at 0) is kept current
+    # per edge, so capping at 1.0 is accounted for without a reconciliation pass.
     for e in range(n_edges):
-        src_idx: int = name_to_idx[edge_sources[e]]
-        tgt_idx: int = name_to_idx[edge_targets[e]]
-        source_damage: float = direct_damages[src_idx]
-        additional: float = source_damage * effective_strengths[e]
-        cascade[tgt_idx] += additional
-        effective[tgt_idx] = effective[tgt_idx] + additional
-        if effective[tgt_idx] > 1.0:
-            effective[tgt_idx] = 1.0
-
-    # Recompute cascade as effective - direct (accounts for capping)
-    for i in range(n_agents):
-        cascade[i] = effective[i] - direct_damages[i]
-        if cascade[i] < 0.0:
-            cascade[i] = 0.0
+        tgt_idx: int = edge_tgt_idx[e]
+        value: float = (
+            effective[tgt_idx] + direct_damages[edge_src_idx[e]] * effective_strengths[e]
+        )
+        if value > 1.0:
+            value = 1.0
+        effective[tgt_idx] = value
+        value = value - direct_damages[tgt_idx]
+        cascade[tgt_idx] = value if value > 0.0 else 0.0
 
     return (effective, cascade, keystone_triggered)
@@ -29,6 +29,13 @@ separately by the RestorationCost.maintenance_years parameter — the recovery
 function models the shape of the return curve, not the time dimension.
 
 All functions are float → float in the hot path — Cython-compatible.
+
+v0.8: The exact recovery curves publish their constants as
+``kernel_params = (kind, p1, p2, p3, p4)``, using the same layout as
+gaia.damage (0 = logistic: (inflection, raw_0, span, steepness);
+3 = linear: (slope, 0.0, 0.0, 0.0)). group_shared_curves() uses them to
+find agents whose curves are identical, so the restoration loop evaluates
+each distinct curve once per step instead of once per agent.
 """
 
 import math
@@ -37,7 +44,9 @@ from typing import Callable
 RecoveryFunc = Callable[[float], float]
 
 
-def logistic_recovery(threshold: float, steepness: float = 7.0) -> RecoveryFunc:
+def logistic_recovery(
+    threshold: float, steepness: float = 7.0, table_size: int = 0
+) -> RecoveryFunc:
     """
     Logistic (sigmoid) recovery function — the primary recovery option.
 
@@ -65,10 +74,21 @@ def logistic_recovery(threshold: float, steepness: float = 7.0) -> RecoveryFunc:
         steepness: Sharpness of the recovery S-curve. Default 7.0 — shallower
             than the damage default (12.0) to encode slower recovery.
             [PLACEHOLDER — pending scientific calibration per ecosystem type]
+        table_size: If > 0, pre-evaluate the curve at table_size + 1 evenly
+            spaced points in [0, 1] and answer each call by linear interpolation
+            (no exp() per call). Endpoints stay exact (f(0) = 0, f(1) = 1) and
+            the curve stays monotonic; with table_size=1024 the interpolation
+            error is below 1e-6. Default 0 evaluates the exact formula.
 
     Returns:
         RecoveryFunc mapping restoration_ratio in [0, 1] to recovered_ratio in [0, 1].
+
+    Raises:
+        ValueError: If table_size is negative.
     """
+    if table_size < 0:
+        raise ValueError(f"table_size must be >= 0, got {table_size}.")
+
     # Inflection at 60% restored: ecosystem services accelerate only after a
     # substantial fraction of the resource is back. This reflects the network
     # effect — mycorrhizal connectivity, canopy microclimate, etc. only emerge
@@ -79,11 +99,31 @@ def logistic_recovery(threshold: float, steepness: float = 7.0) -> RecoveryFunc:
     raw_1: float = 1.0 / (1.0 + math.exp(-steepness * (1.0 - inflection)))
     span: float = raw_1 - raw_0
 
+    # v0.8: Constants hoisted out of the per-call body (no global math lookup
+    # or negation per call); the arithmetic order is unchanged
+    neg_steepness: float = -steepness
+    exp = math.exp
+
     def _logistic_recovery(restoration_ratio: float) -> float:
-        raw: float = 1.0 / (1.0 + math.exp(-steepness * (restoration_ratio - inflection)))
+        raw: float = 1.0 / (1.0 + exp(neg_steepness * (restoration_ratio - inflection)))
         return (raw - raw_0) / span
 
-    return _logistic_recovery
+    if table_size == 0:
+        _logistic_recovery.kernel_params = (0, inflection, raw_0, span, steepness)
+        return _logistic_recovery
+
+    # v0.8: Partial evaluation — tabulate once, interpolate per call
+    table: list = [_logistic_recovery(j / table_size) for j in range(table_size + 1)]
+
+    def _logistic_recovery_table(restoration_ratio: float) -> float:
+        position: float = restoration_ratio * table_size
+        j: int = int(position)
+        if j >= table_size:
+            return table[table_size]
+        lower: float = table[j]
+        return lower + (table[j + 1] - lower) * (position - j)
+
+    return _logistic_recovery_table
 
 
 def linear_recovery(slope: float = 0.8) -> RecoveryFunc:
@@ -124,7 +164,37 @@ def linear_recovery(slope: float = 0.8) -> RecoveryFunc:
             f"entropy asymmetry. A slope <= 0.0 implies no recovery."
         )
 
+    # v0.8: Inline compare instead of a min() builtin call per evaluation
     def _linear_recovery(restoration_ratio: float) -> float:
-        return min(slope * restoration_ratio, 1.0)
+        raw: float = slope * restoration_ratio
+        return 1.0 if raw > 1.0 else raw
 
+    _linear_recovery.kernel_params = (3, slope, 0.0, 0.0, 0.0)
     return _linear_recovery
+
+
+def group_shared_curves(functions: list) -> list:
+    """
+    Group per-agent curve functions that compute the same curve.
+
+    Functions built by the gaia factories with equal parameters publish equal
+    kernel_params and fall into one group; any other function (custom or
+    tabulated) is grouped only with itself. Evaluating one representative per
+    group gives exactly the values every member would return.
+
+    Args:
+        functions: One recovery (or damage) function per agent.
+
+    Returns:
+        List of (function, agent_indices) pairs, in first-appearance order.
+    """
+    groups: dict = {}
+    for i, fn in enumerate(functions):
+        key = getattr(fn, "kernel_params", None)
+        if key is None:
+            key = fn
+        if key in groups:
+            groups[key][1].append(i)
+        else:
+            groups[key] = (fn, [i])
+    return list(groups.values())
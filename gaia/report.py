@@ -17,11 +17,26 @@ v0.6: NPV Analysis section in extraction report;
       Prevention Advantage V06 sections in restoration report.
 v0.7: Price Decomposition section in extraction report
       (endogenous pricing with scarcity and demand multipliers).
+v0.8: Reports are written into an io.StringIO buffer instead of a list of
+      lines joined at the end. gaia.carbon and gaia.resilience
+      are imported lazily, only by the sections that use them.
 """
 
-from gaia.carbon import compute_carbon_cost, compute_carbon_payback_period
-from gaia.models import Agent, Ecosystem, RestorationResult, Resource, SimulationResult
-from gaia.resilience import compute_confidence_band
+from functools import lru_cache
+from io import StringIO
+from itertools import repeat
+from typing import Optional
+
+from gaia.models import (
+    Agent,
+    Ecosystem,
+    RestorationResult,
+    Resource,
+    SimulationResult,
+    SimulationStep,
+    SimulationTrace,
+)
+from gaia.propagation import trophic_amplification_factor
 from gaia.substrate import compute_substrate_recovery_years, create_substrate_state
 
 # Report width (characters)
@@ -29,11 +44,120 @@ _WIDTH: int = 63
 _DOUBLE_LINE: str = "=" * _WIDTH
 _SINGLE_LINE: str = "-" * _WIDTH
 
+# Consumer names by trophic level, for the amplification lines
+_LEVEL_NAMES: dict = {
+    1: "primary consumer",
+    2: "secondary consumer",
+    3: "tertiary consumer",
+}
+
+
+# v0.8: Section headers are built once at import, not on every report call
+def _section_header(title: str, rule: int) -> str:
+    """Return "  ── <title> ─" padded with `rule` more "─", plus a newline."""
+    return f"  \u2500\u2500 {title} \u2500" + "\u2500" * rule + "\n"
+
+
+_PRIVATE_GAINS_HDR: str = _section_header("Private Gains", 46)
+_EXTERNALIZED_COSTS_HDR: str = _section_header("Externalized Costs", 41)
+_KEYSTONE_CROSSINGS_HDR: str = _section_header("Keystone Threshold Crossings", 31)
+_RESILIENCE_ASSESSMENT_HDR: str = _section_header("Resilience Assessment", 38)
+_CARBON_ACCOUNTING_HDR: str = _section_header("Carbon Accounting", 42)
+_CONFIDENCE_BAND_HDR: str = _section_header("Externality with Confidence Band", 28)
+_SUBSTRATE_IMPACT_HDR: str = _section_header("Substrate Impact Assessment", 31)
+_PRICE_DECOMPOSITION_HDR: str = _section_header("Price Decomposition (v0.7 endogenous)", 20)
+_RESTORATION_COSTS_HDR: str = _section_header("Restoration Costs", 42)
+_RECOVERED_SERVICES_HDR: str = _section_header("Recovered Ecosystem Services", 31)
+_PREVENTION_HDR: str = _section_header("Prevention vs Restoration", 34)
+_MATURATION_TIMELINE_HDR: str = _section_header("Maturation Timeline", 40)
+_MATURATION_GAP_HDR: str = _section_header("Maturation Gap", 45)
+_CARBON_RECOVERY_HDR: str = _section_header("Carbon Recovery", 44)
+_SUBSTRATE_CEILING_HDR: str = _section_header("Substrate Restoration Ceiling", 29)
+_PA_SUBSTRATE_HDR: str = _section_header("Prevention Advantage (with substrate)", 21)
+_CARBON_CREDIT_BREAKEVEN_HDR: str = _section_header("Carbon Credit Breakeven", 36)
+_PA_NPV_HDR: str = _section_header("Prevention Advantage (NPV-based)", 26)
+
+# Rule tails of the headers whose titles are only known at report time
+_NPV_RATE_RULE: str = "\u2500" * 33 + "\n"
+_NPV_NO_RATE_LINE: str = "     ) \u2500" + "\u2500" * 49 + "\n"
+_INVESTMENT_RULE: str = "\u2500" * 24 + "\n"
+
+
+def _padded(values, n: int):
+    """Per-agent column extended with 0.0 to length n; returned as-is if long enough."""
+    missing: int = n - len(values)
+    return values if missing <= 0 else list(values) + [0.0] * missing
+
+
+def _step_columns(steps) -> tuple:
+    """
+    Step numbers, resilience zones, irreversibility flags, keystone triggers
+    and depletion ratios of a step sequence, as parallel columns.
+
+    A SimulationTrace already stores these column-wise (row i is step i + 1),
+    so its columns are returned as-is; other sequences are transposed once.
+    """
+    if isinstance(steps, SimulationTrace):
+        return (
+            range(1, len(steps) + 1),
+            steps.resilience_zone,
+            steps.irreversibility_warning,
+            steps.keystone_triggered,
+            steps.depletion_ratio,
+        )
+    return (
+        [s.step for s in steps],
+        [s.resilience_zone for s in steps],
+        [s.irreversibility_warning for s in steps],
+        [s.keystone_triggered for s in steps],
+        [s.depletion_ratio for s in steps],
+    )
+
+
+@lru_cache(maxsize=256)
+def _agent_label(name: str) -> str:
+    """Agent name with its trailing colon, left-padded to the 40-column slot."""
+    return f"{name + ':':<40}"
+
+
+def _agent_cascade_lines(agent: Agent, direct_dmg: float, cascade_dmg: float) -> str:
+    """
+    Cascade breakdown and trophic amplification lines for one agent.
+
+    v0.3 detail under the agent's cost line; empty when neither applies.
+    """
+    text: str = ""
+
+    # Costs are only needed (and formatted) when a cascade is shown
+    if cascade_dmg > 1e-6:
+        weight: float = agent.dependency_weight
+        rate: float = agent.monetary_rate
+        direct_cost: float = direct_dmg * weight * rate
+        cascade_cost: float = cascade_dmg * weight * rate
+        text = (
+            f"    \u2192 Direct: \u20ac{direct_cost:,.0f} | "
+            f"Cascade: \u20ac{cascade_cost:,.0f}\n"
+        )
+
+    # Show trophic amplification for consumers
+    if agent.trophic_level >= 1:
+        # Raw amplification factor (not capped damage), from the shared table
+        amp: float = trophic_amplification_factor(agent.trophic_level)
+        level_name = _LEVEL_NAMES.get(agent.trophic_level, "consumer")
+        text += f"    \u2192 Trophic amplification: {amp:.1f}\u00d7 ({level_name})\n"
+
+    return text
+
 
 def format_report(result: SimulationResult) -> str:
     """
     Format a SimulationResult into a human-readable plain-text externality report.
 
+    v0.8: Results that use no v0.3+ cascade or v0.4+ features take the
+    straight-line _format_report_v01() path; everything else is formatted
+    by _format_report_v04(). The final step is looked up once here and
+    passed down (None when there are no steps).
+
     The report shows:
         - Resource state and depletion
         - Private revenue from extraction
@@ -53,6 +177,29 @@ def format_report(result: SimulationResult) -> str:
     """
     ecosystem: Ecosystem = result.ecosystem
     resource: Resource = ecosystem.resource
+    final_step: Optional[SimulationStep] = result.steps[-1] if result.steps else None
+    if (not ecosystem.interactions
+            and resource.carbon_profile is None
+            and resource.resilience is None
+            and resource.substrate is None
+            and result.extraction_npv is None
+            and (final_step is None
+                 or (final_step.resilience_zone == "green"
+                     and final_step.price_result is None))):
+        return _format_report_v01(result, final_step)
+    return _format_report_v04(result, final_step)
+
+
+def _write_report_head(
+    write, result: SimulationResult, final_step: Optional[SimulationStep]
+) -> bool:
+    """
+    Write the report header, resource state, private gains and per-agent costs.
+
+    Returns whether the final step carries v0.3 cascade data.
+    """
+    ecosystem: Ecosystem = result.ecosystem
+    resource: Resource = ecosystem.resource
     agents: list = ecosystem.agents
 
     final_depletion: float = (
@@ -62,10 +209,10 @@ def format_report(result: SimulationResult) -> str:
 
     # Compute per-agent final costs from the last step
     # agent_costs[i] is the total cost at the final depletion level
-    if result.steps:
-        final_agent_costs: list = result.steps[-1].agent_costs
-        final_direct_damages: list = result.steps[-1].agent_direct_damages
-        final_cascade_damages: list = result.steps[-1].agent_cascade_damages
+    if final_step is not None:
+        final_agent_costs: list = final_step.agent_costs
+        final_direct_damages: list = final_step.agent_direct_damages
+        final_cascade_damages: list = final_step.agent_cascade_damages
     else:
         final_agent_costs = [0.0] * len(agents)
         final_direct_damages = []
@@ -74,122 +221,154 @@ def format_report(result: SimulationResult) -> str:
     # v0.3: Check if cascade data is present (non-empty direct_damages list)
     has_cascade_data: bool = len(final_direct_damages) > 0
 
-    lines: list = []
+    # v0.8: Pad the per-agent columns once so the agent loop indexes directly
+    n_agents: int = len(agents)
+    final_agent_costs = _padded(final_agent_costs, n_agents)
+    if has_cascade_data:
+        final_direct_damages = _padded(final_direct_damages, n_agents)
+        final_cascade_damages = _padded(final_cascade_damages, n_agents)
 
     # Header
-    lines.append(_DOUBLE_LINE)
+    write(_DOUBLE_LINE + "\n")
     title: str = f"GAIA \u2014 Externality Report: {ecosystem.name}"
-    lines.append(f"  {title}")
-    lines.append(_DOUBLE_LINE)
-    lines.append("")
+    write(f"  {title}\n")
+    write(_DOUBLE_LINE + "\n")
+    write("\n")
 
     # Resource state
-    lines.append(
-        f"  {'Resource:':<18} {resource.total_units:>10,} units  ({resource.name})"
+    write(
+        f"  {'Resource:':<18} {resource.total_units:>10,} units  ({resource.name})\n"
     )
-    lines.append(
+    write(
         f"  {'Safe Threshold:':<18} {resource.safe_threshold_units:>10,} units  "
-        f"({resource.safe_threshold_ratio:.1%})"
+        f"({resource.safe_threshold_ratio:.1%})\n"
     )
-    lines.append(
-        f"  {'Units Extracted:':<18} {result.total_units_extracted:>10,}"
+    write(
+        f"  {'Units Extracted:':<18} {result.total_units_extracted:>10,}\n"
     )
-    lines.append(
-        f"  {'Depletion:':<18} {final_depletion:>10.1%}"
+    write(
+        f"  {'Depletion:':<18} {final_depletion:>10.1%}\n"
     )
-    lines.append(
-        f"  {'Ecosystem Health:':<18} {result.final_ecosystem_health:>10.1%}"
+    write(
+        f"  {'Ecosystem Health:':<18} {result.final_ecosystem_health:>10.1%}\n"
     )
-    lines.append("")
+    write("\n")
 
     # Private gains
-    lines.append(f"  \u2500\u2500 Private Gains \u2500" + "\u2500" * 46)
-    lines.append(
-        f"  {'Revenue:':<40} {result.total_private_revenue:>14,.2f}\u20ac"
+    write(_PRIVATE_GAINS_HDR)
+    write(
+        f"  {'Revenue:':<40} {result.total_private_revenue:>14,.2f}\u20ac\n"
     )
-    lines.append("")
+    write("\n")
 
     # Externalized costs
-    lines.append(f"  \u2500\u2500 Externalized Costs \u2500" + "\u2500" * 41)
-
-    agent: Agent
-    for i, agent in enumerate(agents):
-        cost: float = final_agent_costs[i] if i < len(final_agent_costs) else 0.0
-        lines.append(
-            f"  {agent.name + ':':<40} {cost:>14,.2f}\u20ac"
-        )
-        lines.append(f"    \u2192 {agent.description}")
-
-        # v0.3: Cascade breakdown (only when cascade data is present)
-        if has_cascade_data and i < len(final_cascade_damages):
-            direct_dmg: float = final_direct_damages[i]
-            cascade_dmg: float = final_cascade_damages[i]
-            weight: float = agent.dependency_weight
-            rate: float = agent.monetary_rate
-            direct_cost: float = direct_dmg * weight * rate
-            cascade_cost: float = cascade_dmg * weight * rate
-
-            if cascade_dmg > 1e-6:
-                lines.append(
-                    f"    \u2192 Direct: \u20ac{direct_cost:,.0f} | "
-                    f"Cascade: \u20ac{cascade_cost:,.0f}"
-                )
+    write(_EXTERNALIZED_COSTS_HDR)
 
-            # Show trophic amplification for consumers
-            if agent.trophic_level >= 1:
-                # Compute the raw amplification factor (not capped damage)
-                amp: float = (1.0 / 0.15) ** (agent.trophic_level * 0.25)
-                level_names = {
-                    1: "primary consumer",
-                    2: "secondary consumer",
-                    3: "tertiary consumer",
-                }
-                level_name = level_names.get(agent.trophic_level, "consumer")
-                lines.append(
-                    f"    \u2192 Trophic amplification: {amp:.1f}\u00d7 ({level_name})"
-                )
+    # v0.8: Per-agent blocks are built in one comprehension and written once
+    # Without cascade data the damage columns are empty; repeat(0.0) keeps zip
+    # yielding one row per agent (the values are unused in that case)
+    zeros = repeat(0.0)
+    write("".join([
+        f"  {_agent_label(agent.name)} {cost:>14,.2f}\u20ac\n"
+        f"    \u2192 {agent.description}\n"
+        + (
+            _agent_cascade_lines(agent, direct_dmg, cascade_dmg)
+            if has_cascade_data else ""
+        )
+        for agent, cost, direct_dmg, cascade_dmg in zip(
+            agents,
+            final_agent_costs,
+            final_direct_damages if has_cascade_data else zeros,
+            final_cascade_damages if has_cascade_data else zeros,
+        )
+    ]))
 
-    lines.append("")
+    write("\n")
+
+    return has_cascade_data
 
-    # v0.3: Keystone threshold crossings
-    if has_cascade_data:
-        # Collect all keystone crossings across all steps
-        keystone_crossings: dict = {}  # agent_name -> first step number
-        for s in result.steps:
-            for kname in s.keystone_triggered:
-                if kname not in keystone_crossings:
-                    keystone_crossings[kname] = s.step
-        if keystone_crossings:
-            lines.append(
-                f"  \u2500\u2500 Keystone Threshold Crossings \u2500" + "\u2500" * 31
-            )
-            for kname, kstep in sorted(keystone_crossings.items(), key=lambda x: x[1]):
-                depletion_at_cross: float = kstep / resource.total_units
-                lines.append(
-                    f"  \u26a0 {kname}: crossed at step {kstep:,} "
-                    f"({depletion_at_cross:.0%} depletion)"
-                )
-            lines.append("")
 
+def _write_report_totals(write, result: SimulationResult) -> None:
+    """Write the total externality and net social cost lines."""
     # Totals
-    lines.append(
-        f"  {'TOTAL EXTERNALITY:':<40} {result.total_externality_cost:>14,.2f}\u20ac"
+    write(
+        f"  {'TOTAL EXTERNALITY:':<40} {result.total_externality_cost:>14,.2f}\u20ac\n"
     )
-    lines.append(f"  {_SINGLE_LINE}")
+    write(f"  {_SINGLE_LINE}\n")
 
     # Net social cost: revenue - externality
     # Positive = society gained; negative = society lost (net loss)
     net: float = result.net_social_cost
     net_label: str = "NET SOCIAL COST:"
-    lines.append(
-        f"  {net_label:<40} {net:>14,.2f}\u20ac"
+    write(
+        f"  {net_label:<40} {net:>14,.2f}\u20ac\n"
     )
 
+
+def _format_report_v01(
+    result: SimulationResult, final_step: Optional[SimulationStep]
+) -> str:
+    """
+    v0.1 report: no interactions, resilience, carbon, substrate, NPV or pricing.
+
+    No keystone can trigger without interactions, so only the shared head
+    and totals are written.
+    """
+    buf: StringIO = StringIO()
+    write = buf.write
+    _write_report_head(write, result, final_step)
+    _write_report_totals(write, result)
+    write(f"  {_DOUBLE_LINE}")
+    return buf.getvalue()
+
+
+def _format_report_v04(
+    result: SimulationResult, final_step: Optional[SimulationStep]
+) -> str:
+    """Full report: keystone crossings and the v0.4–v0.7 sections."""
+    resource: Resource = result.ecosystem.resource
+
+    buf: StringIO = StringIO()
+    write = buf.write
+    has_cascade_data: bool = _write_report_head(write, result, final_step)
+
+    # v0.8: Step scans read the trace columns; no SimulationStep is built
+    if result.steps:
+        step_numbers, zones, irrev_flags, keystones, depletions = (
+            _step_columns(result.steps)
+        )
+
+    # v0.3: Keystone threshold crossings
+    # Short-circuit: find the first step with a triggered keystone (any()-style,
+    # stops at the first hit); earlier steps cannot contribute a crossing.
+    first_keystone_row = None
+    if has_cascade_data:
+        first_keystone_row = next(
+            (row for row, names in enumerate(keystones) if names), None
+        )
+    if first_keystone_row is not None:
+        # Collect all keystone crossings from the first triggering step onwards
+        keystone_crossings: dict = {}  # agent_name -> first step number
+        record_crossing = keystone_crossings.setdefault
+        for row in range(first_keystone_row, len(keystones)):
+            step: int = step_numbers[row]
+            for kname in keystones[row]:
+                record_crossing(kname, step)
+        write(_KEYSTONE_CROSSINGS_HDR)
+        for kname, kstep in sorted(keystone_crossings.items(), key=lambda x: x[1]):
+            depletion_at_cross: float = kstep / resource.total_units
+            write(
+                f"  \u26a0 {kname}: crossed at step {kstep:,} "
+                f"({depletion_at_cross:.0%} depletion)\n"
+            )
+        write("\n")
+
+    _write_report_totals(write, result)
+
     # v0.4: Resilience Assessment
-    if result.steps and result.steps[-1].resilience_zone != "green":
-        lines.append("")
-        lines.append(f"  \u2500\u2500 Resilience Assessment \u2500" + "\u2500" * 38)
-        final_step = result.steps[-1]
+    if final_step is not None and final_step.resilience_zone != "green":
+        write("\n")
+        write(_RESILIENCE_ASSESSMENT_HDR)
         zone_label = final_step.resilience_zone.upper()
         zone_symbol = {
             "green": "\u2705", "yellow": "\u26a0", "red": "\u26a0\u26a0"
@@ -199,129 +378,126 @@ def format_report(result: SimulationResult) -> str:
             "yellow": "Resilience uncertain",
             "red": "Resilience likely compromised",
         }.get(final_step.resilience_zone, "")
-        lines.append(
-            f"  Current zone:          {zone_symbol} {zone_label} \u2014 {zone_desc}"
+        write(
+            f"  Current zone:          {zone_symbol} {zone_label} \u2014 {zone_desc}\n"
         )
-        lines.append(
-            f"  Model confidence:      {final_step.model_confidence:.0%}"
+        write(
+            f"  Model confidence:      {final_step.model_confidence:.0%}\n"
         )
 
         # Zone transitions
         transitions: list = []
         prev_zone: str = "green"
-        for s in result.steps:
-            if s.resilience_zone != prev_zone:
-                depl_pct = s.depletion_ratio * 100
+        for row, zone in enumerate(zones):
+            if zone != prev_zone:
+                depl_pct = depletions[row] * 100
                 transitions.append(
-                    f"{prev_zone.title()} \u2192 {s.resilience_zone.title()} "
-                    f"at step {s.step:,} ({depl_pct:.0f}% depletion)"
+                    f"{prev_zone.title()} \u2192 {zone.title()} "
+                    f"at step {step_numbers[row]:,} ({depl_pct:.0f}% depletion)"
                 )
-                prev_zone = s.resilience_zone
+                prev_zone = zone
         if transitions:
-            lines.append(f"  Zone transitions:")
+            write(f"  Zone transitions:\n")
             for t in transitions:
-                lines.append(f"    {t}")
+                write(f"    {t}\n")
 
-        # Irreversibility warning
+        # Irreversibility warning: the final flag is set, so the first set
+        # flag exists and list.index finds it in C
         if final_step.irreversibility_warning:
-            irrev_step = None
-            for s in result.steps:
-                if s.irreversibility_warning:
-                    irrev_step = s.step
-                    break
-            if irrev_step is not None:
-                depl_pct = irrev_step / resource.total_units * 100
-                lines.append("")
-                lines.append(
-                    f"  \u26a0 IRREVERSIBILITY WARNING at step {irrev_step:,} "
-                    f"({depl_pct:.0f}% depletion)"
-                )
-                lines.append(
-                    f"    Ecosystem damage may be partially irreversible."
-                )
+            irrev_step: int = step_numbers[irrev_flags.index(True)]
+            depl_pct = irrev_step / resource.total_units * 100
+            write("\n")
+            write(
+                f"  \u26a0 IRREVERSIBILITY WARNING at step {irrev_step:,} "
+                f"({depl_pct:.0f}% depletion)\n"
+            )
+            write(
+                f"    Ecosystem damage may be partially irreversible.\n"
+            )
 
     # v0.4: Carbon Accounting
     if resource.carbon_profile is not None and result.total_units_extracted > 0:
-        lines.append("")
-        lines.append(f"  \u2500\u2500 Carbon Accounting \u2500" + "\u2500" * 42)
+        write("\n")
+        write(_CARBON_ACCOUNTING_HDR)
+        from gaia.carbon import compute_carbon_cost
+
         carbon = compute_carbon_cost(
             resource.carbon_profile,
             result.total_units_extracted,
             remaining_years=80.0,  # default estimate
         )
-        lines.append(
+        write(
             f"  {'Carbon released (biomass+soil):':<40} "
-            f"{carbon['release_tonnes']:>10,.0f} t CO\u2082"
+            f"{carbon['release_tonnes']:>10,.0f} t CO\u2082\n"
         )
-        lines.append(
+        write(
             f"  {'Future absorption foregone:':<40} "
-            f"{carbon['foregone_tonnes_per_year']:>10,.1f} t CO\u2082/yr"
+            f"{carbon['foregone_tonnes_per_year']:>10,.1f} t CO\u2082/yr\n"
         )
-        lines.append(
+        write(
             f"  {'Carbon externality (release):':<40} "
-            f"{carbon['release_cost']:>14,.2f}\u20ac"
+            f"{carbon['release_cost']:>14,.2f}\u20ac\n"
         )
-        lines.append(
+        write(
             f"  {'Carbon externality (foregone):':<40} "
-            f"{carbon['foregone_cost_per_year']:>14,.2f}\u20ac/yr"
+            f"{carbon['foregone_cost_per_year']:>14,.2f}\u20ac/yr\n"
         )
 
     # v0.4: Confidence band on total externality
-    if result.steps and resource.resilience is not None:
-        final_confidence = result.steps[-1].model_confidence
+    if final_step is not None and resource.resilience is not None:
+        final_confidence = final_step.model_confidence
         if final_confidence < 1.0:
+            from gaia.resilience import compute_confidence_band
+
             lower, upper = compute_confidence_band(
                 result.total_externality_cost, final_confidence
             )
-            lines.append("")
-            lines.append(f"  \u2500\u2500 Externality with Confidence Band \u2500" + "\u2500" * 28)
-            lines.append(
-                f"  {'Total Externality:':<40} {result.total_externality_cost:>14,.2f}\u20ac"
+            write("\n")
+            write(_CONFIDENCE_BAND_HDR)
+            write(
+                f"  {'Total Externality:':<40} {result.total_externality_cost:>14,.2f}\u20ac\n"
             )
-            lines.append(
+            write(
                 f"  Confidence band ({final_confidence:.0%}):"
-                f"        {lower:>12,.2f}\u20ac \u2014 {upper:>12,.2f}\u20ac"
+                f"        {lower:>12,.2f}\u20ac \u2014 {upper:>12,.2f}\u20ac\n"
             )
 
     # v0.5: Substrate Impact Assessment
-    if resource.substrate is not None and result.steps:
-        final_step = result.steps[-1]
+    if resource.substrate is not None and final_step is not None:
         if final_step.k_fraction < 1.0:
-            lines.append("")
-            lines.append(
-                f"  \u2500\u2500 Substrate Impact Assessment \u2500" + "\u2500" * 31
-            )
+            write("\n")
+            write(_SUBSTRATE_IMPACT_HDR)
             sub = resource.substrate
-            lines.append(
-                f"  {'Substrate type:':<40} {sub.substrate_type}"
+            write(
+                f"  {'Substrate type:':<40} {sub.substrate_type}\n"
             )
             if sub.soil_depth_cm is not None:
                 # Compute soil lost from substrate erosion trajectory
                 soil_lost_pct: float = (1.0 - final_step.k_fraction) * 100
-                lines.append(
-                    f"  {'Pristine soil depth:':<40} {sub.soil_depth_cm:>10.1f} cm"
+                write(
+                    f"  {'Pristine soil depth:':<40} {sub.soil_depth_cm:>10.1f} cm\n"
                 )
-                lines.append(
-                    f"  {'Capacity lost:':<40} {soil_lost_pct:>10.1f}%"
+                write(
+                    f"  {'Capacity lost:':<40} {soil_lost_pct:>10.1f}%\n"
                 )
             if sub.sediment_stability is not None:
                 stability_lost_pct: float = (1.0 - final_step.k_fraction) * 100
-                lines.append(
-                    f"  {'Pristine stability:':<40} {sub.sediment_stability:>10.2f}"
+                write(
+                    f"  {'Pristine stability:':<40} {sub.sediment_stability:>10.2f}\n"
                 )
-                lines.append(
-                    f"  {'Capacity lost:':<40} {stability_lost_pct:>10.1f}%"
+                write(
+                    f"  {'Capacity lost:':<40} {stability_lost_pct:>10.1f}%\n"
                 )
-            lines.append("")
-            lines.append(
-                f"  {'Pristine K:':<40} {resource.total_units:>10,} units"
+            write("\n")
+            write(
+                f"  {'Pristine K:':<40} {resource.total_units:>10,} units\n"
             )
-            lines.append(
-                f"  {'Current K:':<40} {final_step.effective_k:>10,} units"
+            write(
+                f"  {'Current K:':<40} {final_step.effective_k:>10,} units\n"
             )
             capacity_lost: int = resource.total_units - final_step.effective_k
-            lines.append(
-                f"  {'Capacity lost permanently:':<40} {capacity_lost:>10,} units"
+            write(
+                f"  {'Capacity lost permanently:':<40} {capacity_lost:>10,} units\n"
             )
 
             # Recovery timeline
@@ -335,119 +511,115 @@ def format_report(result: SimulationResult) -> str:
                 )
             recovery_years: float = compute_substrate_recovery_years(sub_state)
             if recovery_years < float("inf"):
-                lines.append(
-                    f"  {'Years to pristine substrate:':<40} {recovery_years:>10,.0f} years"
+                write(
+                    f"  {'Years to pristine substrate:':<40} {recovery_years:>10,.0f} years\n"
                 )
             else:
-                lines.append(
-                    f"  {'Years to pristine substrate:':<40} {'N/A':>10}"
+                write(
+                    f"  {'Years to pristine substrate:':<40} {'N/A':>10}\n"
                 )
 
     # v0.6: NPV Analysis
     if result.extraction_npv is not None:
         npv = result.extraction_npv
         discount = resource.discount
-        lines.append("")
-        lines.append(
-            f"  \u2500\u2500 NPV Analysis ({npv.horizon}-year horizon"
+        write("\n")
+        write(
+            f"  \u2500\u2500 NPV Analysis ({npv.horizon}-year horizon\n"
         )
         if discount is not None:
             ramsey_rate: float = discount.delta + discount.eta * discount.g
-            lines.append(
+            write(
                 f"     {ramsey_rate:.1%} discount rate) \u2500"
-                + "\u2500" * 33
+                + _NPV_RATE_RULE
             )
-            lines.append("")
-            lines.append(
+            write("\n")
+            write(
                 f"  Ramsey components: "
                 f"\u03b4={discount.delta:.1%}, "
                 f"\u03b7={discount.eta:.2f}, "
-                f"g={discount.g:.1%}"
+                f"g={discount.g:.1%}\n"
             )
-            lines.append(
+            write(
                 f"  Scarcity uplift: {discount.scarcity_rate:.1%}/yr "
-                f"on ecosystem services"
+                f"on ecosystem services\n"
             )
-            lines.append(
+            write(
                 f"  Carbon price: \u20ac{discount.carbon_price_current:,.0f}/t "
-                f"growing at {discount.carbon_price_growth:.1%}/yr"
+                f"growing at {discount.carbon_price_growth:.1%}/yr\n"
             )
         else:
-            lines.append(f"     ) \u2500" + "\u2500" * 49)
+            write(_NPV_NO_RATE_LINE)
 
-        lines.append("")
-        lines.append(f"  Externality NPV breakdown:")
-        lines.append(
+        write("\n")
+        write(f"  Externality NPV breakdown:\n")
+        write(
             f"    {'Direct ecosystem services:':<36} "
-            f"\u20ac{npv.direct:>14,.0f}"
+            f"\u20ac{npv.direct:>14,.0f}\n"
         )
-        lines.append(
+        write(
             f"    {'Carbon released:':<36} "
-            f"\u20ac{npv.carbon_release:>14,.0f}"
+            f"\u20ac{npv.carbon_release:>14,.0f}\n"
         )
-        lines.append(
+        write(
             f"    {'Foregone absorption:':<36} "
-            f"\u20ac{npv.carbon_foregone:>14,.0f}"
+            f"\u20ac{npv.carbon_foregone:>14,.0f}\n"
         )
-        lines.append(
+        write(
             f"    {'Substrate damage (permanent):':<36} "
-            f"\u20ac{npv.substrate_damage:>14,.0f}"
+            f"\u20ac{npv.substrate_damage:>14,.0f}\n"
         )
-        lines.append(f"    {'':=<36} {'':=>15}")
-        lines.append(
+        write(f"    {'':=<36} {'':=>15}\n")
+        write(
             f"    {'Total extraction NPV:':<36} "
-            f"\u20ac{npv.total:>14,.0f}"
+            f"\u20ac{npv.total:>14,.0f}\n"
         )
 
         # Undiscounted comparison
         undiscounted_total: float = result.total_externality_cost
         if undiscounted_total > 0.0:
             discount_effect: float = (npv.total - undiscounted_total) / undiscounted_total
-            lines.append("")
-            lines.append(
+            write("\n")
+            write(
                 f"  {'For comparison (undiscounted):':<40} "
-                f"\u20ac{undiscounted_total:>12,.0f}"
+                f"\u20ac{undiscounted_total:>12,.0f}\n"
             )
-            lines.append(
+            write(
                 f"  {'Discount effect:':<40} "
-                f"{discount_effect:>12.1%}"
+                f"{discount_effect:>12.1%}\n"
             )
 
     # v0.7: Price Decomposition
-    if result.steps:
-        final_step = result.steps[-1]
+    if final_step is not None:
         if final_step.price_result is not None:
             pr = final_step.price_result
-            lines.append("")
-            lines.append(
-                f"  \u2500\u2500 Price Decomposition (v0.7 endogenous) \u2500"
-                + "\u2500" * 20
-            )
-            lines.append(
+            write("\n")
+            write(_PRICE_DECOMPOSITION_HDR)
+            write(
                 f"  Solver: {'converged' if pr.converged else 'FAILED'}"
                 f" in {pr.iterations} iterations"
-                f"  (spectral radius {pr.spectral_radius:.4f})"
+                f"  (spectral radius {pr.spectral_radius:.4f})\n"
             )
-            lines.append("")
-            lines.append(
+            write("\n")
+            write(
                 f"  {'Agent':<24} {'Price':>12} "
-                f"{'Scarcity':>10} {'Demand':>10}"
+                f"{'Scarcity':>10} {'Demand':>10}\n"
             )
-            lines.append(f"  {_SINGLE_LINE}")
+            write(f"  {_SINGLE_LINE}\n")
             for agent_name in pr.prices:
                 price_val: float = pr.prices[agent_name]
                 scarcity_m: float = pr.scarcity_multipliers.get(agent_name, 1.0)
                 demand_m: float = pr.demand_multipliers.get(agent_name, 1.0)
-                lines.append(
+                write(
                     f"  {agent_name:<24} "
                     f"\u20ac{price_val:>10,.0f} "
                     f"{scarcity_m:>10.2f}x "
-                    f"{demand_m:>10.2f}x"
+                    f"{demand_m:>10.2f}x\n"
                 )
 
-    lines.append(f"  {_DOUBLE_LINE}")
+    write(f"  {_DOUBLE_LINE}")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def format_restoration_report(result: RestorationResult) -> str:
@@ -487,285 +659,255 @@ def format_restoration_report(result: RestorationResult) -> str:
         final_service_values: list = result.steps[-1].agent_service_values
     else:
         final_service_values = [0.0] * len(agents)
+    final_service_values = _padded(final_service_values, len(agents))
 
-    lines: list = []
+    buf: StringIO = StringIO()
+    write = buf.write
 
     # Header
-    lines.append(_DOUBLE_LINE)
+    write(_DOUBLE_LINE + "\n")
     title: str = f"GAIA \u2014 Restoration Report: {ecosystem.name}"
-    lines.append(f"  {title}")
-    lines.append(_DOUBLE_LINE)
-    lines.append("")
+    write(f"  {title}\n")
+    write(_DOUBLE_LINE + "\n")
+    write("\n")
 
     # Resource state
-    lines.append(
-        f"  {'Resource:':<28} {resource.total_units:>10,} units  ({resource.name})"
+    write(
+        f"  {'Resource:':<28} {resource.total_units:>10,} units  ({resource.name})\n"
     )
-    lines.append(
-        f"  {'Units Restored:':<28} {result.total_units_restored:>10,}"
+    write(
+        f"  {'Units Restored:':<28} {result.total_units_restored:>10,}\n"
     )
-    lines.append(
-        f"  {'Restoration Coverage:':<28} {restoration_ratio:>10.1%}  of total capacity"
+    write(
+        f"  {'Restoration Coverage:':<28} {restoration_ratio:>10.1%}  of total capacity\n"
     )
-    lines.append(
-        f"  {'Final Ecosystem Health:':<28} {result.final_ecosystem_health:>10.1%}"
+    write(
+        f"  {'Final Ecosystem Health:':<28} {result.final_ecosystem_health:>10.1%}\n"
     )
-    lines.append("")
+    write("\n")
 
     # Restoration cost breakdown
-    lines.append(f"  \u2500\u2500 Restoration Costs \u2500" + "\u2500" * 42)
-    lines.append(
-        f"  {'Planting cost/unit:':<40} {cost.planting_cost_per_unit:>10,.2f}\u20ac"
+    write(_RESTORATION_COSTS_HDR)
+    write(
+        f"  {'Planting cost/unit:':<40} {cost.planting_cost_per_unit:>10,.2f}\u20ac\n"
     )
-    lines.append(
-        f"  {'Maintenance/unit/year:':<40} {cost.annual_maintenance_per_unit:>10,.2f}\u20ac"
+    write(
+        f"  {'Maintenance/unit/year:':<40} {cost.annual_maintenance_per_unit:>10,.2f}\u20ac\n"
     )
-    lines.append(
-        f"  {'Maintenance years:':<40} {cost.maintenance_years:>10}"
+    write(
+        f"  {'Maintenance years:':<40} {cost.maintenance_years:>10}\n"
     )
-    lines.append(
-        f"  {'Total cost/unit:':<40} {cost.total_cost_per_unit:>10,.2f}\u20ac"
+    write(
+        f"  {'Total cost/unit:':<40} {cost.total_cost_per_unit:>10,.2f}\u20ac\n"
     )
-    lines.append(
-        f"  {'TOTAL RESTORATION COST:':<40} {result.total_restoration_cost:>14,.2f}\u20ac"
+    write(
+        f"  {'TOTAL RESTORATION COST:':<40} {result.total_restoration_cost:>14,.2f}\u20ac\n"
     )
-    lines.append("")
+    write("\n")
 
     # Recovered ecosystem services
-    lines.append(f"  \u2500\u2500 Recovered Ecosystem Services \u2500" + "\u2500" * 31)
+    write(_RECOVERED_SERVICES_HDR)
 
-    agent: Agent
-    for i, agent in enumerate(agents):
-        svc: float = final_service_values[i] if i < len(final_service_values) else 0.0
-        lines.append(
-            f"  {agent.name + ':':<40} {svc:>14,.2f}\u20ac"
-        )
-        lines.append(f"    \u2192 {agent.description}")
+    # v0.8: Per-agent blocks are built in one comprehension and written once
+    write("".join([
+        f"  {_agent_label(agent.name)} {svc:>14,.2f}\u20ac\n"
+        f"    \u2192 {agent.description}\n"
+        for agent, svc in zip(agents, final_service_values)
+    ]))
 
-    lines.append("")
+    write("\n")
 
     # Totals
-    lines.append(
-        f"  {'TOTAL RECOVERED VALUE:':<40} {result.total_recovered_value:>14,.2f}\u20ac"
+    write(
+        f"  {'TOTAL RECOVERED VALUE:':<40} {result.total_recovered_value:>14,.2f}\u20ac\n"
     )
-    lines.append(f"  {_SINGLE_LINE}")
-    lines.append(
-        f"  {'NET RESTORATION VALUE:':<40} {result.net_restoration_value:>14,.2f}\u20ac"
+    write(f"  {_SINGLE_LINE}\n")
+    write(
+        f"  {'NET RESTORATION VALUE:':<40} {result.net_restoration_value:>14,.2f}\u20ac\n"
     )
-    lines.append("")
+    write("\n")
 
     # Prevention advantage
-    lines.append(f"  \u2500\u2500 Prevention vs Restoration \u2500" + "\u2500" * 34)
-    lines.append(
+    write(_PREVENTION_HDR)
+    write(
         f"  Prevention is {result.prevention_advantage:.2f}\u00d7 cheaper than "
-        f"destroy\u2011then\u2011restore."
+        f"destroy\u2011then\u2011restore.\n"
     )
-    lines.append(
+    write(
         f"  (Foregone revenue + restoration cost) / foregone revenue = "
-        f"{result.prevention_advantage:.2f}"
+        f"{result.prevention_advantage:.2f}\n"
     )
 
-    # v0.4: Maturation Timeline
+    # v0.4: Maturation Timeline (v0.8: each section is one template, one write)
     if result.maturation_timeline:
-        lines.append("")
-        lines.append(f"  \u2500\u2500 Maturation Timeline \u2500" + "\u2500" * 40)
-        lines.append(
-            f"  {'Years to first services:':<40} "
-            f"{result.years_to_pioneer:>10.0f} years"
-        )
-        lines.append(
-            f"  {'Years to 50% service recovery:':<40} "
-            f"{result.years_to_50pct:>10.0f} years"
-        )
-        lines.append(
-            f"  {'Years to 90% service recovery:':<40} "
-            f"{result.years_to_90pct:>10.0f} years"
-        )
+        write(f"""
+{_MATURATION_TIMELINE_HDR}\
+  {'Years to first services:':<40} {result.years_to_pioneer:>10.0f} years
+  {'Years to 50% service recovery:':<40} {result.years_to_50pct:>10.0f} years
+  {'Years to 90% service recovery:':<40} {result.years_to_90pct:>10.0f} years
 
-        lines.append("")
-        lines.append(f"  \u2500\u2500 Maturation Gap \u2500" + "\u2500" * 45)
-        lines.append(
-            f"  {'Lost services during maturation:':<40} "
-            f"{result.total_maturation_gap:>14,.2f}\u20ac"
-        )
-        lines.append(
-            f"  (accumulated externality while waiting for succession)"
-        )
-        lines.append("")
-        lines.append(
-            f"  This cost is IN ADDITION to restoration costs."
-        )
-        lines.append(
-            f"  True prevention advantage: restoration_cost + maturation_gap"
-        )
+{_MATURATION_GAP_HDR}\
+  {'Lost services during maturation:':<40} {result.total_maturation_gap:>14,.2f}\u20ac
+  (accumulated externality while waiting for succession)
+
+  This cost is IN ADDITION to restoration costs.
+  True prevention advantage: restoration_cost + maturation_gap
+""")
 
     # v0.4: Carbon Recovery
     if (result.maturation_timeline
             and ecosystem.resource.carbon_profile is not None):
-        lines.append("")
-        lines.append(f"  \u2500\u2500 Carbon Recovery \u2500" + "\u2500" * 44)
         final_mat = result.maturation_timeline[-1]
         co2_label = "Cumulative CO\u2082 absorbed:"
-        lines.append(
-            f"  {co2_label:<40} "
-            f"{final_mat.cumulative_carbon_absorbed:>10,.0f} t CO\u2082"
-        )
-        lines.append(
-            f"  {'Over':<5} {len(result.maturation_timeline)} years of maturation"
-        )
+        write(f"""
+{_CARBON_RECOVERY_HDR}\
+  {co2_label:<40} {final_mat.cumulative_carbon_absorbed:>10,.0f} t CO\u2082
+  {'Over':<5} {len(result.maturation_timeline)} years of maturation
+""")
 
     # v0.5: Substrate Restoration Ceiling
     if resource.substrate is not None and result.substrate_ceiling < 1.0:
-        lines.append("")
-        lines.append(
-            f"  \u2500\u2500 Substrate Restoration Ceiling \u2500" + "\u2500" * 29
-        )
+        write("\n")
+        write(_SUBSTRATE_CEILING_HDR)
         ceiling_pct: float = result.substrate_ceiling * 100
-        lines.append(
-            f"  {'Max recoverable services:':<40} {ceiling_pct:>10.1f}% of pristine"
+        write(
+            f"  {'Max recoverable services:':<40} {ceiling_pct:>10.1f}% of pristine\n"
         )
-        lines.append(
-            f"  Biological restoration capped at substrate ceiling."
+        write(
+            f"  Biological restoration capped at substrate ceiling.\n"
         )
         if result.substrate_recovery_years > 0:
             if result.substrate_recovery_years < float("inf"):
-                lines.append(
+                write(
                     f"  {'Substrate recovery time:':<40} "
-                    f"{result.substrate_recovery_years:>10,.0f} years"
+                    f"{result.substrate_recovery_years:>10,.0f} years\n"
                 )
             else:
-                lines.append(
-                    f"  {'Substrate recovery time:':<40} {'N/A':>10}"
+                write(
+                    f"  {'Substrate recovery time:':<40} {'N/A':>10}\n"
                 )
 
         # Enhanced prevention advantage
         if result.prevention_advantage_with_substrate > result.prevention_advantage:
-            lines.append("")
-            lines.append(
-                f"  \u2500\u2500 Prevention Advantage (with substrate) \u2500"
-                + "\u2500" * 21
-            )
-            lines.append(
+            write("\n")
+            write(_PA_SUBSTRATE_HDR)
+            write(
                 f"  {'Biological only:':<40} "
-                f"{result.prevention_advantage:>10.2f}\u00d7"
+                f"{result.prevention_advantage:>10.2f}\u00d7\n"
             )
-            lines.append(
+            write(
                 f"  {'Including substrate loss:':<40} "
-                f"{result.prevention_advantage_with_substrate:>10.2f}\u00d7"
+                f"{result.prevention_advantage_with_substrate:>10.2f}\u00d7\n"
             )
 
     # v0.6: Investment Analysis (NPV)
     if result.restoration_npv is not None:
         rnpv = result.restoration_npv
-        lines.append("")
-        lines.append(
+        write("\n")
+        write(
             f"  \u2500\u2500 Investment Analysis (NPV, {rnpv.horizon}-year) \u2500"
-            + "\u2500" * 24
+            + _INVESTMENT_RULE
         )
-        lines.append(
+        write(
             f"  {'Restoration cost (NPV):':<40} "
-            f"\u20ac{rnpv.cost:>14,.0f}"
+            f"\u20ac{rnpv.cost:>14,.0f}\n"
         )
-        lines.append(
+        write(
             f"  {'Service recovery (NPV):':<40} "
-            f"\u20ac{rnpv.service_benefits:>14,.0f}"
+            f"\u20ac{rnpv.service_benefits:>14,.0f}\n"
         )
-        lines.append(
+        write(
             f"  {'Carbon absorption (NPV):':<40} "
-            f"\u20ac{rnpv.carbon_benefits:>14,.0f}"
+            f"\u20ac{rnpv.carbon_benefits:>14,.0f}\n"
         )
-        lines.append(
+        write(
             f"  {'Total benefits (NPV):':<40} "
-            f"\u20ac{rnpv.total_benefits:>14,.0f}"
+            f"\u20ac{rnpv.total_benefits:>14,.0f}\n"
         )
-        lines.append(f"  {_SINGLE_LINE}")
-        lines.append(
+        write(f"  {_SINGLE_LINE}\n")
+        write(
             f"  {'Net Present Value:':<40} "
-            f"\u20ac{rnpv.net_present_value:>14,.0f}"
+            f"\u20ac{rnpv.net_present_value:>14,.0f}\n"
         )
-        lines.append(
+        write(
             f"  {'ROI (benefits / cost):':<40} "
-            f"{rnpv.roi:>14.2f}x"
+            f"{rnpv.roi:>14.2f}x\n"
         )
         if rnpv.carbon_payback_years is not None:
-            lines.append(
+            write(
                 f"  {'Carbon payback:':<40} "
-                f"{rnpv.carbon_payback_years:>14} years"
+                f"{rnpv.carbon_payback_years:>14} years\n"
             )
         else:
-            lines.append(
+            write(
                 f"  {'Carbon payback:':<40} "
-                f"{'N/A':>14}"
+                f"{'N/A':>14}\n"
             )
 
     # v0.6: Carbon Credit Breakeven
     if result.carbon_breakeven is not None:
         cb = result.carbon_breakeven
-        lines.append("")
-        lines.append(
-            f"  \u2500\u2500 Carbon Credit Breakeven \u2500" + "\u2500" * 36
-        )
-        lines.append(
+        write("\n")
+        write(_CARBON_CREDIT_BREAKEVEN_HDR)
+        write(
             f"  {'Breakeven price:':<40} "
-            f"\u20ac{cb.breakeven_price:>12,.2f}/t CO\u2082"
+            f"\u20ac{cb.breakeven_price:>12,.2f}/t CO\u2082\n"
         )
-        lines.append(
+        write(
             f"  {'Current EU ETS price:':<40} "
-            f"\u20ac{cb.current_price:>12,.2f}/t CO\u2082"
+            f"\u20ac{cb.current_price:>12,.2f}/t CO\u2082\n"
         )
-        lines.append(
+        write(
             f"  {'Gap to current:':<40} "
-            f"\u20ac{cb.gap_to_current:>12,.2f}/t CO\u2082"
+            f"\u20ac{cb.gap_to_current:>12,.2f}/t CO\u2082\n"
         )
         profitable_label: str = "Yes" if cb.profitable_at_current else "No"
-        lines.append(
+        write(
             f"  {'Profitable at current price:':<40} "
-            f"{profitable_label:>14}"
+            f"{profitable_label:>14}\n"
         )
         if cb.projected_breakeven_year is not None:
-            lines.append(
+            write(
                 f"  {'Projected breakeven year:':<40} "
-                f"{cb.projected_breakeven_year:>14}"
+                f"{cb.projected_breakeven_year:>14}\n"
             )
         else:
-            lines.append(
+            write(
                 f"  {'Projected breakeven year:':<40} "
-                f"{'N/A':>14}"
+                f"{'N/A':>14}\n"
             )
 
     # v0.6: Prevention Advantage V06
     if result.prevention_advantage_v06 is not None:
         pa = result.prevention_advantage_v06
-        lines.append("")
-        lines.append(
-            f"  \u2500\u2500 Prevention Advantage (NPV-based) \u2500" + "\u2500" * 26
-        )
-        lines.append(
+        write("\n")
+        write(_PA_NPV_HDR)
+        write(
             f"  {'PA simple (undiscounted):':<40} "
-            f"{pa.pa_simple:>14.2f}x"
+            f"{pa.pa_simple:>14.2f}x\n"
         )
-        lines.append(
+        write(
             f"  {'PA with carbon:':<40} "
-            f"{pa.pa_with_carbon:>14.2f}x"
+            f"{pa.pa_with_carbon:>14.2f}x\n"
         )
-        lines.append(
+        write(
             f"  {'PA with substrate:':<40} "
-            f"{pa.pa_with_substrate:>14.2f}x"
+            f"{pa.pa_with_substrate:>14.2f}x\n"
         )
-        lines.append(
+        write(
             f"  {'PA full (all-inclusive NPV):':<40} "
-            f"{pa.pa_full:>14.2f}x"
+            f"{pa.pa_full:>14.2f}x\n"
         )
-        lines.append("")
-        lines.append(
+        write("\n")
+        write(
             f"  {'NPV prevention cost (revenue):':<40} "
-            f"\u20ac{pa.npv_prevention_cost:>14,.0f}"
+            f"\u20ac{pa.npv_prevention_cost:>14,.0f}\n"
         )
-        lines.append(
+        write(
             f"  {'NPV restoration total:':<40} "
-            f"\u20ac{pa.npv_restoration_total:>14,.0f}"
+            f"\u20ac{pa.npv_restoration_total:>14,.0f}\n"
         )
 
-    lines.append(f"  {_DOUBLE_LINE}")
+    write(f"  {_DOUBLE_LINE}")
 
-    return "\n".join(lines)
+    return buf.getvalue()
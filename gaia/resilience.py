@@ -80,6 +80,65 @@ def compute_resilience_zone(
     return (zone, confidence, irreversibility)
 
 
+def compute_resilience_zone_batch(
+    remaining_fractions,
+    threshold: float,
+    config: ResilienceConfig,
+) -> tuple:
+    """Compute resilience zones for a whole trajectory in one call.
+
+    Batch form of compute_resilience_zone() (v0.8): the zone boundaries and
+    confidence spans are derived from threshold and config once, then each
+    remaining fraction is classified with the same arithmetic as the scalar
+    function, so every value is identical to a per-sample call.
+
+    Args:
+        remaining_fractions: Iterable of remaining fractions
+            (1.0 - depletion_ratio), one per sample.
+        threshold: The safe extraction threshold (resource.safe_threshold_ratio).
+        config: ResilienceConfig with zone widths and confidence values.
+
+    Returns:
+        Tuple of (zones: list, confidences: list, irreversibility_warnings: list),
+        index-aligned with remaining_fractions.
+    """
+    safe_remaining: float = 1.0 - threshold
+    width: float = config.warning_zone_width
+    warning_start: float = safe_remaining + width
+    green: float = config.confidence_green
+    yellow: float = config.confidence_yellow
+    red: float = config.confidence_red
+    green_span: float = green - yellow
+    red_span: float = yellow - red
+    irreversibility_ratio: float = config.irreversibility_flag_ratio
+
+    zones: list = []
+    confidences: list = []
+    warnings: list = []
+    for remaining_fraction in remaining_fractions:
+        if remaining_fraction > warning_start:
+            zones.append("green")
+            confidences.append(green)
+        elif remaining_fraction > safe_remaining:
+            zones.append("yellow")
+            if width > 0.0:
+                confidences.append(
+                    green - (warning_start - remaining_fraction) / width * green_span
+                )
+            else:
+                confidences.append(yellow)
+        else:
+            zones.append("red")
+            if safe_remaining > 0.0:
+                t: float = (safe_remaining - remaining_fraction) / safe_remaining
+                confidences.append(yellow - (t if t < 1.0 else 1.0) * red_span)
+            else:
+                confidences.append(red)
+        warnings.append(1.0 - remaining_fraction > irreversibility_ratio)
+
+    return (zones, confidences, warnings)
+
+
 def compute_confidence_band(
     cost: float,
     confidence: float,
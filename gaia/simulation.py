@@ -18,8 +18,15 @@ v0.4: Resilience zone tagging in extraction, maturation pass in restoration.
 v0.5: Phase 3.5 substrate degradation in extraction, substrate ceiling in restoration.
 v0.6: NPV computation on SimulationResult and RestorationResult when DiscountConfig present.
 v0.7: Per-step price solver when PricingConfig present; dynamic prices replace monetary_rate.
+v0.8: run_extraction_batch() runs independent extractions in worker processes.
 """
 
+import multiprocessing
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from operator import sub
 from typing import List, Optional
 
 from gaia.models import (
@@ -27,15 +34,18 @@ from gaia.models import (
     Ecosystem,
     RestorationCost,
     RestorationResult,
-    RestorationStep,
+    RestorationTrace,
     SimulationResult,
-    SimulationStep,
+    SimulationTrace,
     SubstrateState,
     SuccessionCurve,
 )
-from gaia.propagation import compute_trophic_amplification, propagate_interactions
-from gaia.recovery import RecoveryFunc
-from gaia.resilience import compute_resilience_zone
+from gaia.propagation import (
+    propagate_interactions_indexed,
+    trophic_amplification_factor,
+)
+from gaia.recovery import group_shared_curves
+from gaia.resilience import compute_resilience_zone_batch
 from gaia.substrate import (
     compute_capacity_fraction,
     compute_substrate_recovery_years,
@@ -49,9 +59,13 @@ from gaia.succession import (
 )
 from gaia.validation import validate_ecosystem, validate_extraction
 
-# v0.8: Try importing Cython-optimized simulation loop
+# v0.8: Try importing Cython-optimized simulation loops and Phase 3 kernel
 try:
-    from gaia.cy.simulation_cy import extraction_loop_cy
+    from gaia.cy.simulation_cy import (
+        extraction_loop_cy,
+        restoration_loop_cy,
+        step_costs_cy,
+    )
     _HAS_CYTHON = True
 except ImportError:
     _HAS_CYTHON = False
@@ -60,12 +74,20 @@ except ImportError:
 _BULK_DENSITY_KG_M3: float = 1300.0
 _T_HA_TO_MM_FACTOR: float = 10.0 / _BULK_DENSITY_KG_M3
 
+# v0.8: Steps per block of column-wise Phase 1 evaluation (see _iter_direct_rows)
+_PHASE1_BLOCK: int = 4096
+
+# v0.8: Most (total_units, packed) column sets kept in Ecosystem.damage_memo
+_DAMAGE_MEMO_MAX_ENTRIES: int = 2
+
 
 def _extract_damage_params(damage_fn) -> tuple:
-    """Extract damage function parameters from a closure for the Cython loop.
+    """Extract damage function parameters for the Cython loop.
 
-    Inspects the closure variables to determine function type and extract
-    the pre-computed parameters. Returns a 5-tuple:
+    Uses the ``kernel_params`` attribute published by the gaia.damage
+    factories when present; otherwise inspects the closure variables to
+    determine function type and extract the pre-computed parameters.
+    Returns a 5-tuple:
         (kind, p1, p2, p3, p4)
 
     Kind values:
@@ -76,6 +98,10 @@ def _extract_damage_params(damage_fn) -> tuple:
     Falls back to kind=-1 if the closure cannot be inspected, which signals
     the caller to use the pure-Python path.
     """
+    kernel_params = getattr(damage_fn, 'kernel_params', None)
+    if kernel_params is not None:
+        return kernel_params
+
     closure = getattr(damage_fn, '__closure__', None)
     if closure is None:
         return (-1, 0.0, 0.0, 0.0, 0.0)
@@ -98,6 +124,176 @@ def _extract_damage_params(damage_fn) -> tuple:
         return (-1, 0.0, 0.0, 0.0, 0.0)
 
 
+def _iter_direct_rows(
+    curve_groups: list, trophic_amps: list, denominator: int, n_steps: int
+):
+    """
+    Yield the Phase 1 row (one value per agent) for steps 1..n_steps.
+
+    Each shared curve is evaluated over a whole block of ratios with one
+    map() call (column-wise), trophic amplification is applied per column,
+    and the columns are transposed into per-step rows. Blocks of
+    _PHASE1_BLOCK steps bound the transient memory.
+
+    Args:
+        curve_groups: (function, agent_indices) pairs from group_shared_curves().
+        trophic_amps: Per-agent amplification factor, or None for agents
+            that are not amplified.
+        denominator: The ratio for step s is s / denominator.
+        n_steps: Number of steps to yield.
+    """
+    for start in range(1, n_steps + 1, _PHASE1_BLOCK):
+        stop: int = min(start + _PHASE1_BLOCK, n_steps + 1)
+        yield from map(
+            list,
+            zip(*_direct_columns(curve_groups, trophic_amps, denominator, start, stop)),
+        )
+
+
+def _trophic_amps(trophic_levels: list) -> list:
+    """
+    Phase 1 amplification factor per agent, looked up once per run instead
+    of pow() per step; None for agents below trophic level 1, which are not
+    amplified.
+    """
+    return [
+        trophic_amplification_factor(lvl) if lvl >= 1 else None
+        for lvl in trophic_levels
+    ]
+
+
+def _shifted_difference(cumulative: array) -> array:
+    """
+    Marginal column from a cumulative column, computed once after a loop:
+    marginal[s] = cumulative[s] - cumulative[s - 1], with cumulative[-1] = 0.
+    """
+    return array("d", map(sub, cumulative, chain((0.0,), cumulative)))
+
+
+def _direct_columns(
+    curve_groups: list, trophic_amps: list, denominator: int, start: int, stop: int
+) -> list:
+    """
+    Phase 1 columns (one list per agent) for steps start..stop - 1.
+
+    Agents that share a curve and are not amplified share one column list.
+    """
+    ratios: list = [units / denominator for units in range(start, stop)]
+    columns: list = [None] * len(trophic_amps)
+    for curve_fn, members in curve_groups:
+        shared: list = list(map(curve_fn, ratios))
+        for i in members:
+            amp = trophic_amps[i]
+            if amp is None:
+                columns[i] = shared
+            else:
+                # Amplify, capped at 1.0
+                columns[i] = [
+                    1.0 if value > 1.0 else value
+                    for value in [v * amp for v in shared]
+                ]
+    return columns
+
+
+def _memoized_damage_columns(
+    ecosystem: Ecosystem, trophic_amps: list, n_steps: int
+) -> list:
+    """
+    Phase 1 damage columns covering at least steps 1..n_steps, memoized.
+
+    Damage functions are pure, so for fixed agents the direct damage of
+    step s depends only on s / total_units. Columns are kept in
+    ecosystem.damage_memo keyed by total_units and extended when a later
+    run extracts further, so repeated runs on one ecosystem (sweeps over
+    units_to_extract) evaluate each step's damage once. Agents sharing a
+    curve share one memoized column. The memo is only valid for the agents
+    it was built from and is cleared with the ecosystem's derived views
+    (see Ecosystem.clear_derived()); agent_columns is read first so that
+    a replaced agents list is noticed before the memo is consulted. At
+    most _DAMAGE_MEMO_MAX_ENTRIES column sets are kept; the oldest is
+    dropped first.
+
+    When the ecosystem sets trace_precision, the memoized columns are packed
+    into array('d'): about a quarter of the memory of lists of floats, at
+    the cost of boxing each value again per run. They stay double precision,
+    so results do not depend on the setting.
+
+    The returned columns are shared; callers only read them.
+    """
+    damage_functions: list = ecosystem.agent_columns.damage_functions
+    total_units: int = ecosystem.resource.total_units
+    packed: bool = ecosystem.trace_precision is not None
+    memo: dict = ecosystem.damage_memo
+    key: tuple = (total_units, packed)
+    columns: Optional[list] = memo.get(key)
+    done: int = len(columns[0]) if columns else 0
+    if done < n_steps:
+        extension: list = _direct_columns(
+            group_shared_curves(damage_functions),
+            trophic_amps,
+            total_units,
+            done + 1,
+            n_steps + 1,
+        )
+        # Concatenate into fresh columns, once per distinct (old, new) pair
+        merged: dict = {}
+        previous: list = columns if columns else [None] * len(extension)
+        columns = []
+        for old, new in zip(previous, extension):
+            pair: tuple = (id(old), id(new))
+            column = merged.get(pair)
+            if column is None:
+                if packed:
+                    new = array("d", new)
+                column = new if old is None else old + new
+                merged[pair] = column
+            columns.append(column)
+        if key not in memo and len(memo) >= _DAMAGE_MEMO_MAX_ENTRIES:
+            del memo[next(iter(memo))]
+        memo[key] = columns
+    return columns
+
+
+def _step_costs(values: list, weights: list, rates: list) -> tuple:
+    """
+    Phase 3 kernel for one step: per-agent values, their total and the
+    weighted sum that ecosystem health is derived from.
+
+        weighted[i]    = values[i] * weights[i]
+        agent_value[i] = weighted[i] * rates[i]
+        total          = sum of agent_value[i], left to right
+        weighted_sum   = sum of weighted[i], left to right
+
+    Pure float arithmetic over flat per-agent lists, shared by extraction
+    (effective damages → costs) and restoration (effective recoveries →
+    service values). The weighted value is computed once and feeds both the
+    agent value and the health sum, in a single pass; this is exactly
+    values[i] * weights[i] * rates[i], whereas folding weights[i] * rates[i]
+    into one precomputed factor would round differently.
+
+    Dispatches to the compiled simulation_cy.step_costs_cy when available.
+
+    Returns:
+        Tuple of (agent_values, total, weighted_sum).
+    """
+    if _HAS_CYTHON:
+        return step_costs_cy(values, weights, rates)
+
+    # v0.8: Output list pre-sized and written by index (no append growth)
+    agent_values: list = [0.0] * len(values)
+    total: float = 0.0
+    weighted_sum: float = 0.0
+    i: int = 0
+    for v, w, r in zip(values, weights, rates):
+        weighted: float = v * w
+        agent_value: float = weighted * r
+        agent_values[i] = agent_value
+        i += 1
+        total += agent_value
+        weighted_sum += weighted
+    return agent_values, total, weighted_sum
+
+
 def _can_use_cython(ecosystem: Ecosystem) -> bool:
     """Check if the Cython fast path can be used for this ecosystem.
 
@@ -112,8 +308,8 @@ def _can_use_cython(ecosystem: Ecosystem) -> bool:
     if ecosystem.pricing is not None:
         return False
     # Check all damage functions are extractable
-    for agent in ecosystem.agents:
-        kind = _extract_damage_params(agent.damage_function)[0]
+    for damage_fn in ecosystem.agent_columns.damage_functions:
+        kind = _extract_damage_params(damage_fn)[0]
         if kind == -1:
             return False
     # Check substrate compatibility (marine uses sediment_stability, not soil_depth)
@@ -126,38 +322,46 @@ def _can_use_cython(ecosystem: Ecosystem) -> bool:
     return True
 
 
+def _can_use_cython_restoration(recovery_functions: list) -> bool:
+    """Check if the compiled restoration loop can be used.
+
+    Requires the Cython extension and a kernel_params tuple on every
+    recovery function (the exact gaia.recovery / gaia.damage curves);
+    custom and tabulated curves run in the pure-Python loop.
+    """
+    if not _HAS_CYTHON:
+        return False
+    for recovery_fn in recovery_functions:
+        if getattr(recovery_fn, "kernel_params", None) is None:
+            return False
+    return True
+
+
 def _run_extraction_cython(
     ecosystem: Ecosystem, units_to_extract: int
 ) -> SimulationResult:
     """Run extraction using the Cython-optimized inner loop.
 
     Extracts all parameters from Python objects into flat lists/primitives,
-    calls the C-typed loop, then wraps results back into SimulationStep
-    dataclasses.
+    calls the C-typed loop, which writes each step into a preallocated
+    SimulationTrace.
     """
     resource = ecosystem.resource
-    agents = ecosystem.agents
-    n_agents = len(agents)
+    n_agents = len(ecosystem.agents)
     total_units = resource.total_units
     unit_value = resource.unit_value
 
-    # Build name-to-index lookup for converting keystone indices back to names
-    agent_names = [a.name for a in agents]
-
-    # Pre-extract all per-agent arrays
-    damage_params = [_extract_damage_params(a.damage_function) for a in agents]
-    dep_weights = [a.dependency_weight for a in agents]
-    monetary_rates = [a.monetary_rate for a in agents]
-    trophic_levels = [a.trophic_level for a in agents]
-    is_keystone = [a.is_keystone for a in agents]
-    keystone_thresholds = [a.keystone_threshold for a in agents]
+    # v0.8: Per-agent arrays come from the ecosystem's cached SoA projection
+    columns = ecosystem.agent_columns
+    agent_names = columns.names  # for reporting triggered keystones
+    damage_params = [_extract_damage_params(fn) for fn in columns.damage_functions]
+    trophic_levels = columns.trophic_levels
 
     # Pre-extract per-edge arrays (convert names to indices)
     interactions = ecosystem.interactions
-    name_to_idx = {name: i for i, name in enumerate(agent_names)}
-    edge_src_idx = [name_to_idx[e.source] for e in interactions]
-    edge_tgt_idx = [name_to_idx[e.target] for e in interactions]
-    edge_strengths = [e.strength for e in interactions]
+    edge_src_idx, edge_tgt_idx, _keystone_edges = ecosystem.edge_index
+    edge_strengths = ecosystem.edge_strengths
+    edge_out_indptr, edge_out_idx = ecosystem.edge_csr
     n_edges = len(interactions)
 
     has_trophic = any(lvl >= 1 for lvl in trophic_levels)
@@ -184,8 +388,10 @@ def _run_extraction_cython(
     sub_residual = sub.residual_fraction if sub else 0.05
     sub_cap_fn = sub.capacity_function if sub else "linear"
 
+    trace = SimulationTrace.preallocate(units_to_extract)
+
     # Call the Cython loop
-    raw_steps = extraction_loop_cy(
+    extraction_loop_cy(
         n_agents=n_agents,
         n_edges=n_edges,
         total_units=total_units,
@@ -193,16 +399,20 @@ def _run_extraction_cython(
         unit_value=unit_value,
         safe_threshold_ratio=resource.safe_threshold_ratio,
         damage_params=damage_params,
-        dep_weights=dep_weights,
-        monetary_rates=monetary_rates,
+        dep_weights=columns.dependency_weights,
+        monetary_rates=columns.monetary_rates,
         trophic_levels=trophic_levels,
-        is_keystone=is_keystone,
-        keystone_thresholds=keystone_thresholds,
+        is_keystone=columns.is_keystone,
+        keystone_thresholds=columns.keystone_thresholds,
         edge_src_idx=edge_src_idx,
         edge_tgt_idx=edge_tgt_idx,
         edge_strengths=edge_strengths,
+        edge_out_indptr=edge_out_indptr,
+        edge_out_idx=edge_out_idx,
         has_trophic=has_trophic,
         has_interactions=has_interactions,
+        has_keystones=ecosystem.has_keystones,
+        persist_breakdown=ecosystem.persist_cascade_breakdown,
         has_resilience=has_resilience,
         has_substrate=has_substrate,
         resilience_warning_width=res_warning,
@@ -219,48 +429,14 @@ def _run_extraction_cython(
         substrate_residual_fraction=sub_residual,
         substrate_capacity_function=sub_cap_fn,
         substrate_t_ha_to_mm_factor=_T_HA_TO_MM_FACTOR,
+        trace=trace,
+        agent_names=agent_names,
     )
 
-    # Convert raw tuples into SimulationStep dataclasses
-    steps = []
-    for raw in raw_steps:
-        (step, units_extracted, depletion_ratio,
-         effective_damages, agent_costs, marginal_cost, cumulative_cost,
-         private_revenue, ecosystem_health,
-         direct_damages, cascade_damages, keystone_triggered_indices,
-         zone, confidence, irreversibility,
-         substrate_erosion, effective_k, k_fraction) = raw
-
-        # Convert keystone indices back to agent names
-        keystone_names = [agent_names[idx] for idx in keystone_triggered_indices]
-
-        steps.append(SimulationStep(
-            step=step,
-            units_extracted=units_extracted,
-            depletion_ratio=depletion_ratio,
-            agent_damages=effective_damages,
-            agent_costs=agent_costs,
-            marginal_cost=marginal_cost,
-            cumulative_cost=cumulative_cost,
-            private_revenue=private_revenue,
-            ecosystem_health=ecosystem_health,
-            agent_direct_damages=direct_damages,
-            agent_cascade_damages=cascade_damages,
-            keystone_triggered=keystone_names,
-            resilience_zone=zone,
-            model_confidence=confidence,
-            irreversibility_warning=irreversibility,
-            substrate_erosion=substrate_erosion,
-            effective_k=effective_k,
-            k_fraction=k_fraction,
-            agent_prices=[],
-            price_result=None,
-        ))
-
-    if not steps:
+    if not units_to_extract:
         return SimulationResult(
             ecosystem=ecosystem,
-            steps=steps,
+            steps=trace,
             total_units_extracted=0,
             total_private_revenue=0.0,
             total_externality_cost=0.0,
@@ -268,9 +444,13 @@ def _run_extraction_cython(
             final_ecosystem_health=1.0,
         )
 
-    final_step = steps[-1]
-    total_externality = final_step.cumulative_cost
-    total_revenue = final_step.private_revenue
+    # v0.8: Optional reduced-precision storage of per-agent rows
+    if ecosystem.trace_precision is not None:
+        trace.pack(ecosystem.trace_precision)
+
+    # v0.8: Totals are read from the last row of the columns; no step view is built
+    total_externality = trace.cumulative_cost[-1]
+    total_revenue = trace.private_revenue[-1]
 
     # v0.6: Compute extraction NPV when discount config present
     extraction_npv = None
@@ -282,18 +462,18 @@ def _run_extraction_cython(
             carbon_profile=resource.carbon_profile,
             units_extracted=units_to_extract,
             substrate_ceiling=(
-                final_step.k_fraction if has_substrate else 1.0
+                trace.k_fraction[-1] if has_substrate else 1.0
             ),
         )
 
     return SimulationResult(
         ecosystem=ecosystem,
-        steps=steps,
+        steps=trace,
         total_units_extracted=units_to_extract,
         total_private_revenue=total_revenue,
         total_externality_cost=total_externality,
         net_social_cost=total_revenue - total_externality,
-        final_ecosystem_health=final_step.ecosystem_health,
+        final_ecosystem_health=trace.ecosystem_health[-1],
         extraction_npv=extraction_npv,
     )
 
@@ -315,12 +495,13 @@ def run_extraction(ecosystem: Ecosystem, units_to_extract: int) -> SimulationRes
         Phase 3 — Cost computation:
             cost[i]          = effective_damage[i] * weight[i] * rate[i]
             total_cost       = sum(cost[i])
-            marginal_cost    = total_cost - previous_total_cost
+            marginal_cost    = total_cost - previous_total_cost  (v0.8: after the loop)
             ecosystem_health = 1.0 - sum(weight[i] * effective_damage[i])
 
     v0.4 additions:
         Phase 4 — Resilience zone tagging:
-            If resource.resilience is configured, compute zone/confidence/warning.
+            If resource.resilience is configured, compute zone/confidence/warning
+            (v0.8: for all steps in one batch once the loop has run).
 
     When ecosystem.interactions is empty and all trophic_levels are -1,
     this reduces to the v0.2 algorithm exactly.
@@ -343,18 +524,18 @@ def run_extraction(ecosystem: Ecosystem, units_to_extract: int) -> SimulationRes
         return _run_extraction_cython(ecosystem, units_to_extract)
 
     resource = ecosystem.resource
-    agents: list = ecosystem.agents
-    n_agents: int = len(agents)
+    n_agents: int = len(ecosystem.agents)
     total_units: int = resource.total_units
     unit_value: float = resource.unit_value
 
-    steps: list = []
+    # v0.8: Columnar trace — the loop writes rows, SimulationSteps are built on access
+    trace: SimulationTrace = SimulationTrace.preallocate(units_to_extract)
 
     # Handle zero-extraction case: return empty result immediately
     if units_to_extract == 0:
         return SimulationResult(
             ecosystem=ecosystem,
-            steps=steps,
+            steps=trace,
             total_units_extracted=0,
             total_private_revenue=0.0,
             total_externality_cost=0.0,
@@ -363,18 +544,21 @@ def run_extraction(ecosystem: Ecosystem, units_to_extract: int) -> SimulationRes
         )
 
     # v0.3: Pre-extract interaction metadata for the loop
-    agent_names: list = [a.name for a in agents]
-    agent_trophic_levels: list = [a.trophic_level for a in agents]
-    agent_is_keystone: list = [a.is_keystone for a in agents]
-    agent_keystone_thresholds: list = [a.keystone_threshold for a in agents]
+    # v0.8: Per-agent fields are read from the ecosystem's cached SoA projection
+    columns = ecosystem.agent_columns
+    agent_names: list = columns.names
+    agent_trophic_levels: list = columns.trophic_levels
+    agent_keystone_thresholds: list = columns.keystone_thresholds
+    agent_weights: list = columns.dependency_weights
+    agent_rates: list = columns.monetary_rates
 
     interactions: list = ecosystem.interactions
-    edge_sources: list = [e.source for e in interactions]
-    edge_targets: list = [e.target for e in interactions]
-    edge_strengths: list = [e.strength for e in interactions]
+    # v0.8: Edge strengths and indices are resolved once per ecosystem, not
+    # per run or step
+    edge_strengths: list = ecosystem.edge_strengths
+    edge_src_idx, edge_tgt_idx, keystone_edges = ecosystem.edge_index
 
     # Short-circuit flags: skip phases when not needed
-    has_trophic: bool = any(lvl >= 1 for lvl in agent_trophic_levels)
     has_interactions: bool = len(interactions) > 0
     has_resilience: bool = resource.resilience is not None
 
@@ -382,7 +566,7 @@ def run_extraction(ecosystem: Ecosystem, units_to_extract: int) -> SimulationRes
     has_pricing: bool = ecosystem.pricing is not None
     monetary_rates_dict: dict = {}
     if has_pricing:
-        monetary_rates_dict = {a.name: a.monetary_rate for a in agents}
+        monetary_rates_dict = dict(zip(agent_names, agent_rates))
 
     # v0.5: Initialize substrate state if profile is configured
     has_substrate: bool = resource.substrate is not None
@@ -393,34 +577,56 @@ def run_extraction(ecosystem: Ecosystem, units_to_extract: int) -> SimulationRes
         # Default: total extraction takes ~1 year
         time_per_step = 1.0 / units_to_extract if units_to_extract > 0 else 0.0
 
-    previous_total_cost: float = 0.0
-
-    for step in range(1, units_to_extract + 1):
+    # Bind trace columns to locals for the hot loop
+    col_depletion: array = trace.depletion_ratio
+    col_damages: list = trace.agent_damages
+    col_costs: list = trace.agent_costs
+    col_marginal: array = trace.marginal_cost
+    col_cumulative: array = trace.cumulative_cost
+    col_revenue: array = trace.private_revenue
+    col_health: array = trace.ecosystem_health
+    col_direct: list = trace.agent_direct_damages
+    col_cascade: list = trace.agent_cascade_damages
+    # v0.8: Without a persisted breakdown, only the final step keeps direct/cascade
+    persist_breakdown: bool = ecosystem.persist_cascade_breakdown
+    col_keystone: list = trace.keystone_triggered
+    col_zone: list = trace.resilience_zone
+    col_confidence: array = trace.model_confidence
+    col_irreversibility: list = trace.irreversibility_warning
+    col_erosion: array = trace.substrate_erosion
+    col_effective_k: array = trace.effective_k
+    col_k_fraction: array = trace.k_fraction
+    col_prices: list = trace.agent_prices
+    col_price_result: list = trace.price_result
+
+    # v0.8: Phase 1 (direct damage with trophic amplification) is evaluated
+    # column-wise, agents sharing a curve share one evaluation, and the
+    # columns are memoized on the ecosystem across runs. Each step gets a
+    # fresh row list; the memoized columns may run past units_to_extract.
+    direct_rows = map(list, zip(*_memoized_damage_columns(
+        ecosystem, _trophic_amps(agent_trophic_levels), units_to_extract,
+    )))
+
+    # v0.8: Columns that depend only on the step index are filled before the
+    # loop, one division (or product) per step in a single pass
+    step_range: range = range(1, units_to_extract + 1)
+    col_depletion[:] = array("d", [units / total_units for units in step_range])
+    col_revenue[:] = array("d", [units * unit_value for units in step_range])
+
+    for step, direct_damages in zip(step_range, direct_rows):
+        row: int = step - 1
         units_extracted: int = step
-        depletion_ratio: float = units_extracted / total_units
-
-        # Phase 1: Direct damage with trophic amplification
-        direct_damages: list = []
-        for i in range(n_agents):
-            raw_damage: float = agents[i].damage_function(depletion_ratio)
-            if has_trophic:
-                amplified: float = compute_trophic_amplification(
-                    raw_damage, agent_trophic_levels[i]
-                )
-                direct_damages.append(amplified)
-            else:
-                direct_damages.append(raw_damage)
 
         # Phase 2: Interaction propagation
         if has_interactions:
             effective_damages, cascade_damages, keystone_triggered = (
-                propagate_interactions(
+                propagate_interactions_indexed(
                     agent_names=agent_names,
                     direct_damages=direct_damages,
-                    edge_sources=edge_sources,
-                    edge_targets=edge_targets,
+                    edge_src_idx=edge_src_idx,
+                    edge_tgt_idx=edge_tgt_idx,
                     edge_strengths=edge_strengths,
-                    agent_is_keystone=agent_is_keystone,
+                    keystone_edges=keystone_edges,
                     agent_keystone_thresholds=agent_keystone_thresholds,
                 )
             )
@@ -454,26 +660,17 @@ def run_extraction(ecosystem: Ecosystem, units_to_extract: int) -> SimulationRes
                 monetary_rates=monetary_rates_dict,
             )
             step_agent_prices = [
-                step_price_result.prices.get(agent_names[i], agents[i].monetary_rate)
+                step_price_result.prices.get(agent_names[i], agent_rates[i])
                 for i in range(n_agents)
             ]
 
-        agent_costs: list = []
-        step_total_cost: float = 0.0
-        health_sum: float = 0.0
-
-        for i in range(n_agents):
-            # v0.7: Use dynamic price if available, else static monetary_rate
-            rate: float = (
-                step_agent_prices[i] if has_pricing and step_agent_prices
-                else agents[i].monetary_rate
-            )
-            cost: float = effective_damages[i] * agents[i].dependency_weight * rate
-            agent_costs.append(cost)
-            step_total_cost += cost
-            health_sum += agents[i].dependency_weight * effective_damages[i]
+        # v0.7: Use dynamic prices if available, else static monetary_rate
+        agent_costs, step_total_cost, health_sum = _step_costs(
+            effective_damages,
+            agent_weights,
+            step_agent_prices if has_pricing and step_agent_prices else agent_rates,
+        )
 
-        marginal_cost: float = step_total_cost - previous_total_cost
         ecosystem_health: float = 1.0 - health_sum
         # Clamp health to [0, 1] to guard against floating-point overshoot
         if ecosystem_health < 0.0:
@@ -481,8 +678,6 @@ def run_extraction(ecosystem: Ecosystem, units_to_extract: int) -> SimulationRes
         elif ecosystem_health > 1.0:
             ecosystem_health = 1.0
 
-        private_revenue: float = units_extracted * unit_value
-
         # Phase 3.5: Substrate degradation (v0.5)
         step_substrate_erosion: float = 0.0
         step_effective_k: int = total_units
@@ -495,48 +690,45 @@ def run_extraction(ecosystem: Ecosystem, units_to_extract: int) -> SimulationRes
             step_k_fraction = compute_capacity_fraction(substrate_state)
             step_effective_k = int(total_units * step_k_fraction)
 
-        # Phase 4: Resilience zone tagging (v0.4)
-        step_zone: str = "green"
-        step_confidence: float = 1.0
-        step_irreversibility: bool = False
-        if has_resilience:
-            remaining_frac: float = 1.0 - depletion_ratio
-            step_zone, step_confidence, step_irreversibility = (
-                compute_resilience_zone(
-                    remaining_frac,
-                    resource.safe_threshold_ratio,
-                    resource.resilience,
-                )
-            )
-
-        steps.append(SimulationStep(
-            step=step,
-            units_extracted=units_extracted,
-            depletion_ratio=depletion_ratio,
-            agent_damages=effective_damages,
-            agent_costs=agent_costs,
-            marginal_cost=marginal_cost,
-            cumulative_cost=step_total_cost,
-            private_revenue=private_revenue,
-            ecosystem_health=ecosystem_health,
-            agent_direct_damages=direct_damages,
-            agent_cascade_damages=cascade_damages,
-            keystone_triggered=keystone_triggered,
-            resilience_zone=step_zone,
-            model_confidence=step_confidence,
-            irreversibility_warning=step_irreversibility,
-            substrate_erosion=step_substrate_erosion,
-            effective_k=step_effective_k,
-            k_fraction=step_k_fraction,
-            agent_prices=step_agent_prices,
-            price_result=step_price_result,
-        ))
+        col_damages[row] = effective_damages
+        col_costs[row] = agent_costs
+        col_cumulative[row] = step_total_cost
+        col_health[row] = ecosystem_health
+        if persist_breakdown or step == units_to_extract:
+            col_direct[row] = direct_damages
+            col_cascade[row] = cascade_damages
+        col_keystone[row] = keystone_triggered
+        col_erosion[row] = step_substrate_erosion
+        col_effective_k[row] = step_effective_k
+        col_k_fraction[row] = step_k_fraction
+        col_prices[row] = step_agent_prices
+        col_price_result[row] = step_price_result
+
+    # v0.8: Marginal cost is the shifted difference of the cumulative column
+    col_marginal[:] = _shifted_difference(col_cumulative)
+
+    # Phase 4: Resilience zone tagging (v0.4)
+    # v0.8: Zones depend only on the depletion ratio, so the whole column is
+    # classified in one batch call and written into the trace in place;
+    # without a resilience config the preallocated defaults (green, 1.0,
+    # no warning) stand
+    if has_resilience:
+        zones, confidences, warnings = compute_resilience_zone_batch(
+            [1.0 - ratio for ratio in col_depletion],
+            resource.safe_threshold_ratio,
+            resource.resilience,
+        )
+        col_zone[:] = zones
+        col_confidence[:] = array("d", confidences)
+        col_irreversibility[:] = warnings
 
-        previous_total_cost = step_total_cost
+    # v0.8: Optional reduced-precision storage of per-agent rows
+    if ecosystem.trace_precision is not None:
+        trace.pack(ecosystem.trace_precision)
 
-    final_step: SimulationStep = steps[-1]
-    total_externality: float = final_step.cumulative_cost
-    total_revenue: float = final_step.private_revenue
+    # v0.8: Totals are read from the last row of the columns; no step view is built
+    total_externality: float = col_cumulative[-1]
+    total_revenue: float = col_revenue[-1]
 
     # v0.6: Compute extraction NPV when discount config present
     extraction_npv = None
@@ -548,18 +740,18 @@ def run_extraction(ecosystem: Ecosystem, units_to_extract: int) -> SimulationRes
             carbon_profile=resource.carbon_profile,
             units_extracted=units_to_extract,
             substrate_ceiling=(
-                final_step.k_fraction if has_substrate else 1.0
+                trace.k_fraction[-1] if has_substrate else 1.0
             ),
         )
 
     return SimulationResult(
         ecosystem=ecosystem,
-        steps=steps,
+        steps=trace,
         total_units_extracted=units_to_extract,
         total_private_revenue=total_revenue,
         total_externality_cost=total_externality,
         net_social_cost=total_revenue - total_externality,
-        final_ecosystem_health=final_step.ecosystem_health,
+        final_ecosystem_health=trace.ecosystem_health[-1],
         extraction_npv=extraction_npv,
     )
 
@@ -618,99 +810,126 @@ def run_restoration(
             f"total_units ({ecosystem.resource.total_units})."
         )
 
-    agents: list = ecosystem.agents
     cost_per_unit: float = restoration_cost.total_cost_per_unit
 
     # v0.3: Pre-extract interaction metadata
-    agent_names: list = [a.name for a in agents]
-    agent_trophic_levels: list = [a.trophic_level for a in agents]
-    agent_is_keystone: list = [a.is_keystone for a in agents]
-    agent_keystone_thresholds: list = [a.keystone_threshold for a in agents]
+    # v0.8: Per-agent fields are read from the ecosystem's cached SoA projection
+    columns = ecosystem.agent_columns
+    agent_names: list = columns.names
+    agent_trophic_levels: list = columns.trophic_levels
+    agent_keystone_thresholds: list = columns.keystone_thresholds
+    agent_weights: list = columns.dependency_weights
+    agent_rates: list = columns.monetary_rates
 
     interactions: list = ecosystem.interactions
-    edge_sources: list = [e.source for e in interactions]
-    edge_targets: list = [e.target for e in interactions]
-    edge_strengths: list = [e.strength for e in interactions]
+    # v0.8: Edge strengths and indices are resolved once per ecosystem, not
+    # per run or step
+    edge_strengths: list = ecosystem.edge_strengths
+    edge_src_idx, edge_tgt_idx, keystone_edges = ecosystem.edge_index
 
-    has_trophic: bool = any(lvl >= 1 for lvl in agent_trophic_levels)
     has_interactions: bool = len(interactions) > 0
 
-    steps: list = []
-    previous_total_service: float = 0.0
-
-    for step in range(1, units_to_restore + 1):
-        units_restored: int = step
-        # Recovery ratio: fraction of the destroyed resource that has been replanted
-        recovery_ratio: float = units_restored / units_to_restore
-
-        # Phase 1: Direct recovery with trophic amplification
-        direct_recoveries: list = []
-        for i in range(n_agents):
-            recovery_fn: RecoveryFunc = recovery_functions[i]
-            raw_recovery: float = recovery_fn(recovery_ratio)
-            if has_trophic:
-                amplified: float = compute_trophic_amplification(
-                    raw_recovery, agent_trophic_levels[i]
+    # v0.8: Agents with identical recovery curves share one evaluation per step
+    recovery_groups: list = group_shared_curves(recovery_functions)
+
+    # v0.8: Scratch buffers for the discarded cascade/keystone outputs of
+    # propagation, allocated once and overwritten every step
+    scratch_cascade: list = [0.0] * n_agents
+    scratch_keystones: list = []
+
+    # v0.8: Columnar trace — the loop writes rows, RestorationSteps are built on access
+    trace: RestorationTrace = RestorationTrace.preallocate(units_to_restore)
+    col_recovery_ratio: array = trace.recovery_ratio
+    col_recoveries: list = trace.agent_recoveries
+    col_service_values: list = trace.agent_service_values
+    col_marginal: array = trace.marginal_service_value
+    col_cumulative: array = trace.cumulative_service_value
+    col_cost: array = trace.restoration_cost_so_far
+    col_health: array = trace.ecosystem_health
+
+    # v0.8: Index-only columns (recovery ratio, cost so far) in one pass each
+    step_range: range = range(1, units_to_restore + 1)
+    col_recovery_ratio[:] = array("d", [step / units_to_restore for step in step_range])
+    col_cost[:] = array("d", [step * cost_per_unit for step in step_range])
+
+    # v0.8: Exact recovery curves (kernel_params on every function) run
+    # Phases 1-3 in the compiled loop
+    trophic_amps: list = _trophic_amps(agent_trophic_levels)
+    if _can_use_cython_restoration(recovery_functions):
+        edge_out_indptr, edge_out_idx = ecosystem.edge_csr
+        restoration_loop_cy(
+            n_agents=n_agents,
+            n_edges=len(interactions),
+            units_to_restore=units_to_restore,
+            recovery_params=[fn.kernel_params for fn in recovery_functions],
+            trophic_amps=trophic_amps,
+            dep_weights=agent_weights,
+            monetary_rates=agent_rates,
+            keystone_thresholds=agent_keystone_thresholds,
+            is_keystone=columns.is_keystone,
+            edge_src_idx=edge_src_idx,
+            edge_tgt_idx=edge_tgt_idx,
+            edge_strengths=edge_strengths,
+            edge_out_indptr=edge_out_indptr,
+            edge_out_idx=edge_out_idx,
+            has_keystones=ecosystem.has_keystones,
+            recovery_cascade_factor=0.5,
+            trace=trace,
+        )
+    else:
+        # v0.8: Phase 1 (direct recovery with trophic amplification) is evaluated
+        # column-wise, a block of steps at a time. The recovery ratio of step s
+        # is s / units_to_restore: the fraction of the destroyed resource replanted.
+        direct_rows = _iter_direct_rows(
+            recovery_groups, trophic_amps, units_to_restore, units_to_restore
+        )
+
+        for step, direct_recoveries in zip(step_range, direct_rows):
+
+            # Phase 2: Interaction propagation (recovery mode — 0.5× cascade strength)
+            if has_interactions:
+                effective_recoveries, _cascade, _keystone = propagate_interactions_indexed(
+                    agent_names=agent_names,
+                    direct_damages=direct_recoveries,
+                    edge_src_idx=edge_src_idx,
+                    edge_tgt_idx=edge_tgt_idx,
+                    edge_strengths=edge_strengths,
+                    keystone_edges=keystone_edges,
+                    agent_keystone_thresholds=agent_keystone_thresholds,
+                    recovery_mode=True,
+                    out_cascade=scratch_cascade,
+                    out_keystones=scratch_keystones,
                 )
-                direct_recoveries.append(amplified)
             else:
-                direct_recoveries.append(raw_recovery)
+                effective_recoveries = direct_recoveries
 
-        # Phase 2: Interaction propagation (recovery mode — 0.5× cascade strength)
-        if has_interactions:
-            effective_recoveries, _cascade, _keystone = propagate_interactions(
-                agent_names=agent_names,
-                direct_damages=direct_recoveries,
-                edge_sources=edge_sources,
-                edge_targets=edge_targets,
-                edge_strengths=edge_strengths,
-                agent_is_keystone=agent_is_keystone,
-                agent_keystone_thresholds=agent_keystone_thresholds,
-                recovery_mode=True,
+            # Phase 3: Compute service values from effective recoveries
+            agent_service_values, step_total_service, health_sum = _step_costs(
+                effective_recoveries, agent_weights, agent_rates
             )
-        else:
-            effective_recoveries = direct_recoveries
 
-        # Phase 3: Compute service values from effective recoveries
-        agent_service_values: list = []
-        step_total_service: float = 0.0
-        health_sum: float = 0.0
+            ecosystem_health: float = health_sum
+            if ecosystem_health < 0.0:
+                ecosystem_health = 0.0
+            elif ecosystem_health > 1.0:
+                ecosystem_health = 1.0
 
-        for i in range(n_agents):
-            service_value: float = (
-                effective_recoveries[i] * agents[i].dependency_weight
-                * agents[i].monetary_rate
-            )
-            agent_service_values.append(service_value)
-            step_total_service += service_value
-            health_sum += agents[i].dependency_weight * effective_recoveries[i]
+            row: int = step - 1
+            col_recoveries[row] = effective_recoveries
+            col_service_values[row] = agent_service_values
+            col_cumulative[row] = step_total_service
+            col_health[row] = ecosystem_health
 
-        marginal_value: float = step_total_service - previous_total_service
-        ecosystem_health: float = health_sum
-        if ecosystem_health < 0.0:
-            ecosystem_health = 0.0
-        elif ecosystem_health > 1.0:
-            ecosystem_health = 1.0
+    # v0.8: Marginal value as the shifted difference of the cumulative column
+    col_marginal[:] = _shifted_difference(col_cumulative)
 
-        restoration_cost_so_far: float = step * cost_per_unit
-
-        steps.append(RestorationStep(
-            step=step,
-            units_restored=units_restored,
-            recovery_ratio=recovery_ratio,
-            agent_recoveries=effective_recoveries,
-            agent_service_values=agent_service_values,
-            marginal_service_value=marginal_value,
-            cumulative_service_value=step_total_service,
-            restoration_cost_so_far=restoration_cost_so_far,
-            ecosystem_health=ecosystem_health,
-        ))
+    # v0.8: Optional reduced-precision storage of per-agent rows
+    if ecosystem.trace_precision is not None:
+        trace.pack(ecosystem.trace_precision)
 
-        previous_total_service = step_total_service
-
-    final_step: RestorationStep = steps[-1]
-    total_recovered: float = final_step.cumulative_service_value
-    total_cost: float = final_step.restoration_cost_so_far
+    # v0.8: Totals are read from the last row of the columns; no step view is built
+    total_recovered: float = col_cumulative[-1]
+    total_cost: float = col_cost[-1]
 
     # Prevention advantage: how many times cheaper it would have been to not
     # destroy the units vs. destroying them and then restoring them.
@@ -846,13 +1065,13 @@ def run_restoration(
     return RestorationResult(
         ecosystem=ecosystem,
         restoration_cost=restoration_cost,
-        steps=steps,
+        steps=trace,
         total_units_restored=units_to_restore,
         total_restoration_cost=total_cost,
         total_recovered_value=total_recovered,
         net_restoration_value=total_recovered - total_cost,
         prevention_advantage=prevention_advantage,
-        final_ecosystem_health=final_step.ecosystem_health,
+        final_ecosystem_health=col_health[-1],
         maturation_timeline=maturation_timeline,
         years_to_pioneer=years_to_pioneer,
         years_to_50pct=years_to_50pct,
@@ -865,3 +1084,78 @@ def run_restoration(
         carbon_breakeven=carbon_breakeven_result,
         prevention_advantage_v06=pa_v06_result,
     )
+
+
+# v0.8: Jobs of the pool a batch worker process belongs to, set only in worker
+# processes by _init_batch_worker. Damage functions are closures, which cannot
+# be pickled, so forked workers inherit the jobs and receive only indices.
+_worker_jobs: list = []
+
+
+def _init_batch_worker(jobs: list) -> None:
+    """Pool initializer: keep this worker's inherited job list."""
+    global _worker_jobs
+    _worker_jobs = jobs
+
+
+def _run_batch_job(index: int) -> SimulationResult:
+    """Run one batch job in a worker; the parent re-attaches the ecosystem."""
+    ecosystem, units_to_extract = _worker_jobs[index]
+    result: SimulationResult = run_extraction(ecosystem, units_to_extract)
+    result.ecosystem = None
+    return result
+
+
+def run_extraction_batch(jobs: list, max_workers: Optional[int] = None) -> list:
+    """
+    Run independent extractions, in parallel worker processes.
+
+    Each job is an (ecosystem, units_to_extract) pair; jobs share no state,
+    so uncertainty sweeps scale with the number of cores. Workers are forked
+    and receive the jobs as pool initializer arguments, which fork passes
+    by inheritance, so ecosystems need not be picklable; the results are.
+    Each call gets its own pool and job list, so concurrent calls do not
+    interfere. Where fork is unavailable, or with max_workers=1 or a single
+    job, the jobs run serially in this process.
+
+    Forking copies only the calling thread. In a process that runs other
+    threads holding locks (logging handlers, database clients, ...) a child
+    can deadlock on a lock it inherited in the held state; call this before
+    starting such threads, or pass max_workers=1.
+
+    Args:
+        jobs: List of (ecosystem, units_to_extract) pairs.
+        max_workers: Number of worker processes (None = os.cpu_count()).
+
+    Returns:
+        List of SimulationResult, in job order, each referencing its job's
+        ecosystem.
+
+    Raises:
+        ValueError: If max_workers < 1, or if any job is invalid.
+    """
+    if max_workers is not None and max_workers < 1:
+        raise ValueError(f"max_workers must be >= 1, got {max_workers}.")
+    if (
+        max_workers == 1
+        or len(jobs) < 2
+        or "fork" not in multiprocessing.get_all_start_methods()
+    ):
+        return [run_extraction(ecosystem, units) for ecosystem, units in jobs]
+
+    workers: int = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(
+        workers,
+        mp_context=multiprocessing.get_context("fork"),
+        initializer=_init_batch_worker,
+        initargs=(list(jobs),),
+    ) as pool:
+        results: list = list(pool.map(
+            _run_batch_job,
+            range(len(jobs)),
+            chunksize=max(1, len(jobs) // (4 * workers)),
+        ))
+
+    for result, (ecosystem, _units) in zip(results, jobs):
+        result.ecosystem = ecosystem
+    return results
@@ -18,9 +18,28 @@ No third-party dependencies.
 Scientific foundations used: F8 (Ecological Succession & Climax State).
 """
 
+from functools import lru_cache
+from itertools import accumulate, islice
+
 from gaia.models import CarbonProfile, MaturationStep, SuccessionCurve
 
 
+def _curve_key(curve: SuccessionCurve) -> tuple:
+    """SuccessionCurve parameters as a hashable tuple, in field order (v0.8).
+
+    Memoized helpers key on parameter values rather than curve identity, so
+    equal curves share entries and a mutated curve never hits a stale one.
+    """
+    return (
+        curve.pioneer_end_year,
+        curve.intermediate_end_year,
+        curve.climax_approach_year,
+        curve.pioneer_service,
+        curve.intermediate_service,
+        curve.maturation_delay,
+    )
+
+
 def get_succession_phase(curve: SuccessionCurve, years: float) -> str:
     """Return the succession phase name at a given year since restoration.
 
@@ -99,8 +118,14 @@ def succession_service(curve: SuccessionCurve, years: float) -> float:
 def find_years_to_threshold(curve: SuccessionCurve, fraction: float) -> float:
     """Find the year when service capacity first reaches a given fraction.
 
-    Uses a simple numerical scan with 0.1-year resolution.
-    Sufficient for the reporting use case (years_to_50pct, years_to_90pct).
+    Returns the first year on a 0.1-year grid whose service reaches the
+    fraction. Sufficient for the reporting use case (years_to_50pct,
+    years_to_90pct).
+    v0.8: Scans are memoized per (curve parameters, fraction), so repeated
+    restoration runs on the same curve do not rescan. For a curve that
+    passes validate_succession_curve() the service is non-decreasing in
+    time, so the grid is bisected (O(log n) evaluations) instead of
+    scanned; other curves keep the linear scan. Both return the same year.
 
     Args:
         curve: The SuccessionCurve parameters.
@@ -110,15 +135,56 @@ def find_years_to_threshold(curve: SuccessionCurve, fraction: float) -> float:
         Year when the fraction is first reached. Returns
         climax_approach_year + maturation_delay if never reached within range.
     """
-    max_year: float = curve.climax_approach_year + curve.maturation_delay + 10.0
+    return _years_to_threshold(_curve_key(curve), fraction)
+
+
+@lru_cache(maxsize=256)
+def _years_to_threshold(curve_key: tuple, fraction: float) -> float:
+    """Memoized search behind find_years_to_threshold()."""
+    curve: SuccessionCurve = SuccessionCurve(*curve_key)
+    grid: tuple = _year_grid(
+        curve.climax_approach_year + curve.maturation_delay + 10.0
+    )
+
+    if _is_non_decreasing(curve):
+        # Bisect for the first grid year with service >= fraction
+        lo: int = 0
+        hi: int = len(grid)
+        while lo < hi:
+            mid: int = (lo + hi) // 2
+            if succession_service(curve, grid[mid]) >= fraction:
+                hi = mid
+            else:
+                lo = mid + 1
+        if lo < len(grid):
+            return grid[lo]
+    else:
+        for year in grid:
+            if succession_service(curve, year) >= fraction:
+                return year
+    return curve.climax_approach_year + curve.maturation_delay
+
+
+@lru_cache(maxsize=32)
+def _year_grid(max_year: float) -> tuple:
+    """Scan years 0.0, 0.1, ... <= max_year, accumulated as the scan steps them."""
     step: float = 0.1
+    years: list = []
     year: float = 0.0
     while year <= max_year:
-        svc: float = succession_service(curve, year)
-        if svc >= fraction:
-            return year
+        years.append(year)
         year += step
-    return curve.climax_approach_year + curve.maturation_delay
+    return tuple(years)
+
+
+def _is_non_decreasing(curve: SuccessionCurve) -> bool:
+    """Whether the curve meets the orderings that make its service monotone."""
+    return (
+        curve.maturation_delay >= 0.0
+        and 0.0 < curve.pioneer_end_year < curve.intermediate_end_year
+        < curve.climax_approach_year
+        and 0.0 <= curve.pioneer_service < curve.intermediate_service < 1.0
+    )
 
 
 def compute_maturation_timeline(
@@ -144,37 +210,43 @@ def compute_maturation_timeline(
     Returns:
         List of MaturationStep, one per year (year 1 to time_horizon_years).
     """
-    timeline: list = []
-    cumulative_service: float = 0.0
-    cumulative_carbon: float = 0.0
-
-    for year in range(1, time_horizon_years + 1):
-        svc_fraction: float = succession_service(succession_curve, float(year))
-        phase: str = get_succession_phase(succession_curve, float(year))
-
-        annual_value: float = max_recovered_value * svc_fraction
-        cumulative_service += annual_value
-
-        annual_carbon: float = 0.0
-        if carbon_profile is not None:
-            annual_carbon = (
-                units_restored
-                * carbon_profile.annual_absorption_tonnes
-                * svc_fraction
-            )
-        cumulative_carbon += annual_carbon
-
-        timeline.append(MaturationStep(
-            year=year,
-            succession_phase=phase,
-            service_fraction=svc_fraction,
-            annual_service_value=annual_value,
-            cumulative_service_value=cumulative_service,
-            annual_carbon_absorbed=annual_carbon,
-            cumulative_carbon_absorbed=cumulative_carbon,
-        ))
-
-    return timeline
+    # v0.8: Per-year service fractions and phases are memoized per curve;
+    # the timeline is built column by column, with running sums from
+    # accumulate() (same left-to-right additions as a += loop)
+    fractions, phases = _annual_profile(
+        _curve_key(succession_curve), time_horizon_years
+    )
+    annual_values: list = [max_recovered_value * svc for svc in fractions]
+    if carbon_profile is not None:
+        absorption: float = units_restored * carbon_profile.annual_absorption_tonnes
+        annual_carbon: list = [absorption * svc for svc in fractions]
+    else:
+        annual_carbon = [0.0] * time_horizon_years
+
+    return list(map(
+        MaturationStep,
+        range(1, time_horizon_years + 1),
+        phases,
+        fractions,
+        annual_values,
+        islice(accumulate(annual_values, initial=0.0), 1, None),
+        annual_carbon,
+        islice(accumulate(annual_carbon, initial=0.0), 1, None),
+    ))
+
+
+@lru_cache(maxsize=64)
+def _annual_profile(curve_key: tuple, time_horizon_years: int) -> tuple:
+    """
+    (service fractions, phases) for years 1..time_horizon_years, as two
+    tuples, memoized (v0.8).
+    """
+    curve: SuccessionCurve = SuccessionCurve(*curve_key)
+    years: range = range(1, time_horizon_years + 1)
+    return (
+        tuple(succession_service(curve, float(year)) for year in years),
+        tuple(get_succession_phase(curve, float(year)) for year in years),
+    )
 
 
 def compute_maturation_gap(
@@ -12,6 +12,8 @@ v0.6: Added validation for DiscountConfig.
 v0.7: Added validation for ScarcityFunction, AnchorPoint, PricingConfig.
 """
 
+from math import fsum, isfinite
+
 from gaia.models import (
     AnchorPoint,
     CarbonProfile,
@@ -19,19 +21,23 @@ from gaia.models import (
     DiscountConfig,
     Ecosystem,
     InteractionEdge,
+    InteractionType,
     PricingConfig,
     ResilienceConfig,
     Resource,
     ScarcityFunction,
     SubstrateProfile,
     SuccessionCurve,
+    _TRACE_TYPECODES,
 )
 
 # Valid trophic levels: -1 (abiotic), 0 (producer), 1-3 (consumers)
 _VALID_TROPHIC_LEVELS = {-1, 0, 1, 2, 3}
+_SORTED_TROPHIC_LEVELS = sorted(_VALID_TROPHIC_LEVELS)
 
 # Valid interaction types
-_VALID_INTERACTION_TYPES = {"dependency", "trophic", "keystone", "competition"}
+_VALID_INTERACTION_TYPES = {t.name.lower() for t in InteractionType}
+_SORTED_INTERACTION_TYPES = sorted(_VALID_INTERACTION_TYPES)
 
 # Tolerance for floating-point comparisons
 _WEIGHT_SUM_TOLERANCE: float = 1e-6
@@ -89,7 +95,6 @@ def validate_ecosystem(ecosystem: Ecosystem) -> None:
     if len(ecosystem.agents) == 0:
         raise ValueError("Ecosystem must have at least one agent.")
 
-    weight_sum: float = 0.0
     for agent in ecosystem.agents:
         if not (0.0 < agent.dependency_weight <= 1.0):
             raise ValueError(
@@ -101,8 +106,9 @@ def validate_ecosystem(ecosystem: Ecosystem) -> None:
                 f"Agent '{agent.name}' monetary_rate must be >= 0.0, "
                 f"got {agent.monetary_rate}"
             )
-        weight_sum += agent.dependency_weight
 
+    # v0.8: Exactly rounded sum (math.fsum), independent of agent order
+    weight_sum: float = fsum([agent.dependency_weight for agent in ecosystem.agents])
     if abs(weight_sum - 1.0) > _WEIGHT_SUM_TOLERANCE:
         raise ValueError(
             f"Agent dependency_weights must sum to 1.0, "
@@ -114,7 +120,7 @@ def validate_ecosystem(ecosystem: Ecosystem) -> None:
         if agent.trophic_level not in _VALID_TROPHIC_LEVELS:
             raise ValueError(
                 f"Agent '{agent.name}' trophic_level must be one of "
-                f"{sorted(_VALID_TROPHIC_LEVELS)}, got {agent.trophic_level}"
+                f"{_SORTED_TROPHIC_LEVELS}, got {agent.trophic_level}"
             )
         if agent.is_keystone:
             if not (0.0 < agent.keystone_threshold < 1.0):
@@ -140,6 +146,16 @@ def validate_ecosystem(ecosystem: Ecosystem) -> None:
     if ecosystem.pricing is not None:
         validate_pricing_config(ecosystem.pricing, agent_names)
 
+    # v0.8: Validate optional trace storage precision
+    if (
+        ecosystem.trace_precision is not None
+        and ecosystem.trace_precision not in _TRACE_TYPECODES
+    ):
+        raise ValueError(
+            f"Ecosystem trace_precision must be None or one of "
+            f"{sorted(_TRACE_TYPECODES)}, got {ecosystem.trace_precision!r}"
+        )
+
 
 def validate_extraction(ecosystem: Ecosystem, units_to_extract: int) -> None:
     """
@@ -159,6 +175,38 @@ def validate_extraction(ecosystem: Ecosystem, units_to_extract: int) -> None:
         )
 
 
+def _certified_curve(fn: DamageFunc) -> bool:
+    """
+    Whether fn is a gaia curve whose invariants hold by construction (v0.8).
+
+    The gaia.damage and gaia.recovery factories publish their constants as
+    kernel_params. For these parameter ranges the normalized curves are
+    exact at both ends and are built from monotone operations, so every
+    sampled check of validate_damage_function would pass:
+        0 = logistic:    steepness > 0 and span > 0
+        1 = exponential: scale > 0, base > 1 and base^scale - 1 > 0
+        2 = piecewise:   threshold in (1e-9, 1 - 1e-9) (the factory's slope
+                         floor), non-negative slopes, pre_slope_ratio in [0, 1]
+    Other kinds (linear recovery), non-finite or out-of-range parameters
+    and functions without kernel_params are not certified.
+    """
+    params = getattr(fn, "kernel_params", None)
+    if params is None:
+        return False
+    kind, p1, p2, p3, p4 = params
+    if not (isfinite(p1) and isfinite(p2) and isfinite(p3) and isfinite(p4)):
+        return False
+    if kind == 0:
+        return p4 > 0.0 and p3 > 0.0
+    if kind == 1:
+        return p1 > 0.0 and p2 > 0.0 and p3 > 1.0
+    if kind == 2:
+        return (
+            1e-9 < p1 < 1.0 - 1e-9 and p2 >= 0.0 and p3 >= 0.0 and 0.0 <= p4 <= 1.0
+        )
+    return False
+
+
 def validate_damage_function(fn: DamageFunc, name: str = "damage_function") -> None:
     """
     Validate that a damage function satisfies the six scientific invariants.
@@ -171,6 +219,9 @@ def validate_damage_function(fn: DamageFunc, name: str = "damage_function") -> N
         5. Non-linearity: slope after midpoint > slope before midpoint
            (proxy check — full threshold-aware check requires knowing the threshold)
 
+    v0.8: Curves built by the gaia factories with in-range parameters (see
+    _certified_curve) are accepted without sampling.
+
     Args:
         fn: The damage function to validate.
         name: Label for error messages.
@@ -178,6 +229,10 @@ def validate_damage_function(fn: DamageFunc, name: str = "damage_function") -> N
     Raises:
         ValueError: If any invariant is violated.
     """
+    # v0.8: Curves certified by their kernel_params need no sampling
+    if _certified_curve(fn):
+        return
+
     tol: float = _DAMAGE_BOUNDARY_TOLERANCE
 
     at_zero: float = fn(0.0)
@@ -241,7 +296,7 @@ def _validate_interaction_edge(edge: InteractionEdge, agent_names: set) -> None:
     if edge.interaction_type not in _VALID_INTERACTION_TYPES:
         raise ValueError(
             f"InteractionEdge '{edge.source}' → '{edge.target}' interaction_type "
-            f"must be one of {sorted(_VALID_INTERACTION_TYPES)}, "
+            f"must be one of {_SORTED_INTERACTION_TYPES}, "
             f"got '{edge.interaction_type}'"
         )
 
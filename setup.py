@@ -1,20 +1,23 @@
 """
 Gaia build configuration.
 
-Builds the optional Cython extension for the simulation loop.
-If Cython is not installed, the build is skipped and Gaia falls back
-to the pure-Python simulation loop automatically.
+Builds the optional Cython extensions for the simulation loop and the
+interaction propagation kernel. If Cython is not installed, the build is
+skipped and Gaia falls back to the pure-Python code paths automatically.
 
 Usage:
     python setup.py build_ext --inplace
 """
 
+import glob
+
 from setuptools import setup, find_packages
 
 try:
     from Cython.Build import cythonize
+    # Every kernel under gaia/cy is compiled ahead of time
     ext_modules = cythonize(
-        "gaia/cy/simulation_cy.pyx",
+        sorted(glob.glob("gaia/cy/*.pyx")),
         compiler_directives={
             "boundscheck": False,
             "wraparound": False,
@@ -32,6 +35,9 @@ setup(
     version="0.8.0",
     description="Gaia — Externality Computation Framework",
     packages=find_packages(),
+    # Ship Cython sources and .pxd declarations so downstream Cython code
+    # can `cimport gaia.cy.kernels`
+    package_data={"gaia.cy": ["*.pxd", "*.pyx"]},
     ext_modules=ext_modules,
     python_requires=">=3.9",
 )
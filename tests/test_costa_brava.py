@@ -343,3 +343,28 @@ def test_costa_brava_keystone_warning_in_report():
     assert "Keystone Threshold" in report, (
         "Report should contain keystone threshold crossing section"
     )
+
+
+def test_costa_brava_report_same_for_step_list_and_trace():
+    """Report scans over trace columns match a plain list of steps."""
+    from gaia.models import SimulationResult
+
+    eco = build_costa_brava_ecosystem(
+        total_trees=TOTAL_TREES,
+        safe_threshold_ratio=THRESHOLD,
+    )
+    result = run_extraction(eco, 5_000)
+    as_list = SimulationResult(
+        ecosystem=result.ecosystem,
+        steps=list(result.steps),
+        total_units_extracted=result.total_units_extracted,
+        total_private_revenue=result.total_private_revenue,
+        total_externality_cost=result.total_externality_cost,
+        net_social_cost=result.net_social_cost,
+        final_ecosystem_health=result.final_ecosystem_health,
+        extraction_npv=result.extraction_npv,
+    )
+    report = format_report(result)
+    assert "Keystone Threshold" in report
+    assert "Zone transitions" in report
+    assert format_report(as_list) == report
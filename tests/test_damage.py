@@ -280,3 +280,20 @@ def test_threshold_near_one(fname, factory):
     vals = [fn(i / 100) for i in range(101)]
     for i in range(1, len(vals)):
         assert vals[i] >= vals[i - 1] - FP_TOL
+
+
+# ── v0.8: Kernel parameters ───────────────────────────────────────────────────
+
+@pytest.mark.parametrize("fname,factory,threshold", ALL_CASES)
+def test_kernel_params_match_closure(fname, factory, threshold):
+    """kernel_params published for the compiled loop agree with closure introspection."""
+    from gaia.simulation import _extract_damage_params
+
+    fn = factory(threshold=threshold)
+    kind = {"logistic": 0, "exponential": 1, "piecewise": 2}[fname]
+    assert fn.kernel_params[0] == kind
+    assert len(fn.kernel_params) == 5
+
+    # Closure introspection path must yield the same constants
+    del fn.kernel_params
+    assert _extract_damage_params(fn) == factory(threshold=threshold).kernel_params
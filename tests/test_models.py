@@ -5,9 +5,13 @@ Tests that the dataclasses can be created with valid parameters, that derived
 properties are correctly computed, and that fields have the expected types.
 """
 
+import sys
+
 import pytest
 from gaia.damage import logistic_damage
-from gaia.models import Agent, Ecosystem, InteractionEdge, Resource, SimulationStep
+from gaia.models import (
+    Agent, Ecosystem, InteractionEdge, InteractionType, Resource, SimulationStep,
+)
 
 
 # ── Resource ───────────────────────────────────────────────────────────────────
@@ -45,6 +49,16 @@ def test_resource_safe_threshold_units_floors_correctly():
     assert r.safe_threshold_units == 3_000
 
 
+def test_resource_safe_threshold_units_follows_field_changes():
+    """safe_threshold_units reflects total_units and ratio as they are now."""
+    r = Resource(name="F", total_units=1_000, safe_threshold_ratio=0.3, unit_value=0.0)
+    assert r.safe_threshold_units == 300
+    r.total_units = 2_000
+    assert r.safe_threshold_units == 600
+    r.safe_threshold_ratio = 0.5
+    assert r.safe_threshold_units == 1_000
+
+
 # ── Agent ──────────────────────────────────────────────────────────────────────
 
 def test_agent_creation():
@@ -153,6 +167,35 @@ def test_simulation_step_fields():
     assert len(step.agent_costs) == 2
 
 
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+def test_simulation_step_is_slotted():
+    """SimulationStep uses __slots__: no per-instance dict, no stray attributes."""
+    step = SimulationStep(
+        step=1, units_extracted=1, depletion_ratio=0.001,
+        agent_damages=[0.01], agent_costs=[100.0], marginal_cost=100.0,
+        cumulative_cost=100.0, private_revenue=1.0, ecosystem_health=0.99,
+    )
+    assert not hasattr(step, "__dict__")
+    with pytest.raises(AttributeError):
+        step.unknown_field = 1.0
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+def test_agent_is_slotted():
+    """Agent uses __slots__ but stays mutable and keeps dataclass equality."""
+    fn = logistic_damage(threshold=0.3)
+    agent = Agent(
+        name="A", dependency_weight=1.0, damage_function=fn,
+        monetary_rate=1_000.0, description="",
+    )
+    assert not hasattr(agent, "__dict__")
+    agent.monetary_rate = 2_000.0
+    assert agent == Agent(
+        name="A", dependency_weight=1.0, damage_function=fn,
+        monetary_rate=2_000.0, description="",
+    )
+
+
 # ── v0.3: InteractionEdge ─────────────────────────────────────────────────────
 
 def test_interaction_edge_creation():
@@ -170,6 +213,15 @@ def test_interaction_edge_creation():
     assert edge.interaction_type == "dependency"
 
 
+def test_interaction_edge_type_interned_and_coded():
+    """interaction_type is interned and maps to an InteractionType code."""
+    built = "".join(["tro", "phic"])
+    edge = InteractionEdge("A", "B", 0.3, built, "")
+    assert edge.interaction_type is sys.intern("trophic")
+    assert edge.type_code is InteractionType.TROPHIC
+    assert InteractionEdge("A", "B", 0.3, "unknown", "").type_code is None
+
+
 # ── v0.3: Agent trophic defaults ──────────────────────────────────────────────
 
 def test_agent_trophic_defaults():
@@ -226,6 +278,86 @@ def test_ecosystem_with_interactions():
     assert len(eco2.interactions) == 1
 
 
+def test_ecosystem_edge_index_frozen_once():
+    """name_to_idx and edge_index resolve names once and are reused."""
+    eco = _make_ecosystem(3)
+    eco.agents[2].is_keystone = True
+    eco2 = Ecosystem(
+        name="E", resource=eco.resource, agents=eco.agents,
+        interactions=[
+            InteractionEdge("Agent 2", "Agent 0", 0.3, "dependency", ""),
+            InteractionEdge("Agent 0", "Agent 1", 0.2, "trophic", ""),
+        ],
+    )
+    assert eco2.name_to_idx == {"Agent 0": 0, "Agent 1": 1, "Agent 2": 2}
+    assert eco2.edge_index == ([2, 0], [0, 1], [(2, [0])])
+    assert eco2.edge_index is eco2.edge_index
+
+
+def test_ecosystem_edge_strengths_frozen_once():
+    """edge_strengths lists interaction strengths in edge order, built once."""
+    eco = _make_ecosystem(3)
+    eco2 = Ecosystem(
+        name="E", resource=eco.resource, agents=eco.agents,
+        interactions=[
+            InteractionEdge("Agent 2", "Agent 0", 0.3, "dependency", ""),
+            InteractionEdge("Agent 0", "Agent 1", 0.2, "trophic", ""),
+        ],
+    )
+    assert eco2.edge_strengths == [0.3, 0.2]
+    assert eco2.edge_strengths is eco2.edge_strengths
+    assert eco.edge_strengths == []
+
+
+def test_ecosystem_has_keystones():
+    """has_keystones reflects whether any agent is a keystone."""
+    eco = _make_ecosystem(3)
+    assert eco.has_keystones is False
+    eco2 = _make_ecosystem(3)
+    eco2.agents[1].is_keystone = True
+    assert eco2.has_keystones is True
+
+
+def test_ecosystem_agent_columns():
+    """agent_columns holds one index-aligned list per agent field, built once."""
+    eco = _make_ecosystem(3)
+    columns = eco.agent_columns
+    assert columns is eco.agent_columns
+    assert columns.names == [a.name for a in eco.agents]
+    assert columns.dependency_weights == [a.dependency_weight for a in eco.agents]
+    assert columns.monetary_rates == [a.monetary_rate for a in eco.agents]
+    assert columns.damage_functions[2] is eco.agents[2].damage_function
+    assert columns.keystone_thresholds == [a.keystone_threshold for a in eco.agents]
+
+
+def test_ecosystem_derived_views_follow_replaced_or_resized_lists():
+    """Reassigning or resizing agents/interactions rebuilds the derived views."""
+    eco = _make_ecosystem(3)
+    columns = eco.agent_columns
+    assert eco.has_keystones is False
+    eco.damage_memo[0] = "stale"
+
+    eco.agents = _make_ecosystem(2).agents
+    assert eco.agent_columns is not columns
+    assert eco.name_to_idx == {"Agent 0": 0, "Agent 1": 1}
+    assert eco.damage_memo == {}
+
+    eco.interactions.append(InteractionEdge("Agent 1", "Agent 0", 0.4, "dependency", ""))
+    assert eco.edge_strengths == [0.4]
+    assert eco.edge_index[:2] == ([1], [0])
+
+
+def test_ecosystem_clear_derived_after_in_place_edit():
+    """In-place edits are picked up once clear_derived() is called."""
+    eco = _make_ecosystem(3)
+    assert eco.has_keystones is False
+    eco.agents[1].is_keystone = True
+    assert eco.has_keystones is False
+    eco.clear_derived()
+    assert eco.has_keystones is True
+    assert eco.agent_columns.is_keystone == [False, True, False]
+
+
 # ── v0.3: SimulationStep cascade fields ───────────────────────────────────────
 
 def test_simulation_step_cascade_defaults():
@@ -9,7 +9,14 @@ These verify the two new cascade mechanisms introduced in v0.3:
 """
 
 import pytest
-from gaia.propagation import compute_trophic_amplification, propagate_interactions
+from gaia.propagation import (
+    build_edge_csr,
+    build_edge_index,
+    compute_trophic_amplification,
+    propagate_interactions,
+    propagate_interactions_indexed,
+    trophic_amplification_factor,
+)
 
 
 # ── Trophic amplification ──────────────────────────────────────────────────────
@@ -79,6 +86,15 @@ def test_trophic_amplification_increases_with_level():
         )
 
 
+def test_amplification_factor_table_matches_formula():
+    """Table-driven factors equal the closed form; levels <= 0 give 1.0."""
+    for level in (-1, 0):
+        assert trophic_amplification_factor(level) == 1.0
+    for level in (1, 2, 3):
+        assert trophic_amplification_factor(level) == (1.0 / 0.15) ** (level * 0.25)
+        assert trophic_amplification_factor(level, 0.1) == (1.0 / 0.1) ** (level * 0.25)
+
+
 # ── Interaction propagation ────────────────────────────────────────────────────
 
 def _make_propagation_args(
@@ -305,3 +321,94 @@ def test_recovery_mode_reduces_cascade():
     # Recovery: B = 0.2 + 0.5 * 0.4 * 0.5 = 0.2 + 0.1 = 0.30
     assert eff_normal[1] == pytest.approx(0.40)
     assert eff_recovery[1] == pytest.approx(0.30)
+
+
+# ── v0.8: Index-based propagation ──────────────────────────────────────────────
+
+def test_build_edge_index_resolves_names_and_keystone_edges():
+    """Edges resolve to agent indices; keystone map lists outgoing edges only."""
+    src_idx, tgt_idx, keystone_edges = build_edge_index(
+        agent_names=["A", "B", "C"],
+        edge_sources=["A", "B", "A"],
+        edge_targets=["B", "C", "C"],
+        agent_is_keystone=[True, False, True],
+    )
+    assert src_idx == [0, 1, 0]
+    assert tgt_idx == [1, 2, 2]
+    assert keystone_edges == [(0, [0, 2]), (2, [])]
+
+
+def test_build_edge_csr_groups_out_edges_by_source():
+    """CSR rows list each agent's outgoing edges in ascending edge order."""
+    indptr, out_edges = build_edge_csr(4, [2, 0, 2, 1, 0])
+    assert indptr == [0, 2, 3, 5, 5]
+    assert out_edges == [1, 4, 3, 0, 2]
+    assert build_edge_csr(2, []) == ([0, 0, 0], [])
+
+
+def test_cascade_tracked_inline_under_cap():
+    """Cascade equals capped effective minus direct when several edges saturate."""
+    args = _make_propagation_args(
+        names=["A", "B", "C"],
+        damages=[0.9, 0.8, 0.6],
+        edges=[("A", "C", 0.3), ("B", "C", 0.5)],
+    )
+    effective, cascade, _ = propagate_interactions(**args)
+    assert effective[2] == 1.0
+    assert cascade[2] == pytest.approx(0.4)
+    assert cascade[:2] == [0.0, 0.0]
+
+
+def test_indexed_propagation_reuses_out_buffers():
+    """Provided out buffers are overwritten in place and returned as-is."""
+    src_idx, tgt_idx, keystone_edges = build_edge_index(
+        agent_names=["A", "B", "C"],
+        edge_sources=["A", "B"],
+        edge_targets=["B", "C"],
+        agent_is_keystone=[True, False, False],
+    )
+    kwargs = dict(
+        agent_names=["A", "B", "C"],
+        direct_damages=[0.9, 0.2, 0.1],
+        edge_src_idx=src_idx,
+        edge_tgt_idx=tgt_idx,
+        edge_strengths=[0.5, 0.5],
+        keystone_edges=keystone_edges,
+        agent_keystone_thresholds=[0.5, 0.0, 0.0],
+    )
+    expected = propagate_interactions_indexed(**kwargs)
+
+    out_effective, out_cascade, out_keystones = [9.0] * 3, [9.0] * 3, ["stale"]
+    result = propagate_interactions_indexed(
+        **kwargs,
+        out_effective=out_effective,
+        out_cascade=out_cascade,
+        out_keystones=out_keystones,
+    )
+    assert result[0] is out_effective
+    assert result[1] is out_cascade
+    assert result[2] is out_keystones
+    assert result == expected
+    assert out_keystones == ["A"]
+
+    # Buffers of the wrong length are resized, not written past their end
+    for size in (0, 1, 5):
+        result = propagate_interactions_indexed(
+            **kwargs,
+            out_effective=[9.0] * size,
+            out_cascade=[9.0] * size,
+            out_keystones=[],
+        )
+        assert result == expected
+
+
+def test_compiled_kernels_match_fallback_flags():
+    """compiled_kernels() agrees with the modules' own import fallbacks."""
+    import gaia.propagation
+    import gaia.simulation
+    from gaia.cy import KERNEL_MODULES, compiled_kernels
+
+    built = compiled_kernels()
+    assert set(built) <= set(KERNEL_MODULES)
+    assert gaia.propagation._HAS_CYTHON == ("propagation_cy" in built)
+    assert gaia.simulation._HAS_CYTHON == ("simulation_cy" in built)
@@ -12,7 +12,7 @@ Parametrized over all recovery function factories and multiple threshold values.
 
 import math
 import pytest
-from gaia.recovery import logistic_recovery, linear_recovery
+from gaia.recovery import group_shared_curves, logistic_recovery, linear_recovery
 from gaia.damage import logistic_damage
 
 # ── Test parameters ─────────────────────────────────────────────────────────────
@@ -27,6 +27,8 @@ BOUNDARY_TOL = 1e-4
 LOGISTIC_CASES = [
     ("logistic_recovery", logistic_recovery, {"threshold": t})
     for t in THRESHOLDS
+] + [
+    ("logistic_recovery_table", logistic_recovery, {"threshold": 0.3, "table_size": 1024}),
 ]
 
 LINEAR_CASES = [
@@ -208,3 +210,43 @@ def test_linear_recovery_accepts_slope_one():
     fn = linear_recovery(slope=1.0)
     assert abs(fn(0.5) - 0.5) < 1e-9
     assert abs(fn(1.0) - 1.0) < 1e-9
+
+
+# ── v0.8: Tabulated logistic recovery ───────────────────────────────────────────
+
+def test_logistic_recovery_table_tracks_exact_curve():
+    """Interpolated table stays within 1e-6 of the exact formula, exact at ends."""
+    exact = logistic_recovery(threshold=0.3)
+    table = logistic_recovery(threshold=0.3, table_size=1024)
+    assert table(0.0) == 0.0
+    assert table(1.0) == 1.0
+    for i in range(N_POINTS + 1):
+        x = i / N_POINTS
+        assert abs(table(x) - exact(x)) < 1e-6
+
+
+def test_logistic_recovery_rejects_negative_table_size():
+    """A negative table size is meaningless."""
+    with pytest.raises(ValueError, match="table_size"):
+        logistic_recovery(threshold=0.3, table_size=-1)
+
+
+# ── v0.8: Shared curve grouping ─────────────────────────────────────────────────
+
+def test_group_shared_curves_merges_equal_factory_params():
+    """Equal factory parameters group together; custom functions stay separate."""
+    custom = lambda x: x  # noqa: E731
+    fns = [
+        logistic_recovery(threshold=0.3),
+        linear_recovery(slope=0.8),
+        logistic_recovery(threshold=0.3),
+        logistic_recovery(threshold=0.3, steepness=5.0),
+        custom,
+        custom,
+        logistic_recovery(threshold=0.3, table_size=64),
+    ]
+    groups = group_shared_curves(fns)
+    assert [members for _, members in groups] == [[0, 2], [1], [3], [4, 5], [6]]
+    for fn, members in groups:
+        for i in members:
+            assert fn(0.55) == fns[i](0.55)
@@ -8,7 +8,11 @@ warning, and confidence band calculation.
 import pytest
 
 from gaia.models import ResilienceConfig
-from gaia.resilience import compute_confidence_band, compute_resilience_zone
+from gaia.resilience import (
+    compute_confidence_band,
+    compute_resilience_zone,
+    compute_resilience_zone_batch,
+)
 
 
 # ── Test fixtures ──────────────────────────────────────────────────────────────
@@ -121,6 +125,29 @@ class TestWiderWarningZone:
         assert zone_f == "green"
 
 
+# ── Tests: batch zone computation (v0.8) ──────────────────────────────────────
+
+
+class TestComputeResilienceZoneBatch:
+    """Tests for compute_resilience_zone_batch."""
+
+    def test_batch_matches_scalar(self):
+        """Every batch entry equals the per-sample scalar result exactly."""
+        remaining = [1.0 - s / 200 for s in range(1, 201)] + [0.80, 0.70, 0.0]
+        for config in (_CONFIG, ResilienceConfig(warning_zone_width=0.0)):
+            for threshold in (_THRESHOLD, 0.0, 1.0):
+                zones, confidences, warnings = compute_resilience_zone_batch(
+                    remaining, threshold, config
+                )
+                assert list(zip(zones, confidences, warnings)) == [
+                    compute_resilience_zone(r, threshold, config) for r in remaining
+                ]
+
+    def test_batch_empty(self):
+        """An empty trajectory yields three empty lists."""
+        assert compute_resilience_zone_batch([], _THRESHOLD, _CONFIG) == ([], [], [])
+
+
 # ── Tests: confidence band ────────────────────────────────────────────────────
 
 
@@ -12,7 +12,7 @@ These tests verify the run_restoration() engine and the core economic claim of v
 
 import pytest
 from gaia.cases.forest import build_forest_ecosystem
-from gaia.models import RestorationCost
+from gaia.models import RestorationCost, RestorationTrace
 from gaia.recovery import logistic_recovery, linear_recovery
 from gaia.simulation import run_restoration
 
@@ -70,6 +70,14 @@ def test_restoration_cost_no_maintenance():
     assert cost.total_cost_per_unit == 80.0
 
 
+def test_restoration_cost_total_per_unit_follows_field_changes():
+    """total_cost_per_unit reflects the cost fields as they are now."""
+    cost = RestorationCost(50.0, 10.0, 10)
+    assert cost.total_cost_per_unit == 150.0
+    cost.maintenance_years = 20
+    assert cost.total_cost_per_unit == 250.0
+
+
 # ── Basic engine correctness ─────────────────────────────────────────────────────
 
 def test_restoration_step_count():
@@ -329,3 +337,43 @@ def test_logistic_recovery_slower_than_linear():
         f"Logistic recovery at 30% progress ({logistic_at_30:.2f}) should recover "
         f"less than linear at 30% ({linear_at_30:.2f}) — entropy asymmetry"
     )
+
+
+# ── v0.8: Columnar RestorationTrace ─────────────────────────────────────────────
+
+def test_restoration_trace_rows_match_columns():
+    """RestorationTrace rows are built on access from the step columns."""
+    eco = _make_ecosystem()
+    result = run_restoration(eco, 200, RESTORATION_COST, _make_recovery_fns(eco))
+    trace = result.steps
+    assert isinstance(trace, RestorationTrace)
+    assert len(trace) == 200
+    last = trace[-1]
+    assert last.step == 200 and last.units_restored == 200
+    assert last.cumulative_service_value == result.total_recovered_value
+    assert [s.step for s in trace[:3]] == [1, 2, 3]
+    with pytest.raises(IndexError):
+        trace[200]
+    assert list(trace) == [trace[i] for i in range(len(trace))]
+
+
+def test_compiled_restoration_matches_python_loop(monkeypatch):
+    """The compiled loop gives the same steps as the pure-Python loop."""
+    import gaia.simulation as simulation
+
+    if not simulation._HAS_CYTHON:
+        pytest.skip("Cython extension not built")
+    eco = _make_ecosystem()
+    fns = [
+        logistic_recovery(THRESHOLD) if i % 2 else linear_recovery(0.8)
+        for i in range(len(eco.agents))
+    ]
+    # Tabulated curves publish no kernel_params and stay in Python
+    assert not simulation._can_use_cython_restoration(
+        fns + [logistic_recovery(THRESHOLD, table_size=64)]
+    )
+    compiled = run_restoration(eco, 500, RESTORATION_COST, fns)
+    monkeypatch.setattr(simulation, "_HAS_CYTHON", False)
+    python = run_restoration(eco, 500, RESTORATION_COST, fns)
+    assert list(compiled.steps) == list(python.steps)
+    assert compiled.final_ecosystem_health == python.final_ecosystem_health
@@ -9,7 +9,9 @@ and mathematical invariants defined in the spec. They use simple ecosystems
 import math
 import pytest
 from gaia.damage import logistic_damage, piecewise_damage
-from gaia.models import Agent, Ecosystem, InteractionEdge, Resource, SimulationResult
+from gaia.models import (
+    Agent, Ecosystem, InteractionEdge, Resource, SimulationResult, SimulationTrace,
+)
 from gaia.simulation import run_extraction
 
 
@@ -490,3 +492,277 @@ def test_effective_damage_geq_direct_damage():
                 f"Step {step.step}, agent {i}: effective ({step.agent_damages[i]:.6f}) "
                 f"< direct ({step.agent_direct_damages[i]:.6f})"
             )
+
+
+# ── v0.8: Columnar SimulationTrace ─────────────────────────────────────────────
+
+def test_trace_rows_match_columns():
+    """SimulationTrace rows are built on access from the step columns."""
+    eco = _make_simple_ecosystem(total_units=100)
+    result = run_extraction(eco, 40)
+    trace = result.steps
+    assert isinstance(trace, SimulationTrace)
+    assert len(trace) == 40
+    last = trace[-1]
+    assert last.step == 40 and last.units_extracted == 40
+    assert last.cumulative_cost == trace.cumulative_cost[39]
+    assert last.agent_prices == []
+    assert [s.step for s in trace[10:13]] == [11, 12, 13]
+    assert [s.step for s in trace] == list(range(1, 41))
+    with pytest.raises(IndexError):
+        trace[40]
+
+
+def test_trace_empty_for_zero_extraction():
+    """Zero extraction yields an empty trace."""
+    result = run_extraction(_make_simple_ecosystem(), 0)
+    assert len(result.steps) == 0
+    assert list(result.steps) == []
+
+
+def test_trace_scalar_columns_are_typed_buffers():
+    """Scalar trace columns are array('d') / array('q'); rows still read plain numbers."""
+    from array import array
+
+    trace = run_extraction(_make_simple_ecosystem(total_units=100), 40).steps
+    assert isinstance(trace.cumulative_cost, array)
+    assert trace.marginal_cost.typecode == "d"
+    assert trace.effective_k.typecode == "q"
+    last = trace[-1]
+    assert type(last.depletion_ratio) is float
+    assert type(last.effective_k) is int
+    assert last.marginal_cost == trace.cumulative_cost[39] - trace.cumulative_cost[38]
+
+
+def test_trace_precision_float32_packs_agent_rows():
+    """float32 trace_precision stores per-agent rows as array('f'); totals unchanged."""
+    from array import array
+
+    exact = run_extraction(_make_simple_ecosystem(total_units=100), 60)
+    eco = _make_simple_ecosystem(total_units=100)
+    eco.trace_precision = "float32"
+    packed = run_extraction(eco, 60)
+
+    assert packed.total_externality_cost == exact.total_externality_cost
+    last = packed.steps[-1]
+    assert isinstance(last.agent_damages, array)
+    assert last.agent_damages.typecode == "f"
+    assert list(last.agent_costs) == pytest.approx(
+        exact.steps[-1].agent_costs, rel=1e-6
+    )
+
+
+def test_trace_precision_rejects_unknown_value():
+    """Unknown trace_precision values are rejected by validation."""
+    eco = _make_simple_ecosystem()
+    eco.trace_precision = "float16"
+    with pytest.raises(ValueError, match="trace_precision"):
+        run_extraction(eco, 10)
+
+
+def test_trace_precision_float64_is_lossless():
+    """float64 trace_precision packs rows into array('d') with identical values."""
+    exact = run_extraction(_make_simple_ecosystem(total_units=100), 60)
+    eco = _make_simple_ecosystem(total_units=100)
+    eco.trace_precision = "float64"
+    packed = run_extraction(eco, 60)
+
+    for a, b in zip(packed.steps, exact.steps):
+        assert a.agent_damages.typecode == "d"
+        assert list(a.agent_damages) == b.agent_damages
+        assert sum(a.agent_costs) == sum(b.agent_costs)
+
+
+def test_cascade_breakdown_kept_for_final_step_only():
+    """persist_cascade_breakdown=False drops per-step breakdown but not the final one."""
+    from gaia.report import format_report
+
+    full = run_extraction(_make_simple_ecosystem(total_units=100), 50)
+    eco = _make_simple_ecosystem(total_units=100)
+    eco.persist_cascade_breakdown = False
+    lean = run_extraction(eco, 50)
+
+    assert lean.steps[0].agent_direct_damages == []
+    assert lean.steps[0].agent_cascade_damages == []
+    assert lean.steps[0].agent_damages == full.steps[0].agent_damages
+    assert lean.steps[-1].agent_direct_damages == full.steps[-1].agent_direct_damages
+    assert format_report(lean) == format_report(full)
+    # Iteration builds the same views as indexing, including the defaults
+    assert list(lean.steps) == [lean.steps[i] for i in range(50)]
+
+
+def test_format_report_reflects_result_changes():
+    """format_report() renders the result as it is now, on every call."""
+    from gaia.report import format_report
+
+    result = run_extraction(_make_simple_ecosystem(total_units=100), 50)
+    first = format_report(result)
+    assert format_report(result) == first
+    result.ecosystem.resource.name = "Renamed Resource"
+    assert "Renamed Resource" in format_report(result)
+
+
+def test_format_report_v01_path_matches_full_formatter():
+    """The v0.1 fast path renders exactly what the full formatter would."""
+    from gaia.report import _format_report_v04, format_report
+
+    result = run_extraction(_make_simple_ecosystem(total_units=100), 50)
+    assert format_report(result) == _format_report_v04(result, result.steps[-1])
+
+
+def test_direct_rows_match_per_step_evaluation_across_blocks(monkeypatch):
+    """Column-wise Phase 1 rows equal per-step calls, across block boundaries."""
+    import gaia.simulation as simulation
+    from gaia.recovery import group_shared_curves
+
+    monkeypatch.setattr(simulation, "_PHASE1_BLOCK", 3)
+    fns = [logistic_damage(threshold=0.3), piecewise_damage(threshold=0.3)]
+    rows = list(simulation._iter_direct_rows(
+        group_shared_curves(fns), [None, 1.5], 10, 10,
+    ))
+
+    assert len(rows) == 10
+    for step, row in enumerate(rows, start=1):
+        ratio = step / 10
+        assert row == [fns[0](ratio), min(fns[1](ratio) * 1.5, 1.0)]
+
+
+def test_step_costs_kernel():
+    """_step_costs returns per-agent values, their total and the weighted sum."""
+    from gaia.simulation import _step_costs
+
+    values, total, weighted = _step_costs([0.5, 0.25], [0.6, 0.4], [100.0, 10.0])
+    assert values == [0.5 * 0.6 * 100.0, 0.25 * 0.4 * 10.0]
+    assert total == values[0] + values[1]
+    assert weighted == 0.6 * 0.5 + 0.4 * 0.25
+
+
+def test_damage_memo_reused_and_extended_across_runs(monkeypatch):
+    """Repeated pure-Python runs reuse and extend the memoized damage columns."""
+    import gaia.simulation as simulation
+
+    monkeypatch.setattr(simulation, "_HAS_CYTHON", False)
+    fresh = run_extraction(_make_simple_ecosystem(total_units=100), 70)
+
+    eco = _make_simple_ecosystem(total_units=100)
+    short = run_extraction(eco, 30)
+    assert len(eco.damage_memo[100, False][0]) == 30
+    longer = run_extraction(eco, 70)
+    assert len(eco.damage_memo[100, False][0]) == 70
+    again = run_extraction(eco, 20)
+
+    assert [s.agent_damages for s in longer.steps] == [
+        s.agent_damages for s in fresh.steps
+    ]
+    assert longer.total_externality_cost == fresh.total_externality_cost
+    assert short.steps[-1].agent_damages == fresh.steps[29].agent_damages
+    assert again.steps[-1].agent_damages == fresh.steps[19].agent_damages
+    assert again.steps[-1].agent_damages is not longer.steps[19].agent_damages
+
+
+def test_damage_memo_packed_with_trace_precision(monkeypatch):
+    """With trace_precision the memo holds array('d') columns; results unchanged."""
+    from array import array
+    import gaia.simulation as simulation
+
+    monkeypatch.setattr(simulation, "_HAS_CYTHON", False)
+    exact = run_extraction(_make_simple_ecosystem(total_units=100), 60)
+    eco = _make_simple_ecosystem(total_units=100)
+    eco.trace_precision = "float64"
+    run_extraction(eco, 20)
+    packed = run_extraction(eco, 60)
+
+    columns = eco.damage_memo[100, True]
+    assert all(isinstance(column, array) for column in columns)
+    assert len(columns[0]) == 60
+    # Both agents share one curve, hence one memoized column
+    assert columns[0] is columns[1]
+    assert packed.total_externality_cost == exact.total_externality_cost
+
+
+def test_run_extraction_batch_matches_serial_runs():
+    """Batch results equal individual runs, in job order, in worker processes."""
+    from gaia.simulation import run_extraction_batch
+
+    jobs = [(_make_simple_ecosystem(total_units=100), n) for n in (10, 40, 70)]
+    batch = run_extraction_batch(jobs, max_workers=2)
+    for (eco, n), result in zip(jobs, batch):
+        serial = run_extraction(eco, n)
+        assert result.ecosystem is eco
+        assert result.total_units_extracted == n
+        assert result.total_externality_cost == serial.total_externality_cost
+        assert list(result.steps) == list(serial.steps)
+    with pytest.raises(ValueError, match="max_workers"):
+        run_extraction_batch(jobs, max_workers=0)
+
+
+def test_run_extraction_batch_concurrent_calls_do_not_interfere():
+    """Batches started from two threads at once each get their own jobs."""
+    from concurrent.futures import ThreadPoolExecutor
+    from gaia.simulation import run_extraction_batch
+
+    batches = [
+        [(_make_simple_ecosystem(total_units=100), n) for n in (10, 40, 70)],
+        [(_make_simple_ecosystem(total_units=200, n_agents=3), n) for n in (150, 20)],
+    ]
+    with ThreadPoolExecutor(2) as threads:
+        outputs = list(threads.map(
+            lambda jobs: run_extraction_batch(jobs, max_workers=2), batches
+        ))
+    for jobs, results in zip(batches, outputs):
+        for (eco, n), result in zip(jobs, results):
+            assert result.ecosystem is eco
+            assert result.total_units_extracted == n
+            serial = run_extraction(eco, n)
+            assert result.total_externality_cost == serial.total_externality_cost
+
+
+def test_run_after_replacing_agents_uses_new_agents():
+    """Assigning a new agents list after a run re-projects the agent columns."""
+    eco = _make_simple_ecosystem(total_units=100)
+    run_extraction(eco, 40)
+    eco.agents = _make_simple_ecosystem(total_units=100, monetary_rate=1_000_000.0).agents
+    result = run_extraction(eco, 40)
+    fresh = run_extraction(
+        _make_simple_ecosystem(total_units=100, monetary_rate=1_000_000.0), 40
+    )
+    assert result.total_externality_cost == fresh.total_externality_cost
+
+
+def test_run_after_replacing_interactions_uses_new_edges():
+    """Replacing interactions or keystones after a run rebuilds edge indices."""
+    def with_edges(eco):
+        eco.agents[0].is_keystone = True
+        eco.interactions = [InteractionEdge("Agent 0", "Agent 1", 0.4, "dependency", "")]
+        return eco
+
+    eco = _make_simple_ecosystem(total_units=100)
+    run_extraction(eco, 60)
+    eco.agents = _make_simple_ecosystem(total_units=100).agents
+    result = run_extraction(with_edges(eco), 60)
+    fresh = run_extraction(with_edges(_make_simple_ecosystem(total_units=100)), 60)
+    assert eco.has_keystones is True
+    assert result.total_externality_cost == fresh.total_externality_cost
+    assert list(result.steps) == list(fresh.steps)
+
+
+def test_damage_memo_cleared_when_curves_change_and_bounded(monkeypatch):
+    """After clear_derived() a replaced curve is not reused; the memo is bounded."""
+    import gaia.simulation as simulation
+
+    monkeypatch.setattr(simulation, "_HAS_CYTHON", False)
+    eco = _make_simple_ecosystem(total_units=100)
+    run_extraction(eco, 50)
+    curve = piecewise_damage(threshold=0.3)
+    eco.agents[0].damage_function = curve
+    eco.clear_derived()
+    result = run_extraction(eco, 50)
+    fresh = _make_simple_ecosystem(total_units=100)
+    fresh.agents[0].damage_function = curve
+    assert result.total_externality_cost == run_extraction(fresh, 50).total_externality_cost
+
+    for total_units in (200, 300, 400):
+        eco.resource = _make_simple_ecosystem(total_units=total_units).resource
+        run_extraction(eco, 50)
+    assert len(eco.damage_memo) <= simulation._DAMAGE_MEMO_MAX_ENTRIES
+    assert (400, False) in eco.damage_memo
@@ -183,6 +183,37 @@ class TestFindYearsToThreshold:
         posidonia_50 = find_years_to_threshold(_POSIDONIA, 0.50)
         assert posidonia_50 > forest_50
 
+    def test_memoized_by_curve_values(self):
+        """Equal curves share the memoized scan; a changed curve rescans."""
+        curve = SuccessionCurve(
+            pioneer_end_year=5.0,
+            intermediate_end_year=20.0,
+            climax_approach_year=50.0,
+            pioneer_service=0.05,
+            intermediate_service=0.40,
+            maturation_delay=2.0,
+        )
+        year = find_years_to_threshold(curve, 0.50)
+        # First year on the 0.1-year scan grid whose service reaches 50%
+        assert succession_service(curve, year) >= 0.50
+        assert succession_service(curve, year - 0.1) < 0.50
+        curve.maturation_delay = 6.0
+        assert find_years_to_threshold(curve, 0.50) > year
+
+    def test_matches_linear_scan(self):
+        """The grid bisection returns the year the 0.1-year scan finds."""
+        for curve in (_FOREST, _POSIDONIA):
+            for fraction in (0.0, 0.001, 0.05, 0.25, 0.5, 0.9, 0.999, 1.0, 1.5):
+                max_year = curve.climax_approach_year + curve.maturation_delay + 10.0
+                expected = curve.climax_approach_year + curve.maturation_delay
+                year = 0.0
+                while year <= max_year:
+                    if succession_service(curve, year) >= fraction:
+                        expected = year
+                        break
+                    year += 0.1
+                assert find_years_to_threshold(curve, fraction) == expected
+
 
 # ── Tests: maturation timeline ─────────────────────────────────────────────────
 
@@ -211,6 +242,22 @@ class TestMaturationTimeline:
         tl = compute_maturation_timeline(_FOREST, 1000.0, 60, 100, None)
         assert tl[-1].cumulative_carbon_absorbed == 0.0
 
+    def test_steps_match_per_year_evaluation(self):
+        """Each step equals the per-year formulas with running sums."""
+        tl = compute_maturation_timeline(_CB, 1234.5, 90, 100, _CARBON)
+        cumulative_service = 0.0
+        cumulative_carbon = 0.0
+        for year, step in enumerate(tl, 1):
+            svc = succession_service(_CB, float(year))
+            cumulative_service += 1234.5 * svc
+            cumulative_carbon += 100 * _CARBON.annual_absorption_tonnes * svc
+            assert step.year == year
+            assert step.succession_phase == get_succession_phase(_CB, float(year))
+            assert step.service_fraction == svc
+            assert step.annual_service_value == 1234.5 * svc
+            assert step.cumulative_service_value == cumulative_service
+            assert step.cumulative_carbon_absorbed == cumulative_carbon
+
 
 # ── Tests: maturation gap ──────────────────────────────────────────────────────
 
@@ -136,6 +136,41 @@ def test_reject_empty_agents():
         validate_ecosystem(eco)
 
 
+def test_revalidation_after_appending_agents():
+    """Appending an agent in place changes the recorded size and re-validates."""
+    eco = _ecosystem([0.5, 0.5])
+    validate_ecosystem(eco)
+    eco.agents.append(_agent(0.5))
+    with pytest.raises(ValueError, match="sum"):
+        validate_ecosystem(eco)
+
+
+def test_revalidation_after_replacing_an_agent():
+    """Replacing an agent in place of another is caught on the next call."""
+    eco = _ecosystem([0.5, 0.5])
+    validate_ecosystem(eco)
+    eco.agents[0] = _agent(5.0)
+    with pytest.raises(ValueError, match="dependency_weight"):
+        validate_ecosystem(eco)
+
+
+def test_revalidation_after_mutating_agent_and_edge_fields():
+    """Fields mutated in place are re-checked on the next call."""
+    eco = _ecosystem([0.5, 0.5])
+    eco.agents[1].name = "Other"
+    eco.interactions = [InteractionEdge("Agent", "Other", 0.3, "dependency", "")]
+    validate_ecosystem(eco)
+
+    eco.interactions[0].strength = 1.5
+    with pytest.raises(ValueError, match="strength"):
+        validate_ecosystem(eco)
+    eco.interactions[0].strength = 0.3
+
+    eco.agents[1].monetary_rate = -1.0
+    with pytest.raises(ValueError, match="monetary_rate"):
+        validate_ecosystem(eco)
+
+
 # ── Extraction validation ──────────────────────────────────────────────────────
 
 def test_valid_extraction_passes():
@@ -205,6 +240,31 @@ def test_reject_damage_function_wrong_at_zero():
         validate_damage_function(starts_at_half, name="starts_at_half")
 
 
+def test_certified_damage_function_not_sampled():
+    """A factory curve with in-range kernel_params is accepted without calls."""
+    base = logistic_damage(threshold=0.3)
+    calls = []
+
+    def counted(x: float) -> float:
+        calls.append(x)
+        return base(x)
+
+    counted.kernel_params = base.kernel_params
+    validate_damage_function(counted)
+    assert calls == []
+
+
+def test_uncertified_factory_curve_still_sampled():
+    """Out-of-range factory parameters fall back to the sampled checks."""
+    from gaia.damage import piecewise_damage
+    from gaia.recovery import linear_recovery
+
+    with pytest.raises(ValueError, match="1.0"):
+        validate_damage_function(piecewise_damage(threshold=1.5))
+    with pytest.raises(ValueError, match="1.0"):
+        validate_damage_function(linear_recovery(0.8))
+
+
 # ── v0.3: Trophic level validation ───────────────────────────────────────────
 
 def test_reject_invalid_trophic_level():